@@ -1,16 +1,36 @@
 # app.py
 
-from flask import Flask, request, jsonify, session, send_from_directory
+from flask import (
+    Flask, Request, Response, request, jsonify, session, send_file, send_from_directory,
+    stream_with_context
+)
 from flask_cors import CORS
 from app_config import Config
 from backend.database import Database
-from backend.auth import AuthManager
-from backend.validation import Validator
+from backend.async_database import async_db
+from backend.auth import (
+    AuthManager, LOGIN_QUERY, hashing_pool, session_cache, activity_buffer, attempt_logger,
+    lockout_tracker, retention_sweeper
+)
+from backend.hashing import HashingPoolFull
+from backend.uniqueness import uniqueness_index, duplicate_message
+from backend.photos import photo_store, read_limited, InvalidPhoto, FORM_OVERHEAD_BYTES
+from backend.assets import StaticAssets
+from backend.migrations import MigrationRunner, MigrationError, check_query_plans
+from backend.metrics import metrics, http_request_seconds
+from backend.profiler import query_profiler
+from backend.validation import Validator, domain_checker
+from backend.pagination import encode_cursor, decode_cursor, parse_limit
+from backend.user_import import UserImporter, ImportFileError, read_rows
+from backend.inventory import InventoryManager, prefix_pattern
 import os
+import json
+import time
 import logging
-from werkzeug.utils import secure_filename
-from datetime import datetime
-from PIL import Image
+import urllib.request
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlencode
+import click
 
 # Setup logging
 logging.basicConfig(
@@ -30,31 +50,149 @@ CORS(app)
 # Initialize configuration
 Config.init_app(app)
 
+# Fingerprinted, precompressed frontend css/js, built by `flask build-assets`
+static_assets = StaticAssets(
+    os.path.join(app.root_path, 'frontend'),
+    os.path.join(app.root_path, Config.ASSET_BUILD_FOLDER)
+)
+if Config.ASSET_PIPELINE and not static_assets.load():
+    logger.warning("No asset build found; serving frontend/ as is (run `flask build-assets`)")
+
+def start_background_tasks():
+    """
+    Start the threads a serving process needs (not CLI commands)
+    
+    Called by the entry points: `python app.py`, wsgi.py and the ASGI
+    lifespan in asgi.py.
+    """
+    # Prune expired sessions and old login attempts in the background
+    if Config.RETENTION_SWEEP_INTERVAL > 0:
+        retention_sweeper.start()
+
+@app.teardown_appcontext
+def release_db_connection(exception):
+    """Return the request's pinned database connection to the pool"""
+    Database.release_request_connection()
+
+# Gauges are read from the components' counters when /metrics is scraped
+metrics.gauge('db_pool_connections_in_use', 'Pooled connections checked out',
+              lambda: Database.pool_stats().get('in_use'))
+metrics.gauge('db_pool_waiters', 'Threads waiting for a pooled connection',
+              lambda: Database.pool_stats().get('waiters'))
+metrics.gauge('hashing_queue_depth', 'Argon2 jobs waiting for a worker',
+              lambda: hashing_pool.stats()['queue_depth'])
+metrics.gauge('login_attempt_queue_depth', 'Login attempts waiting to be written',
+              lambda: attempt_logger.stats()['queue_depth'])
+
+class TimedRequest(Request):
+    """Request that notes when it was created, for the latency histogram"""
+    
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.started = time.perf_counter()
+
+if Config.METRICS_ENABLED:
+    app.request_class = TimedRequest
+    
+    @app.after_request
+    def record_request_time(response):
+        """Observe request latency by route template (not raw path)"""
+        # One proxy lookup; attribute access through `request` costs ~1us each
+        current = request._get_current_object()
+        rule = current.url_rule
+        http_request_seconds.observe(
+            time.perf_counter() - current.started,
+            current.method,
+            rule.rule if rule is not None else 'unmatched',
+            str(response.status_code)
+        )
+        return response
+
 # ============================================
 # STATIC FILES ROUTES
 # ============================================
 
+def send_asset(path):
+    """
+    Send a built frontend file, precompressed if the client accepts it
+    
+    Returns:
+        Response: The file, or None if path was not built
+    """
+    asset = static_assets.lookup(path, request.headers.get('Accept-Encoding', ''))
+    if asset is None:
+        return None
+    
+    response = send_file(asset['file'], mimetype=asset['mimetype'], conditional=True,
+                         etag=asset['etag'], max_age=31536000 if asset['immutable'] else None)
+    if asset['encoding']:
+        response.headers['Content-Encoding'] = asset['encoding']
+    response.vary.add('Accept-Encoding')
+    
+    if asset['immutable']:
+        response.cache_control.public = True
+        response.cache_control.immutable = True
+    else:
+        # Pages keep their URLs: revalidate with the ETag every time
+        response.cache_control.no_cache = True
+    return response
+
 @app.route('/')
 def index():
     """Serve the login page"""
-    return send_from_directory('frontend/pages', 'login.html')
+    return send_asset('pages/login.html') or send_from_directory('frontend/pages', 'login.html')
 
 @app.route('/frontend/<path:path>')
 def serve_frontend(path):
     """Serve frontend files"""
-    return send_from_directory('frontend', path)
+    return send_asset(path) or send_from_directory('frontend', path)
+
+@app.route('/photos/<name>')
+def serve_photo(name):
+    """Serve a profile photo; content-addressed names are cached forever"""
+    path, immutable = photo_store.file_path(name)
+    if path is None:
+        return jsonify({
+            'success': False,
+            'message': 'Photo not found'
+        }), 404
+    
+    if not immutable:
+        # Legacy {username}_{timestamp}.jpg files: revalidate every time
+        response = send_file(path, mimetype='image/jpeg', conditional=True)
+        response.cache_control.no_cache = True
+        return response
+    
+    response = send_file(path, mimetype='image/jpeg', conditional=True,
+                         etag=name.rsplit('.', 1)[0], max_age=31536000)
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
 
 # ============================================
 # AUTHENTICATION ROUTES
 # ============================================
 
+def json_body():
+    """The request's JSON body if it is an object, else None"""
+    data = request.get_json(silent=True)
+    return data if isinstance(data, dict) else None
+
+def not_a_json_object():
+    return jsonify({
+        'success': False,
+        'message': 'Request body must be a JSON object'
+    }), 400
+
 @app.route('/api/login', methods=['POST'])
 def login():
     """Handle user login"""
     try:
-        data = request.get_json()
-        username = data.get('username', '').strip()
-        password = data.get('password', '')
+        data = json_body()
+        if data is None:
+            return not_a_json_object()
+        username = str(data.get('username') or '').strip()
+        password = str(data.get('password') or '')
         remember_me = data.get('rememberMe', False)
         
         # Validate input
@@ -73,12 +211,7 @@ def login():
             }), 403
         
         # Query user
-        query = """
-            SELECT user_id, username, password_hash, full_name, role, status
-            FROM users
-            WHERE username = %s
-        """
-        users = Database.execute_query(query, (username,), fetch=True)
+        users = Database.execute_query(LOGIN_QUERY, (username,), fetch=True)
         
         if not users:
             # Log failed attempt
@@ -116,25 +249,17 @@ def login():
             }), 401
         
         # Rehash password if needed (security best practice)
-        if needs_rehash:
-            new_hash = AuthManager.hash_password(password)
-            update_query = "UPDATE users SET password_hash = %s WHERE user_id = %s"
-            Database.execute_query(update_query, (new_hash, user['user_id']))
+        new_hash = AuthManager.hash_password(password) if needs_rehash else None
         
-        # Create session
-        session_id = AuthManager.create_session(
+        # Create session (its trigger sets last login; a new hash joins the same
+        # transaction) and cache it for the first validate-session
+        session_id = AuthManager.complete_login(
             user['user_id'],
             request.remote_addr,
-            request.headers.get('User-Agent', '')
+            request.headers.get('User-Agent', ''),
+            new_hash
         )
-        
-        # Update last login
-        update_login = """
-            UPDATE users 
-            SET last_login = NOW(), failed_login_attempts = 0
-            WHERE user_id = %s
-        """
-        Database.execute_query(update_login, (user['user_id'],))
+        AuthManager.prime_session(session_id, user)
         
         # Log successful attempt
         AuthManager.log_login_attempt(username, True, request.remote_addr)
@@ -151,6 +276,8 @@ def login():
             'role': user['role']
         }), 200
         
+    except HashingPoolFull:
+        raise
     except Exception as e:
         logger.error(f"Login error: {e}")
         return jsonify({
@@ -162,7 +289,9 @@ def login():
 def logout():
     """Handle user logout"""
     try:
-        data = request.get_json()
+        data = json_body()
+        if data is None:
+            return not_a_json_object()
         session_id = data.get('session_id')
         
         if session_id:
@@ -184,7 +313,9 @@ def logout():
 def validate_session():
     """Validate user session"""
     try:
-        data = request.get_json()
+        data = json_body()
+        if data is None:
+            return not_a_json_object()
         session_id = data.get('session_id')
         
         if not session_id:
@@ -222,6 +353,13 @@ def validate_session():
 def register_user():
     """Register new user"""
     try:
+        # Refuse oversized bodies before the form is parsed and spooled
+        if (request.content_length or 0) > Config.MAX_FILE_SIZE + FORM_OVERHEAD_BYTES:
+            return jsonify({
+                'success': False,
+                'message': f"File size must not exceed {Config.MAX_FILE_SIZE / (1024 * 1024):g}MB"
+            }), 413
+        
         # Get form data
         full_name = request.form.get('fullName', '').strip()
         email = request.form.get('email', '').strip()
@@ -259,17 +397,8 @@ def register_user():
         if not valid:
             errors.append(message)
         
-        # Check if username already exists
-        check_username = "SELECT user_id FROM users WHERE username = %s"
-        existing_user = Database.execute_query(check_username, (username,), fetch=True)
-        if existing_user:
-            errors.append('Username already exists')
-        
-        # Check if email already exists
-        check_email = "SELECT user_id FROM users WHERE email = %s"
-        existing_email = Database.execute_query(check_email, (email,), fetch=True)
-        if existing_email:
-            errors.append('Email already registered')
+        # Check if username or email already exists
+        errors.extend(uniqueness_index.check(username, email))
         
         # Validate password
         valid, message = Validator.validate_password(password)
@@ -288,40 +417,34 @@ def register_user():
                 'message': '; '.join(errors)
             }), 400
         
+        # Generate user ID
+        user_id = AuthManager.generate_user_id(username, email)
+        
+        # Hash password (before the photo is stored, so a full hashing
+        # queue leaves no file behind)
+        password_hash = AuthManager.hash_password(password)
+        
         # Handle photo upload
         photo_path = None
         if 'photo' in request.files:
             photo = request.files['photo']
             if photo.filename:
-                # Validate file
-                valid, message = Validator.validate_file_upload(
-                    photo.filename,
-                    len(photo.read())
-                )
-                photo.seek(0)  # Reset file pointer
+                # Validate type; size is enforced while reading the stream
+                valid, message = Validator.validate_file_upload(photo.filename, 0)
+                if valid:
+                    try:
+                        photo_data = read_limited(photo.stream, Config.MAX_FILE_SIZE)
+                        
+                        # Stored by content hash; identical uploads share files
+                        photo_path = photo_store.save(photo_data)
+                    except InvalidPhoto as e:
+                        valid, message = False, str(e)
                 
                 if not valid:
                     return jsonify({
                         'success': False,
                         'message': message
                     }), 400
-                
-                # Save photo
-                filename = secure_filename(f"{username}_{datetime.now().strftime('%Y%m%d%H%M%S')}.jpg")
-                photo_path = os.path.join(Config.UPLOAD_FOLDER, filename)
-                
-                # Resize and save image
-                image = Image.open(photo)
-                image.thumbnail((300, 300))
-                image.save(photo_path, 'JPEG', quality=85)
-                
-                photo_path = f"uploads/profile_photos/{filename}"
-        
-        # Generate user ID
-        user_id = AuthManager.generate_user_id(username, email)
-        
-        # Hash password
-        password_hash = AuthManager.hash_password(password)
         
         # Insert user into database
         insert_query = """
@@ -331,10 +454,29 @@ def register_user():
             ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
         """
         
-        Database.execute_query(insert_query, (
-            user_id, username, password_hash, full_name, email, phone,
-            role, employment_date, status, photo_path
-        ))
+        try:
+            Database.execute_query(insert_query, (
+                user_id, username, password_hash, full_name, email, phone,
+                role, employment_date, status, photo_path
+            ))
+        except Exception as e:
+            # Nothing references the stored photo unless the row went in
+            if photo_path:
+                photo_store.unhold(photo_path)
+                photo_store.release(photo_path)
+            # Username or email taken between the check and the INSERT
+            message = duplicate_message(e) if isinstance(e, Database.driver().IntegrityError) else None
+            if not message:
+                raise
+            return jsonify({
+                'success': False,
+                'message': message
+            }), 400
+        
+        # The row references the photo now, so release() will count it
+        if photo_path:
+            photo_store.unhold(photo_path)
+        uniqueness_index.add(username, email)
         
         logger.info(f"New user registered: {username}")
         
@@ -344,6 +486,8 @@ def register_user():
             'user_id': user_id
         }), 201
         
+    except HashingPoolFull:
+        raise
     except Exception as e:
         logger.error(f"Registration error: {e}")
         return jsonify({
@@ -351,21 +495,116 @@ def register_user():
             'message': 'An error occurred during registration'
         }), 500
 
+def fetch_users_page(role=None, status=None, after=None, limit=50, search=None):
+    """
+    Fetch users newest first, starting after a (created_at, user_id) key
+    
+    Args:
+        role (str): Only users with this role, or None
+        status (str): Only users with this status, or None
+        after (list): [created_at, user_id] of the previous page's last row
+        limit (int): Maximum rows returned
+        search (str): Only users whose username, email or a word of their
+                      full name starts with this text, or None
+                      
+    Returns:
+        list: User rows
+    """
+    conditions = []
+    params = []
+    
+    if search:
+        pattern = prefix_pattern(search)
+        conditions.append("""(username LIKE %s ESCAPE '!' OR email LIKE %s ESCAPE '!'
+            OR full_name LIKE %s ESCAPE '!' OR full_name LIKE %s ESCAPE '!')""")
+        params.extend([pattern, pattern, pattern, '% ' + pattern])
+    if role:
+        conditions.append("role = %s")
+        params.append(role)
+    if status:
+        conditions.append("status = %s")
+        params.append(status)
+    if after:
+        conditions.append("(created_at < %s OR (created_at = %s AND user_id < %s))")
+        params.extend([after[0], after[0], after[1]])
+    
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    query = f"""
+        SELECT user_id, username, full_name, email, phone, role, status,
+               employment_date, created_at, last_login
+        FROM users
+        {where}
+        ORDER BY created_at DESC, user_id DESC
+        LIMIT %s
+    """
+    params.append(limit)
+    return Database.execute_query(query, tuple(params), fetch=True)
+
 @app.route('/api/users/list', methods=['GET'])
 def list_users():
-    """Get list of all users"""
+    """
+    Get a page of users, newest first
+    
+    Query parameters: limit, cursor (next_cursor of the previous page),
+    role, status, q (search text), and format=ndjson to stream every
+    matching user.
+    """
     try:
-        query = """
-            SELECT user_id, username, full_name, email, phone, role, status,
-                   employment_date, created_at, last_login
-            FROM users
-            ORDER BY created_at DESC
-        """
-        users = Database.execute_query(query, fetch=True)
+        role = request.args.get('role') or None
+        status = request.args.get('status') or None
+        search = request.args.get('q', '').strip() or None
+        
+        if role and role not in Validator.ROLES:
+            return jsonify({
+                'success': False,
+                'message': 'Invalid role filter'
+            }), 400
+        
+        if status and status not in Validator.STATUSES:
+            return jsonify({
+                'success': False,
+                'message': 'Invalid status filter'
+            }), 400
+        
+        try:
+            limit = parse_limit(request.args.get('limit'),
+                                Config.USER_LIST_PAGE_SIZE,
+                                Config.USER_LIST_MAX_PAGE_SIZE)
+            cursor = request.args.get('cursor')
+            after = decode_cursor(cursor, 2) if cursor else None
+        except ValueError:
+            return jsonify({
+                'success': False,
+                'message': 'Invalid pagination parameters'
+            }), 400
+        
+        # Streamed export: walk every page without building the full list
+        if request.args.get('format') == 'ndjson':
+            def generate():
+                last = after
+                while True:
+                    users = fetch_users_page(role, status, last, Config.DB_BATCH_SIZE, search)
+                    for user in users:
+                        yield app.json.dumps(user) + '\n'
+                    if len(users) < Config.DB_BATCH_SIZE:
+                        return
+                    last = [users[-1]['created_at'], users[-1]['user_id']]
+            
+            return Response(stream_with_context(generate()),
+                            mimetype='application/x-ndjson')
+        
+        users = fetch_users_page(role, status, after, limit + 1, search)
+        has_more = len(users) > limit
+        users = users[:limit]
+        next_cursor = None
+        if has_more:
+            next_cursor = encode_cursor(users[-1]['created_at'], users[-1]['user_id'])
         
         return jsonify({
             'success': True,
-            'users': users
+            'users': users,
+            'next_cursor': next_cursor,
+            'has_more': has_more
         }), 200
         
     except Exception as e:
@@ -379,9 +618,16 @@ def list_users():
 def delete_user(user_id):
     """Delete a user"""
     try:
-        # Check if user exists
-        check_query = "SELECT user_id, photo_path FROM users WHERE user_id = %s"
-        user = Database.execute_query(check_query, (user_id,), fetch=True)
+        # Check and delete in one transaction
+        check_query = ("SELECT user_id, username, email, photo_path FROM users WHERE user_id = %s"
+                       + Database.driver().for_update)
+        delete_query = "DELETE FROM users WHERE user_id = %s"
+        
+        with Database.transaction() as cursor:
+            cursor.execute(check_query, (user_id,))
+            user = cursor.fetchall()
+            if user:
+                cursor.execute(delete_query, (user_id,))
         
         if not user:
             return jsonify({
@@ -389,15 +635,12 @@ def delete_user(user_id):
                 'message': 'User not found'
             }), 404
         
-        # Delete photo if exists
+        # Delete photo once no other user shares it
         if user[0]['photo_path']:
-            photo_path = user[0]['photo_path']
-            if os.path.exists(photo_path):
-                os.remove(photo_path)
+            photo_store.release(user[0]['photo_path'])
         
-        # Delete user
-        delete_query = "DELETE FROM users WHERE user_id = %s"
-        Database.execute_query(delete_query, (user_id,))
+        AuthManager.invalidate_user_sessions(user_id)
+        uniqueness_index.discard(user[0]['username'], user[0]['email'])
         
         logger.info(f"User deleted: {user_id}")
         
@@ -413,6 +656,360 @@ def delete_user(user_id):
             'message': 'Error deleting user'
         }), 500
 
+@app.route('/api/users/import', methods=['POST'])
+def import_users():
+    """
+    Bulk-create users from an uploaded CSV or JSONL file
+    
+    Form fields: file, and optionally format ('csv' or 'jsonl') when the
+    file extension does not say. Returns per-row errors by row number.
+    """
+    try:
+        if 'file' not in request.files or not request.files['file'].filename:
+            return jsonify({
+                'success': False,
+                'message': 'Import file is required'
+            }), 400
+        
+        upload = request.files['file']
+        file_format = request.form.get('format')
+        if not file_format:
+            extension = upload.filename.rsplit('.', 1)[-1].lower()
+            file_format = 'jsonl' if extension in ('jsonl', 'ndjson') else extension
+        
+        report = UserImporter().run(read_rows(upload.stream, file_format))
+        
+        logger.info(f"User import: {report['imported']} imported, {report['failed']} failed")
+        
+        if report['file_error']:
+            # The rows before the unreadable line went in; say which
+            return jsonify({
+                'success': False,
+                'message': f"Import stopped: {report['file_error']}",
+                **report
+            }), 400
+        
+        return jsonify({
+            'success': True,
+            **report
+        }), 200
+        
+    except ImportFileError as e:
+        return jsonify({
+            'success': False,
+            'message': str(e)
+        }), 400
+    except HashingPoolFull:
+        raise
+    except Exception as e:
+        logger.error(f"Import error: {e}")
+        return jsonify({
+            'success': False,
+            'message': 'Error importing users'
+        }), 500
+
+# ============================================
+# INVENTORY ROUTES
+# ============================================
+
+def read_product(data):
+    """
+    Validate a product from the inventory form (JSON)
+    
+    Returns:
+        tuple: (product dict with database column names, list of errors)
+    """
+    if not isinstance(data, dict):
+        return {}, ['Request body must be a JSON object']
+    
+    errors = []
+    product = {
+        'name': str(data.get('name') or '').strip(),
+        'category': data.get('category'),
+        'description': str(data.get('description') or '').strip() or None
+    }
+    
+    valid, message = Validator.validate_product_name(product['name'])
+    if not valid:
+        errors.append(message)
+    
+    valid, message = Validator.validate_sku(str(data.get('sku') or '').strip())
+    if not valid:
+        errors.append(message)
+    else:
+        product['sku'] = message  # Use upper-cased SKU
+    
+    valid, message = Validator.validate_category(product['category'])
+    if not valid:
+        errors.append(message)
+    
+    for field, column, label in (('stock', 'stock', 'Stock'), ('minStock', 'min_stock', 'Minimum stock')):
+        valid, message = Validator.validate_quantity(data.get(field), label)
+        if not valid:
+            errors.append(message)
+        else:
+            product[column] = message
+    
+    valid, message = Validator.validate_price(data.get('price'))
+    if not valid:
+        errors.append(message)
+    else:
+        product['price'] = message
+    
+    return product, errors
+
+@app.route('/api/inventory/search', methods=['GET'])
+def search_inventory():
+    """
+    Get a page of products in name order
+    
+    Query parameters: q (every word must start a word of the name or SKU),
+    sku (SKU prefix), category, stock ('low' or 'critical'), limit and
+    cursor (next_cursor of the previous page).
+    """
+    try:
+        text = request.args.get('q', '').strip()
+        sku = request.args.get('sku', '').strip()
+        category = request.args.get('category') or None
+        stock = request.args.get('stock') or None
+        
+        if category and category not in Validator.CATEGORIES:
+            return jsonify({
+                'success': False,
+                'message': 'Invalid category filter'
+            }), 400
+        
+        if stock and stock not in Validator.STOCK_FILTERS:
+            return jsonify({
+                'success': False,
+                'message': 'Invalid stock filter'
+            }), 400
+        
+        try:
+            limit = parse_limit(request.args.get('limit'),
+                                Config.INVENTORY_PAGE_SIZE,
+                                Config.INVENTORY_MAX_PAGE_SIZE)
+            cursor = request.args.get('cursor')
+            after = decode_cursor(cursor, 2) if cursor else None
+        except ValueError:
+            return jsonify({
+                'success': False,
+                'message': 'Invalid pagination parameters'
+            }), 400
+        
+        products = InventoryManager.search(text, sku, category, stock, after, limit + 1)
+        has_more = len(products) > limit
+        products = products[:limit]
+        next_cursor = None
+        if has_more:
+            next_cursor = encode_cursor(products[-1]['name'], products[-1]['product_id'])
+        
+        return jsonify({
+            'success': True,
+            'products': products,
+            'next_cursor': next_cursor,
+            'has_more': has_more
+        }), 200
+        
+    except Exception as e:
+        logger.error(f"Error searching inventory: {e}")
+        return jsonify({
+            'success': False,
+            'message': 'Error searching inventory'
+        }), 500
+
+@app.route('/api/inventory/<int:product_id>', methods=['GET'])
+def get_product(product_id):
+    """Get one product"""
+    try:
+        product = InventoryManager.get(product_id)
+        if product is None:
+            return jsonify({
+                'success': False,
+                'message': 'Product not found'
+            }), 404
+        
+        return jsonify({
+            'success': True,
+            'product': product
+        }), 200
+        
+    except Exception as e:
+        logger.error(f"Error fetching product: {e}")
+        return jsonify({
+            'success': False,
+            'message': 'Error fetching product'
+        }), 500
+
+@app.route('/api/inventory/add', methods=['POST'])
+def add_product():
+    """Add a product"""
+    try:
+        product, errors = read_product(request.get_json(silent=True) or {})
+        if errors:
+            return jsonify({
+                'success': False,
+                'message': '; '.join(errors)
+            }), 400
+        
+        try:
+            product_id = InventoryManager.create(product)
+        except Database.driver().IntegrityError as e:
+            if not Database.driver().is_duplicate_key(e):
+                raise
+            return jsonify({
+                'success': False,
+                'message': 'SKU already exists'
+            }), 400
+        
+        return jsonify({
+            'success': True,
+            'message': 'Product added successfully',
+            'product': InventoryManager.get(product_id)
+        }), 201
+        
+    except Exception as e:
+        logger.error(f"Error adding product: {e}")
+        return jsonify({
+            'success': False,
+            'message': 'Error adding product'
+        }), 500
+
+@app.route('/api/inventory/update/<int:product_id>', methods=['PUT'])
+def update_product(product_id):
+    """Replace a product's details"""
+    try:
+        product, errors = read_product(request.get_json(silent=True) or {})
+        if errors:
+            return jsonify({
+                'success': False,
+                'message': '; '.join(errors)
+            }), 400
+        
+        try:
+            found = InventoryManager.update(product_id, product)
+        except Database.driver().IntegrityError as e:
+            if not Database.driver().is_duplicate_key(e):
+                raise
+            return jsonify({
+                'success': False,
+                'message': 'SKU already exists'
+            }), 400
+        
+        if not found:
+            return jsonify({
+                'success': False,
+                'message': 'Product not found'
+            }), 404
+        
+        return jsonify({
+            'success': True,
+            'message': 'Product updated successfully',
+            'product': InventoryManager.get(product_id)
+        }), 200
+        
+    except Exception as e:
+        logger.error(f"Error updating product: {e}")
+        return jsonify({
+            'success': False,
+            'message': 'Error updating product'
+        }), 500
+
+@app.route('/api/inventory/delete/<int:product_id>', methods=['DELETE'])
+def delete_product(product_id):
+    """Delete a product"""
+    try:
+        if not InventoryManager.delete(product_id):
+            return jsonify({
+                'success': False,
+                'message': 'Product not found'
+            }), 404
+        
+        return jsonify({
+            'success': True,
+            'message': 'Product deleted successfully'
+        }), 200
+        
+    except Exception as e:
+        logger.error(f"Error deleting product: {e}")
+        return jsonify({
+            'success': False,
+            'message': 'Error deleting product'
+        }), 500
+
+# ============================================
+# MONITORING ROUTES
+# ============================================
+
+@app.route('/api/stats')
+def stats():
+    """Report runtime counters used for capacity sizing"""
+    return jsonify({
+        'success': True,
+        'hashing': hashing_pool.stats(),
+        'session_cache': session_cache.stats(),
+        'session_activity': activity_buffer.stats(),
+        'login_attempts': attempt_logger.stats(),
+        'lockout': lockout_tracker.stats(),
+        'retention': retention_sweeper.stats(),
+        'email_domains': domain_checker.stats(),
+        'uniqueness': uniqueness_index.stats(),
+        'photos': photo_store.stats(),
+        'db_pool': Database.pool_stats(),
+        'async_db': async_db.stats(),
+        'query_profiler': query_profiler.stats()
+    })
+
+@app.route('/metrics')
+def prometheus_metrics():
+    """Request, query, pool and hashing timings in Prometheus text format"""
+    if not Config.METRICS_ENABLED:
+        return jsonify({
+            'success': False,
+            'message': 'Resource not found'
+        }), 404
+    return Response(metrics.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+@app.route('/api/query-profile')
+def query_profile():
+    """Top statements by time (Config.QUERY_PROFILING); ?top=&order=&explain=1"""
+    if not query_profiler.enabled:
+        return jsonify({
+            'success': False,
+            'message': 'Query profiling is disabled (QUERY_PROFILING=True to enable)'
+        }), 404
+    
+    order = request.args.get('order', 'total')
+    if order not in ('total', 'max', 'mean', 'calls'):
+        return jsonify({
+            'success': False,
+            'message': 'order must be one of total, max, mean, calls'
+        }), 400
+    
+    try:
+        top = max(1, min(int(request.args.get('top', 10)), 100))
+    except ValueError:
+        return jsonify({
+            'success': False,
+            'message': 'top must be a number'
+        }), 400
+    
+    explain = Database.explain if request.args.get('explain') == '1' else None
+    return jsonify({
+        'success': True,
+        'profiler': query_profiler.stats(),
+        'statements': query_profiler.report(top, order, explain)
+    })
+
+@app.route('/api/query-profile/reset', methods=['POST'])
+def reset_query_profile():
+    """Start a fresh profiling window"""
+    query_profiler.reset()
+    return jsonify({
+        'success': True,
+        'message': 'Query profile reset'
+    })
+
 # ============================================
 # TEST ROUTES
 # ============================================
@@ -421,8 +1018,7 @@ def delete_user(user_id):
 def test_db():
     """Test database connection"""
     try:
-        query = "SELECT VERSION() as version"
-        result = Database.execute_query(query, fetch=True)
+        result = Database.execute_query(Database.driver().version_query, fetch=True)
         return jsonify({
             'success': True,
             'message': 'Database connected',
@@ -445,6 +1041,15 @@ def not_found(error):
         'message': 'Resource not found'
     }), 404
 
+@app.errorhandler(HashingPoolFull)
+def hashing_busy(error):
+    response = jsonify({
+        'success': False,
+        'message': 'Server is busy. Please try again shortly.'
+    })
+    response.headers['Retry-After'] = str(error.retry_after)
+    return response, 503
+
 @app.errorhandler(500)
 def internal_error(error):
     return jsonify({
@@ -452,6 +1057,75 @@ def internal_error(error):
         'message': 'Internal server error'
     }), 500
 
+# ============================================
+# CLI COMMANDS
+# ============================================
+
+@app.cli.command('migrate')
+def migrate_command():
+    """Apply pending database migrations (database/migrations)"""
+    try:
+        applied = MigrationRunner().migrate()
+    except MigrationError as e:
+        raise click.ClickException(str(e))
+    
+    if applied:
+        for name in applied:
+            click.echo(f"Applied {name}")
+    else:
+        click.echo("Database is up to date")
+
+@app.cli.command('build-assets')
+def build_assets_command():
+    """Fingerprint and precompress frontend css/js into ASSET_BUILD_FOLDER"""
+    manifest = static_assets.build()
+    click.echo(f"Built {len(manifest)} asset(s) into {static_assets.build_folder}")
+
+@app.cli.command('check-indexes')
+def check_indexes_command():
+    """EXPLAIN the hot queries and fail if any does a full table scan"""
+    failures = check_query_plans()
+    for name, table in failures:
+        click.echo(f"FULL SCAN: {name} (table {table})", err=True)
+    if failures:
+        raise SystemExit(1)
+    click.echo("All hot queries use an index")
+
+@app.cli.command('query-report')
+@click.option('--top', default=10, show_default=True, help='Statements to show')
+@click.option('--order', default='total', show_default=True,
+              type=click.Choice(['total', 'max', 'mean', 'calls']))
+@click.option('--explain', is_flag=True, help='Include the plan of each statement')
+@click.option('--reset', is_flag=True, help='Clear the profile after reading it')
+@click.option('--url', default='http://127.0.0.1:5000', show_default=True,
+              help='Running server to read the profile from')
+def query_report_command(top, order, explain, reset, url):
+    """Print the slowest statements recorded by a running server"""
+    # The aggregates live in the server process, so ask it for them
+    query = urlencode({'top': top, 'order': order, 'explain': int(explain)})
+    try:
+        with urllib.request.urlopen(f"{url}/api/query-profile?{query}", timeout=30) as response:
+            report = json.load(response)
+        if reset:
+            reset_request = urllib.request.Request(f"{url}/api/query-profile/reset", method='POST')
+            urllib.request.urlopen(reset_request, timeout=30).close()
+    except HTTPError as e:
+        raise click.ClickException(json.load(e).get('message', str(e)))
+    except URLError as e:
+        raise click.ClickException(f"Cannot reach {url}: {e.reason}")
+    
+    profiler = report['profiler']
+    click.echo(f"{profiler['calls']} calls across {profiler['statements']} statements, "
+               f"{profiler['slow_logged']} over {profiler['slow_threshold_ms']}ms")
+    click.echo(f"{'total ms':>10} {'calls':>8} {'mean ms':>9} {'max ms':>9} {'rows/call':>10}  query")
+    for entry in report['statements']:
+        click.echo(f"{entry['total_ms']:10.1f} {entry['calls']:8d} {entry['mean_ms']:9.2f} "
+                   f"{entry['max_ms']:9.2f} {entry['rows_per_call']:10.1f}  {entry['query']}")
+        for row in entry.get('plan', []):
+            click.echo(f"{'':50}{json.dumps(row, default=str)}")
+        if 'plan_error' in entry:
+            click.echo(f"{'':50}EXPLAIN failed: {entry['plan_error']}")
+
 # ============================================
 # RUN APPLICATION
 # ============================================
@@ -464,6 +1138,12 @@ if __name__ == '__main__':
     logger.info(f"Upload Folder: {Config.UPLOAD_FOLDER}")
     logger.info("=" * 50)
     
+    # The development server builds its own assets; deployments run
+    # `flask build-assets` once instead
+    if Config.ASSET_PIPELINE:
+        static_assets.build()
+    start_background_tasks()
+    
     app.run(
         host='0.0.0.0',
         port=5000,
@@ -9,11 +9,27 @@ class Config:
     """Application configuration class"""
     
     # Database Configuration
+    DB_DRIVER = os.getenv('DB_DRIVER', 'mysql')  # 'mysql' or 'sqlite'
     DB_HOST = os.getenv('DB_HOST', 'localhost')
     DB_PORT = int(os.getenv('DB_PORT', 3306))
     DB_USER = os.getenv('DB_USER', 'root')
     DB_PASSWORD = os.getenv('DB_PASSWORD', '')
     DB_NAME = os.getenv('DB_NAME', 'dr3_hardware_db')
+    DB_SQLITE_PATH = os.getenv('DB_SQLITE_PATH', 'dr3_hardware.db')  # or ':memory:'
+    DB_SQLITE_BUSY_TIMEOUT = float(os.getenv('DB_SQLITE_BUSY_TIMEOUT', 5))
+    
+    # Connection Pool Configuration
+    DB_POOL_SIZE = int(os.getenv('DB_POOL_SIZE', 5))
+    DB_POOL_MAX_OVERFLOW = int(os.getenv('DB_POOL_MAX_OVERFLOW', 10))
+    DB_POOL_TIMEOUT = float(os.getenv('DB_POOL_TIMEOUT', 10))
+    DB_POOL_RECYCLE = int(os.getenv('DB_POOL_RECYCLE', 3600))
+    DB_POOL_PING_IDLE = float(os.getenv('DB_POOL_PING_IDLE', 30))
+    DB_BATCH_SIZE = int(os.getenv('DB_BATCH_SIZE', 1000))
+    ASYNC_DB_POOL_SIZE = int(os.getenv('ASYNC_DB_POOL_SIZE', 20))  # asgi.py: aiomysql connections (or threads)
+    
+    # Prepared Statement Configuration
+    DB_PREPARED_STATEMENTS = os.getenv('DB_PREPARED_STATEMENTS', 'False') == 'True'
+    DB_STATEMENT_CACHE_SIZE = int(os.getenv('DB_STATEMENT_CACHE_SIZE', 64))
     
     # Flask Configuration
     SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-key')
@@ -24,12 +40,80 @@ class Config:
     UPLOAD_FOLDER = os.getenv('UPLOAD_FOLDER', 'uploads/profile_photos')
     MAX_FILE_SIZE = int(os.getenv('MAX_FILE_SIZE', 2097152))
     ALLOWED_EXTENSIONS = set(os.getenv('ALLOWED_EXTENSIONS', 'jpg,jpeg,png').split(','))
+    PHOTO_WORKERS = int(os.getenv('PHOTO_WORKERS', 2))
+    PHOTO_JPEG_QUALITY = int(os.getenv('PHOTO_JPEG_QUALITY', 85))
+    PHOTO_MAX_PIXELS = int(os.getenv('PHOTO_MAX_PIXELS', 40000000))
+    
+    # Static Asset Configuration
+    ASSET_PIPELINE = os.getenv('ASSET_PIPELINE', 'True') == 'True'  # Serve the `flask build-assets` output
+    ASSET_BUILD_FOLDER = os.getenv('ASSET_BUILD_FOLDER', 'build/frontend')
+    
+    # User List Configuration
+    USER_LIST_PAGE_SIZE = int(os.getenv('USER_LIST_PAGE_SIZE', 50))
+    USER_LIST_MAX_PAGE_SIZE = int(os.getenv('USER_LIST_MAX_PAGE_SIZE', 200))
+    
+    # Inventory Configuration
+    INVENTORY_PAGE_SIZE = int(os.getenv('INVENTORY_PAGE_SIZE', 25))
+    INVENTORY_MAX_PAGE_SIZE = int(os.getenv('INVENTORY_MAX_PAGE_SIZE', 200))
+    
+    # Bulk Import Configuration
+    IMPORT_CHUNK_SIZE = int(os.getenv('IMPORT_CHUNK_SIZE', 500))
+    IMPORT_MAX_ROWS = int(os.getenv('IMPORT_MAX_ROWS', 50000))
+    
+    # Uniqueness Index Configuration
+    UNIQUENESS_REFRESH_INTERVAL = int(os.getenv('UNIQUENESS_REFRESH_INTERVAL', 300))  # 0 = load once
+    
+    # Email Validation Configuration
+    EMAIL_CHECK_DELIVERABILITY = os.getenv('EMAIL_CHECK_DELIVERABILITY', 'True') == 'True'  # False = syntax only, no DNS
+    EMAIL_DOMAIN_CACHE_SIZE = int(os.getenv('EMAIL_DOMAIN_CACHE_SIZE', 10000))
+    EMAIL_DOMAIN_CACHE_TTL = int(os.getenv('EMAIL_DOMAIN_CACHE_TTL', 3600))
+    EMAIL_DOMAIN_UNKNOWN_TTL = int(os.getenv('EMAIL_DOMAIN_UNKNOWN_TTL', 60))  # Timeouts/SERVFAIL, allowed meanwhile
+    EMAIL_DNS_TIMEOUT = float(os.getenv('EMAIL_DNS_TIMEOUT', 2))
     
     # Security Configuration
     SESSION_TIMEOUT = int(os.getenv('SESSION_TIMEOUT', 3600))
     MAX_LOGIN_ATTEMPTS = int(os.getenv('MAX_LOGIN_ATTEMPTS', 5))
     ACCOUNT_LOCKOUT_DURATION = int(os.getenv('ACCOUNT_LOCKOUT_DURATION', 900))
     
+    # Retention Configuration (0 interval disables the sweeper)
+    RETENTION_SWEEP_INTERVAL = int(os.getenv('RETENTION_SWEEP_INTERVAL', 300))
+    RETENTION_BATCH_SIZE = int(os.getenv('RETENTION_BATCH_SIZE', 500))
+    SESSION_RETENTION = int(os.getenv('SESSION_RETENTION', 86400))  # Kept this long after expiry/logout
+    LOGIN_ATTEMPT_RETENTION = int(os.getenv('LOGIN_ATTEMPT_RETENTION', 2592000))
+    
+    # Password Hashing Pool Configuration
+    HASH_WORKERS = int(os.getenv('HASH_WORKERS', 0))  # 0 = size from CPU count and memory budget
+    HASH_MEMORY_BUDGET_MB = int(os.getenv('HASH_MEMORY_BUDGET_MB', 256))
+    HASH_QUEUE_SIZE = int(os.getenv('HASH_QUEUE_SIZE', 16))
+    HASH_RETRY_AFTER = int(os.getenv('HASH_RETRY_AFTER', 1))
+    
+    # Session Cache Configuration
+    SESSION_CACHE_SIZE = int(os.getenv('SESSION_CACHE_SIZE', 10000))
+    SESSION_CACHE_TTL = int(os.getenv('SESSION_CACHE_TTL', 60))
+    
+    # Session Activity Write-Behind Configuration
+    SESSION_ACTIVITY_FLUSH_INTERVAL = int(os.getenv('SESSION_ACTIVITY_FLUSH_INTERVAL', 30))
+    SESSION_ACTIVITY_MAX_PENDING = int(os.getenv('SESSION_ACTIVITY_MAX_PENDING', 500))
+    
+    # Login Attempt Logging Configuration
+    LOGIN_LOG_QUEUE_SIZE = int(os.getenv('LOGIN_LOG_QUEUE_SIZE', 10000))
+    LOGIN_LOG_BATCH_SIZE = int(os.getenv('LOGIN_LOG_BATCH_SIZE', 200))
+    LOGIN_LOG_FLUSH_INTERVAL = float(os.getenv('LOGIN_LOG_FLUSH_INTERVAL', 1.0))
+    LOGIN_LOG_OVERFLOW = os.getenv('LOGIN_LOG_OVERFLOW', 'sync')  # 'sync' or 'drop'
+    
+    # Account Lockout Tracking Configuration
+    LOCKOUT_MAX_TRACKED = int(os.getenv('LOCKOUT_MAX_TRACKED', 100000))
+    LOCKOUT_REBUILD_RETRY = float(os.getenv('LOCKOUT_REBUILD_RETRY', 30))  # Seconds between failed rebuilds
+    
+    # Metrics Configuration (/metrics, Prometheus text format)
+    METRICS_ENABLED = os.getenv('METRICS_ENABLED', 'True') == 'True'
+    
+    # Query Profiling Configuration (report: flask query-report)
+    QUERY_PROFILING = os.getenv('QUERY_PROFILING', 'False') == 'True'
+    SLOW_QUERY_THRESHOLD_MS = float(os.getenv('SLOW_QUERY_THRESHOLD_MS', 200))  # 0 = no slow-query log
+    QUERY_PROFILE_EXPLAIN = os.getenv('QUERY_PROFILE_EXPLAIN', 'False') == 'True'
+    QUERY_PROFILE_MAX_STATEMENTS = int(os.getenv('QUERY_PROFILE_MAX_STATEMENTS', 1000))
+    
     @staticmethod
     def init_app(app):
         """Initialize application with config"""
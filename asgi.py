@@ -0,0 +1,274 @@
+# asgi.py
+"""
+ASGI entry point with asyncio-native auth routes
+
+/api/login, /api/logout and /api/validate-session are served as
+coroutines: database calls go through backend/async_database.py and
+Argon2 is awaited on the hashing pool, so one process can hold thousands
+of concurrent session checks without a thread per request. Every other
+route is the Flask app, mounted through asgiref when it is installed.
+
+Serve with:
+    uvicorn asgi:application --host 0.0.0.0 --port 5000
+"""
+import json
+import time
+import logging
+from app import app as flask_app, start_background_tasks
+from backend.auth import AuthManager
+from backend.async_auth import AsyncAuthManager
+from backend.async_database import async_db
+from backend.hashing import HashingPoolFull
+from backend.metrics import http_request_seconds
+from backend.validation import Validator
+
+try:
+    from asgiref.wsgi import WsgiToAsgi
+except ImportError:  # Optional: without it only the auth routes are served
+    WsgiToAsgi = None
+
+logger = logging.getLogger(__name__)
+
+# Auth request bodies are a few hundred bytes
+MAX_BODY_SIZE = 64 * 1024
+
+
+class BadRequest(Exception):
+    """Request body that is not a JSON object"""
+
+
+async def read_json(receive):
+    """The request body as a dict"""
+    chunks = []
+    size = 0
+    while True:
+        message = await receive()
+        body = message.get('body', b'')
+        size += len(body)
+        if size > MAX_BODY_SIZE:
+            raise BadRequest('Request body too large')
+        chunks.append(body)
+        if not message.get('more_body'):
+            break
+    try:
+        data = json.loads(b''.join(chunks) or b'{}')
+    except ValueError:
+        raise BadRequest('Request body must be JSON')
+    if not isinstance(data, dict):
+        raise BadRequest('Request body must be a JSON object')
+    return data
+
+
+async def send_json(send, status, body, headers=()):
+    payload = json.dumps(body, default=str).encode()
+    await send({
+        'type': 'http.response.start',
+        'status': status,
+        'headers': [
+            (b'content-type', b'application/json'),
+            (b'content-length', str(len(payload)).encode()),
+            (b'access-control-allow-origin', b'*'),
+            *headers
+        ]
+    })
+    await send({'type': 'http.response.body', 'body': payload})
+
+
+def client_info(scope):
+    """(ip address, user agent) of the request"""
+    client = scope.get('client')
+    user_agent = ''
+    for name, value in scope.get('headers', ()):
+        if name == b'user-agent':
+            user_agent = value.decode('latin-1')
+            break
+    return (client[0] if client else ''), user_agent
+
+
+# ============================================
+# AUTHENTICATION ROUTES
+# ============================================
+
+async def login(scope, data):
+    """Handle user login (same responses as app.login)"""
+    username = str(data.get('username') or '').strip()
+    password = str(data.get('password') or '')
+    ip_address, user_agent = client_info(scope)
+    
+    # Validate input
+    if not username or not password:
+        return 400, {
+            'success': False,
+            'message': 'Username and password are required'
+        }
+    
+    # Check account lockout
+    is_locked, remaining_time = await AsyncAuthManager.check_account_lockout(username)
+    if is_locked:
+        return 403, {
+            'success': False,
+            'message': f'Account locked. Try again in {remaining_time} minutes.'
+        }
+    
+    # A username registration would reject cannot exist; skip the query
+    user = None
+    if Validator.validate_username(username)[0]:
+        user = await AsyncAuthManager.find_user(username)
+    
+    if user is None:
+        await AsyncAuthManager.log_login_attempt(username, False, ip_address, 'User not found')
+        return 401, {
+            'success': False,
+            'message': 'Invalid username or password'
+        }
+    
+    # Check if account is active
+    if user['status'] != 'Active':
+        return 403, {
+            'success': False,
+            'message': 'Account is inactive. Contact administrator.'
+        }
+    
+    # Verify password
+    is_valid, needs_rehash = await AsyncAuthManager.verify_password(user['password_hash'], password)
+    if not is_valid:
+        await AsyncAuthManager.log_login_attempt(username, False, ip_address, 'Invalid password')
+        return 401, {
+            'success': False,
+            'message': 'Invalid username or password'
+        }
+    
+    # Rehash password if needed (security best practice)
+    new_hash = await AsyncAuthManager.hash_password(password) if needs_rehash else None
+    
+    # Create session (its trigger sets last login; a new hash joins the same
+    # transaction) and cache it for the first validate-session
+    session_id = await AsyncAuthManager.complete_login(user['user_id'], ip_address, user_agent, new_hash)
+    AuthManager.prime_session(session_id, user)
+    
+    await AsyncAuthManager.log_login_attempt(username, True, ip_address)
+    logger.info(f"User {username} logged in successfully")
+    
+    return 200, {
+        'success': True,
+        'message': 'Login successful',
+        'session_id': session_id,
+        'user_id': user['user_id'],
+        'username': user['username'],
+        'full_name': user['full_name'],
+        'role': user['role']
+    }
+
+
+async def logout(scope, data):
+    """Handle user logout"""
+    session_id = data.get('session_id')
+    if session_id:
+        await AsyncAuthManager.logout(session_id)
+    return 200, {
+        'success': True,
+        'message': 'Logged out successfully'
+    }
+
+
+async def validate_session(scope, data):
+    """Validate user session"""
+    session_id = data.get('session_id')
+    if not session_id:
+        return 200, {'success': True, 'valid': False}
+    
+    user_data = await AsyncAuthManager.validate_session(session_id)
+    if user_data:
+        return 200, {'success': True, 'valid': True, 'user': user_data}
+    return 200, {'success': True, 'valid': False}
+
+
+# path -> (handler, message returned on an unexpected error)
+ROUTES = {
+    '/api/login': (login, 'An error occurred during login'),
+    '/api/logout': (logout, 'Logout error'),
+    '/api/validate-session': (validate_session, 'Validation error'),
+}
+
+
+# ============================================
+# ASGI APPLICATION
+# ============================================
+
+fallback = WsgiToAsgi(flask_app) if WsgiToAsgi is not None else None
+
+
+async def application(scope, receive, send):
+    """ASGI callable: async auth routes, everything else to Flask"""
+    if scope['type'] == 'lifespan':
+        await lifespan(receive, send)
+        return
+    
+    route = ROUTES.get(scope.get('path')) if scope['type'] == 'http' else None
+    if route is None:
+        if fallback is not None:
+            await fallback(scope, receive, send)
+        elif scope['type'] == 'http':
+            await send_json(send, 404, {'success': False, 'message': 'Resource not found'})
+        return
+    
+    started = time.perf_counter()
+    status = await dispatch(scope, receive, send, *route)
+    http_request_seconds.observe(time.perf_counter() - started, scope['method'], scope['path'], str(status))
+
+
+async def dispatch(scope, receive, send, handler, error_message):
+    """Run one auth route and send its JSON response; returns the status"""
+    if scope['method'] == 'OPTIONS':
+        # CORS preflight, as flask_cors answers it for the Flask routes
+        await send({
+            'type': 'http.response.start',
+            'status': 200,
+            'headers': [
+                (b'access-control-allow-origin', b'*'),
+                (b'access-control-allow-methods', b'POST, OPTIONS'),
+                (b'access-control-allow-headers', b'Content-Type'),
+                (b'content-length', b'0')
+            ]
+        })
+        await send({'type': 'http.response.body', 'body': b''})
+        return 200
+    
+    if scope['method'] != 'POST':
+        await send_json(send, 405, {'success': False, 'message': 'Method not allowed'})
+        return 405
+    
+    headers = ()
+    try:
+        data = await read_json(receive)
+        status, body = await handler(scope, data)
+    except BadRequest as e:
+        status, body = 400, {'success': False, 'message': str(e)}
+    except HashingPoolFull as e:
+        status, body = 503, {'success': False, 'message': 'Server is busy. Please try again shortly.'}
+        headers = ((b'retry-after', str(e.retry_after).encode()),)
+    except Exception as e:
+        logger.error(f"{handler.__name__} error: {e}")
+        status, body = 500, {'success': False, 'message': error_message}
+    
+    await send_json(send, status, body, headers)
+    return status
+
+
+async def lifespan(receive, send):
+    """Open the async database and start background tasks on startup; close on shutdown"""
+    while True:
+        message = await receive()
+        if message['type'] == 'lifespan.startup':
+            try:
+                await async_db.start()
+            except Exception as e:
+                logger.error(f"❌ Async database startup error: {e}")
+                await send({'type': 'lifespan.startup.failed', 'message': str(e)})
+                return
+            start_background_tasks()
+            await send({'type': 'lifespan.startup.complete'})
+        elif message['type'] == 'lifespan.shutdown':
+            await async_db.close()
+            await send({'type': 'lifespan.shutdown.complete'})
+            return
@@ -0,0 +1,134 @@
+# backend/activity.py
+import time
+import atexit
+import threading
+import logging
+from datetime import datetime
+from backend.database import Database
+
+logger = logging.getLogger(__name__)
+
+
+class ActivityBuffer:
+    """
+    Write-behind buffer for user_sessions.last_activity
+    
+    Touched session IDs are collected in memory and written as one
+    multi-row UPDATE every flush_interval seconds, or sooner once
+    max_pending sessions are waiting. A session's last_activity in the
+    database therefore lags by at most flush_interval seconds.
+    """
+    
+    def __init__(self, flush_interval, max_pending):
+        """
+        Args:
+            flush_interval (float): Maximum seconds a touch stays buffered
+            max_pending (int): Buffered sessions that trigger an early flush
+        """
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending = set()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread = None
+        self._flushes = 0
+        self._flushed_sessions = 0
+        self._errors = 0
+        self._last_flush_ms = 0.0
+    
+    def touch(self, session_id):
+        """Record activity for a session"""
+        with self._lock:
+            self._pending.add(session_id)
+            pending = len(self._pending)
+            if self._thread is None and not self._stopping:
+                self._start()
+        
+        if pending >= self.max_pending:
+            self._wakeup.set()
+    
+    def discard(self, session_id):
+        """Forget a buffered touch, e.g. after logout"""
+        with self._lock:
+            self._pending.discard(session_id)
+    
+    def flush(self):
+        """
+        Write all buffered touches to the database
+        
+        Returns:
+            int: Number of sessions updated
+        """
+        with self._flush_lock:
+            with self._lock:
+                session_ids, self._pending = list(self._pending), set()
+            
+            if not session_ids:
+                return 0
+            
+            started = time.perf_counter()
+            now = datetime.now()
+            try:
+                with Database.transaction() as cursor:
+                    for start in range(0, len(session_ids), self.max_pending):
+                        chunk = session_ids[start:start + self.max_pending]
+                        placeholders = ', '.join(['%s'] * len(chunk))
+                        query = f"""
+                            UPDATE user_sessions
+                            SET last_activity = %s
+                            WHERE session_id IN ({placeholders})
+                        """
+                        cursor.execute(query, (now, *chunk))
+            except Exception as e:
+                # Keep the touches so the next flush retries them
+                with self._lock:
+                    self._pending.update(session_ids)
+                    self._errors += 1
+                logger.error(f"Error flushing session activity: {e}")
+                return 0
+            
+            with self._lock:
+                self._flushes += 1
+                self._flushed_sessions += len(session_ids)
+                self._last_flush_ms = (time.perf_counter() - started) * 1000
+            return len(session_ids)
+    
+    def stop(self):
+        """Stop the background thread and flush what is buffered"""
+        with self._lock:
+            self._stopping = True
+            thread = self._thread
+        self._wakeup.set()
+        if thread is not None:
+            thread.join(timeout=self.flush_interval)
+        self.flush()
+    
+    def stats(self):
+        """Return buffer size and flush counters"""
+        with self._lock:
+            return {
+                'pending': len(self._pending),
+                'flush_interval_seconds': self.flush_interval,
+                'flushes': self._flushes,
+                'flushed_sessions': self._flushed_sessions,
+                'errors': self._errors,
+                'last_flush_ms': round(self._last_flush_ms, 2)
+            }
+    
+    def _start(self):
+        self._thread = threading.Thread(
+            target=self._run,
+            name='session-activity-flusher',
+            daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.stop)
+    
+    def _run(self):
+        while not self._stopping:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            if not self._stopping:
+                self.flush()
@@ -0,0 +1,200 @@
+# backend/assets.py
+import os
+import re
+import gzip
+import json
+import hashlib
+import mimetypes
+import logging
+
+try:
+    import brotli
+except ImportError:  # Optional: .br variants are skipped without it
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# Asset folders under frontend/ that get fingerprinted
+ASSET_DIRS = ('css', 'js')
+
+# Only worth compressing text; images are already compressed
+COMPRESSIBLE = ('.css', '.js', '.html')
+
+# Written last by build(), read by load()
+MANIFEST_NAME = 'manifest.json'
+
+# href="../css/x.css", src="../js/x.js" (optionally /frontend/ or no prefix)
+ASSET_REFERENCE = re.compile(
+    r'(?P<attr>\b(?:href|src)=")(?:\.\./|/frontend/)?(?P<path>(?:css|js)/[^"?#]+)"'
+)
+
+
+class StaticAssets:
+    """
+    Fingerprinted, precompressed copies of the frontend
+    
+    build() copies frontend/css and frontend/js into build_folder as
+    name.<hash>.ext, writes .gz (and .br when the brotli package is
+    installed) next to each file, and rewrites the asset references in
+    frontend/pages/*.html to the fingerprinted names. Fingerprinted files
+    never change, so they are served as immutable; pages keep their names
+    and are revalidated with an ETag.
+    
+    Building is a deployment step (flask build-assets); server processes
+    only load() the manifest it leaves behind. Every file is replaced
+    atomically and older fingerprints are left in place for clients still
+    holding old pages.
+    """
+    
+    def __init__(self, source_folder, build_folder):
+        """
+        Args:
+            source_folder (str): The frontend/ directory
+            build_folder (str): Output directory
+        """
+        self.source_folder = source_folder
+        self.build_folder = build_folder
+        self.manifest = {}  # 'css/styles.css' -> 'css/styles.1a2b3c4d5e6f.css'
+        self._files = {}    # served path -> (etag, immutable)
+    
+    def build(self):
+        """Fingerprint, compress and rewrite everything; returns the manifest"""
+        self.manifest = {}
+        self._files = {}
+        
+        for folder in ASSET_DIRS:
+            source = os.path.join(self.source_folder, folder)
+            if not os.path.isdir(source):
+                continue
+            for name in sorted(os.listdir(source)):
+                path = os.path.join(source, name)
+                if not os.path.isfile(path):
+                    continue
+                with open(path, 'rb') as f:
+                    data = f.read()
+                digest = hashlib.sha256(data).hexdigest()[:12]
+                stem, extension = os.path.splitext(name)
+                built = f"{folder}/{stem}.{digest}{extension}"
+                self._write(built, data, digest, immutable=True)
+                self.manifest[f"{folder}/{name}"] = built
+        
+        pages = os.path.join(self.source_folder, 'pages')
+        if os.path.isdir(pages):
+            for name in sorted(os.listdir(pages)):
+                if not name.endswith('.html'):
+                    continue
+                with open(os.path.join(pages, name), encoding='utf-8') as f:
+                    html = self.rewrite(f.read())
+                data = html.encode('utf-8')
+                self._write(f"pages/{name}", data, hashlib.sha256(data).hexdigest()[:16], immutable=False)
+        
+        manifest = {'assets': self.manifest, 'files': self._files}
+        self._replace(os.path.join(self.build_folder, MANIFEST_NAME),
+                      json.dumps(manifest, indent=2, sort_keys=True).encode('utf-8'))
+        
+        logger.info(f"Built {len(self.manifest)} fingerprinted asset(s)"
+                    f"{'' if brotli else ' (brotli not installed, gzip only)'}")
+        return self.manifest
+    
+    def load(self):
+        """
+        Serve a previous build() from build_folder
+        
+        Returns:
+            bool: False if there is no build (nothing is served from it)
+        """
+        try:
+            with open(os.path.join(self.build_folder, MANIFEST_NAME), encoding='utf-8') as f:
+                manifest = json.load(f)
+        except FileNotFoundError:
+            return False
+        
+        self.manifest = manifest['assets']
+        self._files = {path: tuple(entry) for path, entry in manifest['files'].items()}
+        return True
+    
+    def rewrite(self, html):
+        """Point css/js references at their fingerprinted names"""
+        def replace(match):
+            built = self.manifest.get(match.group('path'))
+            if built is None:
+                return match.group(0)
+            return f'{match.group("attr")}/frontend/{built}"'
+        return ASSET_REFERENCE.sub(replace, html)
+    
+    def lookup(self, path, accept_encoding=''):
+        """
+        Pick the file to send for a request path
+        
+        Args:
+            path (str): Path under frontend/, e.g. 'js/validation.3f2a1b0c9d8e.js'
+            accept_encoding (str): The request's Accept-Encoding header
+            
+        Returns:
+            dict: file, mimetype, encoding, etag and immutable; None if
+                  path is not a built file
+        """
+        entry = self._files.get(path)
+        if entry is None:
+            return None
+        etag, immutable = entry
+        
+        file_path = os.path.join(self.build_folder, path)
+        encoding = None
+        accepted = self.accepted_encodings(accept_encoding)
+        for candidate, suffix in (('br', '.br'), ('gzip', '.gz')):
+            if candidate in accepted and os.path.exists(file_path + suffix):
+                file_path += suffix
+                encoding = candidate
+                break
+        
+        return {
+            'file': file_path,
+            'mimetype': mimetypes.guess_type(path)[0] or 'application/octet-stream',
+            'encoding': encoding,
+            'etag': f"{etag}-{encoding}" if encoding else etag,
+            'immutable': immutable
+        }
+    
+    @staticmethod
+    def accepted_encodings(header):
+        """Encodings in an Accept-Encoding header, minus those with q=0"""
+        accepted = set()
+        for part in (header or '').split(','):
+            name, _, params = part.strip().partition(';')
+            name = name.strip().lower()
+            if not name:
+                continue
+            q = params.strip()
+            if q.startswith('q='):
+                try:
+                    if float(q[2:]) == 0:
+                        continue
+                except ValueError:
+                    continue
+            accepted.add(name)
+        if '*' in accepted:
+            accepted.update(('br', 'gzip'))
+        return accepted
+    
+    def _write(self, path, data, etag, immutable):
+        target = os.path.join(self.build_folder, path)
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        self._replace(target, data)
+        
+        if path.endswith(COMPRESSIBLE):
+            variants = [('.gz', gzip.compress(data, compresslevel=9, mtime=0))]
+            if brotli is not None:
+                variants.append(('.br', brotli.compress(data, quality=11)))
+            for suffix, compressed in variants:
+                if len(compressed) < len(data):
+                    self._replace(target + suffix, compressed)
+        
+        self._files[path] = (etag, immutable)
+    
+    @staticmethod
+    def _replace(target, data):
+        temporary = f"{target}.{os.getpid()}.tmp"
+        with open(temporary, 'wb') as f:
+            f.write(data)
+        os.replace(temporary, target)
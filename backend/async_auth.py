@@ -0,0 +1,167 @@
+# backend/async_auth.py
+import time
+from datetime import datetime, timedelta
+from app_config import Config
+from backend.auth import (
+    AuthManager, SESSION_QUERY, LOGIN_QUERY, CREATE_SESSION_QUERY, REHASH_QUERY,
+    LOGOUT_QUERY, ph, check_password, hashing_pool, session_cache, activity_buffer,
+    lockout_tracker, attempt_logger
+)
+from backend.async_database import async_db
+from backend.hashing import HashingPoolFull
+from backend.metrics import password_seconds
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncAuthManager:
+    """
+    Coroutine versions of the AuthManager calls that wait on I/O
+    
+    Everything answered from memory (session IDs, lockout checks once
+    the tracker is loaded) is AuthManager's own code; the session cache
+    and activity buffer are the ones the Flask routes use, so both serving
+    paths see the same sessions. Database calls go through async_db,
+    Argon2 runs on the shared hashing pool, and the lockout rebuild and
+    overflow attempt writes run on worker threads, so none blocks the loop.
+    """
+    
+    @staticmethod
+    async def hash_password(password):
+        """
+        Hash a password using Argon2id
+        
+        Raises:
+            HashingPoolFull: If the hashing queue is at capacity
+        """
+        started = time.perf_counter()
+        try:
+            return await hashing_pool.run_async(ph.hash, password)
+        except HashingPoolFull:
+            raise
+        except Exception as e:
+            logger.error(f"Password hashing error: {e}")
+            raise
+        finally:
+            password_seconds.observe(time.perf_counter() - started, 'hash')
+    
+    @staticmethod
+    async def verify_password(password_hash, password):
+        """
+        Verify a password against its hash
+        
+        Returns:
+            tuple: (bool verified, bool needs_rehash)
+            
+        Raises:
+            HashingPoolFull: If the hashing queue is at capacity
+        """
+        started = time.perf_counter()
+        try:
+            return await hashing_pool.run_async(check_password, password_hash, password)
+        except HashingPoolFull:
+            raise
+        except Exception as e:
+            logger.error(f"Password verification error: {e}")
+            return False, False
+        finally:
+            password_seconds.observe(time.perf_counter() - started, 'verify')
+    
+    @staticmethod
+    async def check_account_lockout(username):
+        """
+        AuthManager.check_account_lockout, with a due tracker rebuild run off the loop
+        
+        Returns:
+            tuple: (is_locked: bool, remaining_time_minutes: int)
+        """
+        await lockout_tracker.load_async()
+        return AuthManager.check_account_lockout(username)
+    
+    @staticmethod
+    async def log_login_attempt(username, success, ip_address='', failure_reason=''):
+        """AuthManager.log_login_attempt, with any inline write run off the loop"""
+        try:
+            if not success:
+                await lockout_tracker.load_async()
+                lockout_tracker.record_failure(username)
+            await attempt_logger.log_async(username, success, ip_address, failure_reason)
+        except Exception as e:
+            logger.error(f"Error logging login attempt: {e}")
+    
+    @staticmethod
+    async def find_user(username):
+        """The login row for username, or None"""
+        users = await async_db.execute_query(LOGIN_QUERY, (username,), fetch=True)
+        return users[0] if users else None
+    
+    @staticmethod
+    async def complete_login(user_id, ip_address='', user_agent='', new_password_hash=None):
+        """
+        Create the session (the trigger sets last_login), and replace the
+        password hash in the same transaction when it is given
+        
+        Returns:
+            str: Session ID
+        """
+        session_id = AuthManager.generate_session_id()
+        now = datetime.now()
+        try:
+            create = (CREATE_SESSION_QUERY, (session_id, user_id, ip_address, user_agent, now))
+            if new_password_hash is None:
+                await async_db.execute_query(*create)
+            else:
+                await async_db.execute_transaction((create, (REHASH_QUERY, (new_password_hash, user_id))))
+            logger.info(f"Session created for user: {user_id}")
+            return session_id
+        except Exception as e:
+            logger.error(f"Login completion error: {e}")
+            raise
+    
+    @staticmethod
+    async def validate_session(session_id):
+        """
+        Validate if a session is active
+        
+        Cache hits are answered without awaiting anything.
+        
+        Returns:
+            dict: User data if valid, None otherwise
+        """
+        # Request bodies are arbitrary JSON; a list would not even hash
+        if not isinstance(session_id, str):
+            return None
+        
+        cached = session_cache.get(session_id)
+        if cached is not None:
+            activity_buffer.touch(session_id)
+            return dict(cached)
+        
+        # A logout racing this query must not find the session cached again
+        generation = session_cache.generation()
+        try:
+            expires_before = datetime.now() - timedelta(seconds=Config.SESSION_TIMEOUT)
+            result = await async_db.execute_query(SESSION_QUERY, (session_id, expires_before), fetch=True)
+            if result:
+                activity_buffer.touch(session_id)
+                session_cache.set(session_id, dict(result[0]), since=generation)
+                return dict(result[0])
+            return None
+        except Exception as e:
+            logger.error(f"Session validation error: {e}")
+            return None
+    
+    @staticmethod
+    async def logout(session_id):
+        """Deactivate a user session"""
+        if not isinstance(session_id, str):
+            return
+        session_cache.invalidate(session_id)
+        activity_buffer.discard(session_id)
+        try:
+            await async_db.execute_query(LOGOUT_QUERY, (datetime.now(), session_id))
+            logger.info(f"Session logged out: {session_id}")
+        except Exception as e:
+            logger.error(f"Logout error: {e}")
+            raise
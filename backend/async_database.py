@@ -0,0 +1,206 @@
+# backend/async_database.py
+import time
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from app_config import Config
+from backend.database import Database
+from backend.metrics import db_query_seconds, db_transaction_seconds, db_checkout_seconds
+from backend.profiler import query_profiler
+
+try:
+    import aiomysql
+except ImportError:  # Optional: without it queries run on a thread executor
+    aiomysql = None
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDatabase:
+    """
+    asyncio access to the configured database, for the ASGI auth routes
+    
+    With the MySQL driver and aiomysql installed, queries go over an
+    aiomysql pool of its own (Config.ASYNC_DB_POOL_SIZE connections), so
+    a waiting query holds a coroutine rather than a thread. Otherwise
+    (SQLite, or aiomysql missing) each query runs Database.execute_query
+    on a small thread executor: the event loop still never blocks, but
+    concurrency is bounded by the executor size.
+    
+    Queries are the same %s-style statements the sync code uses.
+    """
+    
+    def __init__(self, pool_size):
+        """
+        Args:
+            pool_size (int): aiomysql connections, or executor threads
+        """
+        self.pool_size = pool_size
+        self._pool = None
+        self._executor = None
+        # Requests may start the pool lazily and concurrently
+        self._start_lock = asyncio.Lock()
+    
+    @property
+    def mode(self):
+        """'aiomysql', 'executor' or None before start()"""
+        if self._pool is not None:
+            return 'aiomysql'
+        return 'executor' if self._executor is not None else None
+    
+    async def start(self):
+        """Open the aiomysql pool or the executor (ASGI lifespan startup)"""
+        if self.mode is not None:
+            return
+        
+        async with self._start_lock:
+            if self.mode is not None:
+                return
+            await self._open()
+    
+    async def _open(self):
+        driver = Database.driver()
+        if driver.name == 'mysql' and aiomysql is not None:
+            self._pool = await aiomysql.create_pool(
+                host=Config.DB_HOST,
+                port=Config.DB_PORT,
+                db=Config.DB_NAME,
+                user=Config.DB_USER,
+                password=Config.DB_PASSWORD,
+                minsize=1,
+                maxsize=self.pool_size,
+                pool_recycle=Config.DB_POOL_RECYCLE,
+                autocommit=True,
+                cursorclass=aiomysql.DictCursor
+            )
+            logger.info(f"✅ aiomysql pool initialized ({driver.describe()})")
+            return
+        
+        if driver.name == 'mysql':
+            logger.warning("aiomysql is not installed; async queries run on a thread executor")
+        
+        # More threads than pooled connections would only queue in the pool
+        workers = self.pool_size
+        if driver.max_connections is not None:
+            workers = min(workers, driver.max_connections)
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix='async-db')
+        logger.info(f"✅ Async database executor initialized ({driver.describe()}, {workers} threads)")
+    
+    async def close(self):
+        """Close the pool or executor (ASGI lifespan shutdown)"""
+        if self._pool is not None:
+            self._pool.close()
+            await self._pool.wait_closed()
+            self._pool = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
+    async def execute_query(self, query, params=None, fetch=False):
+        """
+        Execute one statement, like Database.execute_query
+        
+        Returns:
+            list: Rows as dicts if fetch, else the last inserted row id
+        """
+        if self.mode is None:
+            await self.start()
+        if self._executor is not None:
+            return await self._in_executor(Database.execute_query, query, params, fetch)
+        
+        started = time.perf_counter()
+        rows = None
+        try:
+            async with self._acquire() as connection:
+                async with connection.cursor() as cursor:
+                    await cursor.execute(query, params or ())
+                    if fetch:
+                        result = await cursor.fetchall()
+                        rows = len(result)
+                        return list(result)
+                    rows = cursor.rowcount
+                    return cursor.lastrowid
+        except aiomysql.Error as e:
+            logger.error(f"Database query error: {e}")
+            raise
+        finally:
+            elapsed = time.perf_counter() - started
+            db_query_seconds.observe(elapsed, 'read' if fetch else 'write')
+            query_profiler.record(query, params, elapsed, rows)
+    
+    async def execute_transaction(self, statements):
+        """
+        Run (query, params) statements on one connection and commit once
+        
+        Rolls back and re-raises if any statement fails.
+        """
+        if self.mode is None:
+            await self.start()
+        if self._executor is not None:
+            return await self._in_executor(_run_transaction, statements)
+        
+        started = time.perf_counter()
+        try:
+            async with self._acquire() as connection:
+                await connection.begin()
+                try:
+                    async with connection.cursor() as cursor:
+                        for query, params in statements:
+                            query_started = time.perf_counter()
+                            await cursor.execute(query, params)
+                            query_profiler.record(query, params, time.perf_counter() - query_started,
+                                                  cursor.rowcount)
+                    await connection.commit()
+                except BaseException:
+                    await connection.rollback()
+                    raise
+        except aiomysql.Error as e:
+            logger.error(f"Database transaction error: {e}")
+            raise
+        finally:
+            db_transaction_seconds.observe(time.perf_counter() - started)
+    
+    def _acquire(self):
+        return _TimedAcquire(self._pool)
+    
+    async def _in_executor(self, fn, *args):
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+    
+    def stats(self):
+        """Return pool or executor counters"""
+        if self._pool is not None:
+            return {
+                'mode': 'aiomysql',
+                'size': self._pool.size,
+                'free': self._pool.freesize,
+                'max_size': self._pool.maxsize
+            }
+        return {'mode': self.mode, 'size': self.pool_size}
+
+
+class _TimedAcquire:
+    """pool.acquire() that observes the checkout time"""
+    
+    def __init__(self, pool):
+        self._pool = pool
+        self._connection = None
+    
+    async def __aenter__(self):
+        started = time.perf_counter()
+        try:
+            self._connection = await self._pool.acquire()
+        finally:
+            db_checkout_seconds.observe(time.perf_counter() - started)
+        return self._connection
+    
+    async def __aexit__(self, *exc_info):
+        self._pool.release(self._connection)
+
+
+def _run_transaction(statements):
+    with Database.transaction() as cursor:
+        for query, params in statements:
+            cursor.execute(query, params)
+
+
+async_db = AsyncDatabase(Config.ASYNC_DB_POOL_SIZE)
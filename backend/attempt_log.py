@@ -0,0 +1,221 @@
+# backend/attempt_log.py
+import time
+import queue
+import asyncio
+import atexit
+import threading
+import logging
+from datetime import datetime
+from backend.database import Database
+
+logger = logging.getLogger(__name__)
+
+
+class LoginAttemptLogger:
+    """
+    Background, batched writer for the login_attempts table
+    
+    Attempts are queued and written with one multi-row INSERT per batch.
+    The attempt time is captured when the attempt is queued, so batching
+    does not shift rows in time. When the queue is full, the overflow
+    policy decides what happens: 'sync' writes the row inline and 'drop'
+    discards it. Both cases are counted.
+    
+    Text fields are cut to their column widths when queued, and a batch
+    the database rejects is retried row by row, so one bad row cannot
+    take the other attempts in its batch with it.
+    """
+    
+    # login_attempts column widths
+    USERNAME_LENGTH = 20
+    IP_ADDRESS_LENGTH = 45
+    FAILURE_REASON_LENGTH = 100
+    
+    INSERT_QUERY = """
+        INSERT INTO login_attempts
+        (username, ip_address, success, failure_reason, attempt_time)
+        VALUES (%s, %s, %s, %s, %s)
+    """
+    
+    def __init__(self, queue_size, batch_size, flush_interval, overflow='sync'):
+        """
+        Args:
+            queue_size (int): Maximum queued attempts
+            batch_size (int): Maximum rows per INSERT
+            flush_interval (float): Maximum seconds an attempt stays queued
+            overflow (str): 'sync' or 'drop' when the queue is full
+        """
+        if overflow not in ('sync', 'drop'):
+            raise ValueError(f"Unknown overflow policy: {overflow}")
+        
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.overflow = overflow
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._stopping = False
+        self._thread = None
+        self._queued = 0
+        self._written = 0
+        self._dropped = 0
+        self._overflow_writes = 0
+        self._batches = 0
+        self._errors = 0
+    
+    def log(self, username, success, ip_address='', failure_reason=''):
+        """Queue a login attempt for writing"""
+        row = self._queue_row(username, success, ip_address, failure_reason)
+        if row is not None:
+            self._write([row])
+    
+    async def log_async(self, username, success, ip_address='', failure_reason=''):
+        """Like log(), but an overflow write runs on a worker thread, not the event loop"""
+        row = self._queue_row(username, success, ip_address, failure_reason)
+        if row is not None:
+            await asyncio.get_running_loop().run_in_executor(None, self._write, [row])
+    
+    def _queue_row(self, username, success, ip_address, failure_reason):
+        # Returns the row if the overflow policy says to write it inline
+        row = (
+            str(username or '')[:self.USERNAME_LENGTH],
+            str(ip_address or '')[:self.IP_ADDRESS_LENGTH],
+            bool(success),
+            str(failure_reason or '')[:self.FAILURE_REASON_LENGTH],
+            datetime.now()
+        )
+        
+        with self._lock:
+            if self._thread is None and not self._stopping:
+                self._start()
+        
+        try:
+            self._queue.put_nowait(row)
+            with self._lock:
+                self._queued += 1
+            return None
+        except queue.Full:
+            pass
+        
+        if self.overflow == 'drop':
+            with self._lock:
+                self._dropped += 1
+            return None
+        
+        with self._lock:
+            self._overflow_writes += 1
+        return row
+    
+    def flush(self):
+        """
+        Write every queued attempt now
+        
+        Returns:
+            int: Number of rows written
+        """
+        written = 0
+        while True:
+            batch = self._drain(self.batch_size)
+            if not batch:
+                return written
+            written += self._write(batch)
+    
+    def stop(self):
+        """Stop the background thread and flush the queue"""
+        with self._lock:
+            self._stopping = True
+            thread = self._thread
+        if thread is not None:
+            thread.join(timeout=self.flush_interval * 2)
+        self.flush()
+    
+    def stats(self):
+        """Return queue depth and write counters"""
+        with self._lock:
+            return {
+                'queue_depth': self._queue.qsize(),
+                'queued': self._queued,
+                'written': self._written,
+                'batches': self._batches,
+                'dropped': self._dropped,
+                'overflow_writes': self._overflow_writes,
+                'errors': self._errors,
+                'overflow_policy': self.overflow
+            }
+    
+    def _drain(self, limit):
+        batch = []
+        while len(batch) < limit:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+    
+    def _write(self, rows):
+        with self._write_lock:
+            try:
+                Database.execute_many(self.INSERT_QUERY, rows)
+            except Exception as e:
+                if len(rows) == 1:
+                    self._reject(rows[0], e)
+                    return 0
+                logger.warning(f"Batch of {len(rows)} login attempts failed ({e}); retrying row by row")
+                return self._write_rows(rows)
+        
+        with self._lock:
+            self._written += len(rows)
+            self._batches += 1
+        return len(rows)
+    
+    def _write_rows(self, rows):
+        written = 0
+        for row in rows:
+            try:
+                Database.execute_query(self.INSERT_QUERY, row)
+                written += 1
+            except Exception as e:
+                self._reject(row, e)
+        
+        with self._lock:
+            self._written += written
+            self._batches += 1
+        return written
+    
+    def _reject(self, row, error):
+        with self._lock:
+            self._errors += 1
+        username, ip_address, success, failure_reason, attempt_time = row
+        logger.error(
+            f"Dropped login attempt: username={username!r} ip={ip_address!r} "
+            f"success={success} reason={failure_reason!r} time={attempt_time}: {error}"
+        )
+    
+    def _start(self):
+        self._thread = threading.Thread(
+            target=self._run,
+            name='login-attempt-logger',
+            daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.stop)
+    
+    def _run(self):
+        while not self._stopping:
+            try:
+                first = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+            
+            # Give a burst a moment to accumulate into one batch
+            deadline = time.monotonic() + self.flush_interval
+            batch = [first]
+            while len(batch) < self.batch_size and not self._stopping:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._write(batch)
@@ -1,16 +1,60 @@
 # backend/auth.py
 
 
+import time
 import hashlib
 import secrets
 from datetime import datetime, timedelta
 from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
+from app_config import Config
 from backend.database import Database
+from backend.hashing import HashingPool, HashingPoolFull
+from backend.cache import TTLCache
+from backend.activity import ActivityBuffer
+from backend.attempt_log import LoginAttemptLogger
+from backend.lockout import LockoutTracker
+from backend.retention import RetentionSweeper
+from backend.metrics import password_seconds
 import logging
 
 logger = logging.getLogger(__name__)
 
+SESSION_QUERY = """
+    SELECT u.user_id, u.username, u.full_name, u.role, u.status
+    FROM user_sessions s
+    JOIN users u ON s.user_id = u.user_id
+    WHERE s.session_id = %s
+    AND s.is_active = TRUE
+    AND u.status = 'Active'
+    AND s.last_activity > %s
+"""
+
+# The columns SESSION_QUERY returns, all of which LOGIN_QUERY reads too
+SESSION_FIELDS = ('user_id', 'username', 'full_name', 'role', 'status')
+
+# Shared with the asyncio auth path (backend/async_auth.py)
+LOGIN_QUERY = """
+    SELECT user_id, username, password_hash, full_name, role, status
+    FROM users
+    WHERE username = %s
+"""
+
+# last_activity is written from the app clock, like every timestamp that
+# SESSION_QUERY and the retention sweep compare against a Python cutoff;
+# the column defaults would use the database clock and time zone instead.
+# The user_sessions_last_login trigger (migration 0005) copies it to
+# users.last_login, so a login needs no separate UPDATE.
+CREATE_SESSION_QUERY = """
+    INSERT INTO user_sessions
+    (session_id, user_id, ip_address, user_agent, last_activity)
+    VALUES (%s, %s, %s, %s, %s)
+"""
+
+REHASH_QUERY = "UPDATE users SET password_hash = %s WHERE user_id = %s"
+
+LOGOUT_QUERY = "UPDATE user_sessions SET is_active = FALSE, last_activity = %s WHERE session_id = %s"
+
 # Initialize Argon2 password hasher
 ph = PasswordHasher(
     time_cost=3,
@@ -20,6 +64,70 @@ ph = PasswordHasher(
     salt_len=16
 )
 
+# Argon2 runs on a bounded pool so bursts cannot exhaust memory or cores
+hashing_pool = HashingPool(
+    workers=HashingPool.default_workers(ph.memory_cost, ph.parallelism),
+    queue_size=Config.HASH_QUEUE_SIZE,
+    retry_after=Config.HASH_RETRY_AFTER
+)
+
+# Validated sessions, keyed by session_id. Entries live for at most
+# SESSION_CACHE_TTL seconds so last_activity is refreshed at least that often.
+session_cache = TTLCache(
+    max_size=Config.SESSION_CACHE_SIZE,
+    ttl=Config.SESSION_CACHE_TTL
+)
+
+# last_activity updates are coalesced and written behind. The staleness
+# bound is kept well inside the session timeout.
+activity_buffer = ActivityBuffer(
+    flush_interval=min(Config.SESSION_ACTIVITY_FLUSH_INTERVAL, Config.SESSION_TIMEOUT / 4),
+    max_pending=Config.SESSION_ACTIVITY_MAX_PENDING
+)
+
+# Login attempts are queued and inserted in batches off the request path
+attempt_logger = LoginAttemptLogger(
+    queue_size=Config.LOGIN_LOG_QUEUE_SIZE,
+    batch_size=Config.LOGIN_LOG_BATCH_SIZE,
+    flush_interval=Config.LOGIN_LOG_FLUSH_INTERVAL,
+    overflow=Config.LOGIN_LOG_OVERFLOW
+)
+
+# Recent failures per username, answering lockout checks without a query
+lockout_tracker = LockoutTracker(
+    max_attempts=Config.MAX_LOGIN_ATTEMPTS,
+    window=Config.ACCOUNT_LOCKOUT_DURATION,
+    max_tracked=Config.LOCKOUT_MAX_TRACKED,
+    retry_interval=Config.LOCKOUT_REBUILD_RETRY
+)
+
+def check_password(password_hash, password):
+    """
+    Verify a password on the hashing pool worker
+    
+    Returns:
+        tuple: (bool verified, bool needs_rehash)
+    """
+    try:
+        ph.verify(password_hash, password)
+    except VerifyMismatchError:
+        return False, False
+    
+    # Check if password needs rehashing (best practice)
+    if ph.check_needs_rehash(password_hash):
+        logger.info("Password needs rehashing")
+        return True, True
+    return True, False
+
+# Expired sessions and old login attempts are pruned in small batches.
+# Attempts are kept at least as long as the lockout window needs them.
+retention_sweeper = RetentionSweeper(
+    interval=Config.RETENTION_SWEEP_INTERVAL,
+    batch_size=Config.RETENTION_BATCH_SIZE,
+    session_retention=Config.SESSION_TIMEOUT + Config.SESSION_RETENTION,
+    attempt_retention=max(Config.LOGIN_ATTEMPT_RETENTION, Config.ACCOUNT_LOCKOUT_DURATION)
+)
+
 class AuthManager:
     """Handles user authentication and password operations"""
     
@@ -33,12 +141,20 @@ class AuthManager:
             
         Returns:
             str: Hashed password
+            
+        Raises:
+            HashingPoolFull: If the hashing queue is at capacity
         """
+        started = time.perf_counter()
         try:
-            return ph.hash(password)
+            return hashing_pool.run(ph.hash, password)
+        except HashingPoolFull:
+            raise
         except Exception as e:
             logger.error(f"Password hashing error: {e}")
             raise
+        finally:
+            password_seconds.observe(time.perf_counter() - started, 'hash')
     
     @staticmethod
     def verify_password(password_hash, password):
@@ -51,22 +167,20 @@ class AuthManager:
             
         Returns:
             tuple: (bool verified, bool needs_rehash)
+            
+        Raises:
+            HashingPoolFull: If the hashing queue is at capacity
         """
+        started = time.perf_counter()
         try:
-            ph.verify(password_hash, password)
-            
-            # Check if password needs rehashing (best practice)
-            if ph.check_needs_rehash(password_hash):
-                logger.info("Password needs rehashing")
-                return True, True
-            
-            return True, False
-            
-        except VerifyMismatchError:
-            return False, False
+            return hashing_pool.run(check_password, password_hash, password)
+        except HashingPoolFull:
+            raise
         except Exception as e:
             logger.error(f"Password verification error: {e}")
             return False, False
+        finally:
+            password_seconds.observe(time.perf_counter() - started, 'verify')
     
     @staticmethod
     def generate_user_id(username, email):
@@ -103,20 +217,64 @@ class AuthManager:
         """
         session_id = AuthManager.generate_session_id()
         
-        query = """
-            INSERT INTO user_sessions 
-            (session_id, user_id, ip_address, user_agent)
-            VALUES (%s, %s, %s, %s)
+        try:
+            Database.execute_query(CREATE_SESSION_QUERY,
+                                   (session_id, user_id, ip_address, user_agent, datetime.now()))
+            logger.info(f"Session created for user: {user_id}")
+            return session_id
+        except Exception as e:
+            logger.error(f"Session creation error: {e}")
+            raise
+    
+    @staticmethod
+    def complete_login(user_id, ip_address='', user_agent='', new_password_hash=None):
+        """
+        Record a successful login in a single statement
+        
+        Creates the session; the database trigger on user_sessions sets
+        last_login in the same statement. A password hash that needs
+        rehashing is replaced in the same transaction.
+        
+        Args:
+            user_id (str): User ID
+            ip_address (str): User's IP address
+            user_agent (str): User's browser user agent
+            new_password_hash (str): Replacement hash, or None to keep the current one
+            
+        Returns:
+            str: Session ID
         """
+        session_id = AuthManager.generate_session_id()
+        
+        now = datetime.now()
         
         try:
-            Database.execute_query(query, (session_id, user_id, ip_address, user_agent))
+            if new_password_hash is None:
+                Database.execute_query(CREATE_SESSION_QUERY, (session_id, user_id, ip_address, user_agent, now))
+            else:
+                with Database.transaction() as cursor:
+                    cursor.execute(CREATE_SESSION_QUERY, (session_id, user_id, ip_address, user_agent, now))
+                    cursor.execute(REHASH_QUERY, (new_password_hash, user_id))
             logger.info(f"Session created for user: {user_id}")
             return session_id
         except Exception as e:
-            logger.error(f"Session creation error: {e}")
+            logger.error(f"Login completion error: {e}")
             raise
     
+    @staticmethod
+    def prime_session(session_id, user):
+        """
+        Cache a new session from its login row
+        
+        The page a login redirects to validates the session first; with
+        the entry cached that check needs no query.
+        
+        Args:
+            session_id (str): Session ID from complete_login()
+            user (dict): The LOGIN_QUERY row of the user who logged in
+        """
+        session_cache.set(session_id, {field: user[field] for field in SESSION_FIELDS})
+    
     @staticmethod
     def validate_session(session_id):
         """
@@ -128,22 +286,24 @@ class AuthManager:
         Returns:
             dict: User data if valid, None otherwise
         """
-        query = """
-            SELECT u.user_id, u.username, u.full_name, u.role, u.status
-            FROM user_sessions s
-            JOIN users u ON s.user_id = u.user_id
-            WHERE s.session_id = %s 
-            AND s.is_active = TRUE
-            AND u.status = 'Active'
-            AND s.last_activity > DATE_SUB(NOW(), INTERVAL 1 HOUR)
-        """
+        # Request bodies are arbitrary JSON; a list would not even hash
+        if not isinstance(session_id, str):
+            return None
+        
+        cached = session_cache.get(session_id)
+        if cached is not None:
+            activity_buffer.touch(session_id)
+            return dict(cached)
         
+        # A logout racing this query must not find the session cached again
+        generation = session_cache.generation()
         try:
-            result = Database.execute_query(query, (session_id,), fetch=True)
+            expires_before = datetime.now() - timedelta(seconds=Config.SESSION_TIMEOUT)
+            result = Database.execute_query(SESSION_QUERY, (session_id, expires_before), fetch=True)
             if result:
-                # Update last activity
-                update_query = "UPDATE user_sessions SET last_activity = NOW() WHERE session_id = %s"
-                Database.execute_query(update_query, (session_id,))
+                # Update last activity (written behind in batches)
+                activity_buffer.touch(session_id)
+                session_cache.set(session_id, dict(result[0]), since=generation)
                 return result[0]
             return None
         except Exception as e:
@@ -153,25 +313,41 @@ class AuthManager:
     @staticmethod
     def logout(session_id):
         """Deactivate a user session"""
-        query = "UPDATE user_sessions SET is_active = FALSE WHERE session_id = %s"
+        if not isinstance(session_id, str):
+            return
+        session_cache.invalidate(session_id)
+        activity_buffer.discard(session_id)
         try:
-            Database.execute_query(query, (session_id,))
+            Database.execute_query(LOGOUT_QUERY, (datetime.now(), session_id))
             logger.info(f"Session logged out: {session_id}")
         except Exception as e:
             logger.error(f"Logout error: {e}")
             raise
     
     @staticmethod
-    def log_login_attempt(username, success, ip_address='', failure_reason=''):
-        """Log a login attempt for security tracking"""
-        query = """
-            INSERT INTO login_attempts 
-            (username, ip_address, success, failure_reason)
-            VALUES (%s, %s, %s, %s)
+    def invalidate_user_sessions(user_id):
         """
+        Drop cached sessions for a user
+        
+        Must be called whenever a user is deleted or their status changes,
+        otherwise cached sessions stay valid until their TTL runs out.
         
+        Args:
+            user_id (str): User ID
+        """
+        removed = session_cache.invalidate_where(
+            lambda session_id, user: user['user_id'] == user_id
+        )
+        if removed:
+            logger.info(f"Invalidated {removed} cached session(s) for user: {user_id}")
+    
+    @staticmethod
+    def log_login_attempt(username, success, ip_address='', failure_reason=''):
+        """Log a login attempt for security tracking (written in the background)"""
         try:
-            Database.execute_query(query, (username, ip_address, success, failure_reason))
+            if not success:
+                lockout_tracker.record_failure(username)
+            attempt_logger.log(username, success, ip_address, failure_reason)
         except Exception as e:
             logger.error(f"Error logging login attempt: {e}")
     
@@ -186,26 +362,10 @@ class AuthManager:
         Returns:
             tuple: (is_locked: bool, remaining_time_minutes: int)
         """
-        query = """
-            SELECT COUNT(*) as failed_count,
-                   MAX(attempt_time) as last_attempt
-            FROM login_attempts
-            WHERE username = %s
-            AND success = FALSE
-            AND attempt_time > DATE_SUB(NOW(), INTERVAL 15 MINUTE)
-        """
-        
         try:
-            result = Database.execute_query(query, (username,), fetch=True)
-            if result and len(result) > 0:
-                failed_count = result[0]['failed_count']
-                if failed_count >= 5:
-                    last_attempt = result[0]['last_attempt']
-                    if last_attempt:
-                        lockout_end = last_attempt + timedelta(minutes=15)
-                        remaining = (lockout_end - datetime.now()).total_seconds() / 60
-                        if remaining > 0:
-                            return True, int(remaining)
+            is_locked, remaining = lockout_tracker.check(username)
+            if is_locked:
+                return True, int(remaining / 60)
             return False, 0
         except Exception as e:
             logger.error(f"Error checking account lockout: {e}")
@@ -0,0 +1,131 @@
+# backend/cache.py
+import time
+import threading
+from collections import OrderedDict
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache with a fixed time-to-live per entry
+    
+    A value read from the database while another thread invalidates its
+    key must not be stored afterwards. Readers take generation() before
+    the read and pass it to set(since=...), which then refuses values
+    older than an invalidation of the key (or of everything).
+    """
+    
+    def __init__(self, max_size, ttl):
+        """
+        Args:
+            max_size (int): Maximum number of entries kept
+            ttl (float): Seconds an entry stays valid after it is stored
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        # key -> generation of its last invalidate(), at most max_size keys;
+        # forgotten ones raise _floor, which rejects every older value
+        self._invalidated = OrderedDict()
+        self._floor = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._stale_sets = 0
+    
+    def generation(self):
+        """Token to pass to set(since=...) for a value about to be read"""
+        with self._lock:
+            return self._generation
+    
+    def get(self, key):
+        """Return the cached value, or None if missing or expired"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            
+            expires_at, value = entry
+            if expires_at <= now:
+                del self._data[key]
+                self._misses += 1
+                return None
+            
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+    
+    def set(self, key, value, since=None):
+        """
+        Store a value, evicting the least recently used entry if full
+        
+        Args:
+            since (int): generation() from before the value was read; the
+                         value is dropped if the key was invalidated since
+                         
+        Returns:
+            bool: False if the value was dropped as stale
+        """
+        expires_at = time.monotonic() + self.ttl
+        with self._lock:
+            if since is not None and (self._floor > since or self._invalidated.get(key, 0) > since):
+                self._stale_sets += 1
+                return False
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+                self._evictions += 1
+            return True
+    
+    def invalidate(self, key):
+        """Remove a single entry, and refuse values for it read before now"""
+        with self._lock:
+            self._data.pop(key, None)
+            self._generation += 1
+            self._invalidated[key] = self._generation
+            self._invalidated.move_to_end(key)
+            while len(self._invalidated) > self.max_size:
+                _, generation = self._invalidated.popitem(last=False)
+                self._floor = max(self._floor, generation)
+    
+    def invalidate_where(self, predicate):
+        """
+        Remove every entry for which predicate(key, value) is true
+        
+        Returns:
+            int: Number of entries removed
+        """
+        with self._lock:
+            stale = [key for key, (_, value) in self._data.items() if predicate(key, value)]
+            for key in stale:
+                del self._data[key]
+            # Values still being read cannot be tested; refuse them all
+            self._generation += 1
+            self._floor = self._generation
+            return len(stale)
+    
+    def clear(self):
+        """Remove all entries"""
+        with self._lock:
+            self._data.clear()
+            self._generation += 1
+            self._floor = self._generation
+    
+    def stats(self):
+        """Return size and hit/miss counters"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                'size': len(self._data),
+                'max_size': self.max_size,
+                'ttl_seconds': self.ttl,
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions,
+                'stale_sets': self._stale_sets,
+                'hit_rate': round(self._hits / lookups, 4) if lookups else 0.0
+            }
@@ -1,78 +1,279 @@
 # backend/database.py
-import mysql.connector
-from mysql.connector import Error, pooling
+import time
+from contextlib import contextmanager
+from flask import g, has_request_context
 from app_config import Config  
+from backend.pool import ConnectionPool, PoolError
+from backend.drivers import create_driver
+from backend.metrics import db_query_seconds, db_transaction_seconds, db_checkout_seconds
+from backend.profiler import query_profiler, ProfiledCursor
 import logging
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Server errors after which a prepared statement is dropped and the query
+# is re-sent as text: unknown statement handler, unsupported in prepared
+# protocol, too many prepared statements, statement needs re-preparation
+ER_UNSUPPORTED_PS = 1295
+PREPARE_FALLBACK_ERRORS = {1243, ER_UNSUPPORTED_PS, 1461, 1615}
+
 class Database:
     """Database connection manager"""
     
+    _driver = None
     _connection_pool = None
+    _unpreparable = set()
+    
+    @classmethod
+    def driver(cls):
+        """The configured driver (Config.DB_DRIVER), created on first use"""
+        if cls._driver is None:
+            cls._driver = create_driver()
+        return cls._driver
+    
+    @classmethod
+    def use_driver(cls, driver):
+        """
+        Switch to another driver, closing the current pool
+        
+        For benchmarks and tests; the app uses Config.DB_DRIVER.
+        """
+        if cls._connection_pool is not None:
+            cls._connection_pool.close()
+        cls._connection_pool = None
+        cls._unpreparable = set()
+        cls._driver = driver
     
     @classmethod
     def initialize_pool(cls):
         """Initialize database connection pool"""
+        driver = cls.driver()
+        size = Config.DB_POOL_SIZE
+        max_overflow = Config.DB_POOL_MAX_OVERFLOW
+        if driver.max_connections is not None:
+            size = min(size, driver.max_connections)
+            max_overflow = 0
         try:
-            cls._connection_pool = pooling.MySQLConnectionPool(
-                pool_name="dr3_pool",
-                pool_size=5,
-                pool_reset_session=True,
-                host=Config.DB_HOST,
-                port=Config.DB_PORT,
-                database=Config.DB_NAME,
-                user=Config.DB_USER,
-                password=Config.DB_PASSWORD
+            pool = ConnectionPool(
+                connect=driver.connect,
+                size=size,
+                max_overflow=max_overflow,
+                timeout=Config.DB_POOL_TIMEOUT,
+                recycle=Config.DB_POOL_RECYCLE,
+                ping_idle=Config.DB_POOL_PING_IDLE,
+                statement_cache_size=Config.DB_STATEMENT_CACHE_SIZE
             )
-            logger.info("✅ Database connection pool initialized")
-        except Error as e:
+            # Open one connection up front so bad settings fail early
+            pool.acquire().close()
+            cls._connection_pool = pool
+            logger.info(f"✅ Database connection pool initialized ({driver.describe()})")
+        except driver.Error as e:
             logger.error(f"❌ Database connection error: {e}")
-            logger.error(f"Host: {Config.DB_HOST}, Port: {Config.DB_PORT}")
-            logger.error(f"Database: {Config.DB_NAME}, User: {Config.DB_USER}")
+            logger.error(f"Target: {driver.describe()}")
             raise
     
     @classmethod
     def get_connection(cls):
-        """Get a connection from the pool"""
+        """
+        Get a connection from the pool
+        
+        Inside a Flask request the same connection is returned for every
+        call and released by release_request_connection() at teardown.
+        """
+        if has_request_context():
+            connection = g.get('_db_connection')
+            if connection is None:
+                connection = cls._checkout()
+                connection.pinned = True
+                g._db_connection = connection
+            return connection
+        
+        return cls._checkout()
+    
+    @classmethod
+    def _checkout(cls):
         if cls._connection_pool is None:
             cls.initialize_pool()
         
+        started = time.perf_counter()
         try:
-            connection = cls._connection_pool.get_connection()
-            return connection
-        except Error as e:
+            return cls._connection_pool.acquire()
+        except (PoolError, cls.driver().Error) as e:
             logger.error(f"Error getting connection: {e}")
             raise
+        finally:
+            db_checkout_seconds.observe(time.perf_counter() - started)
     
     @staticmethod
-    def execute_query(query, params=None, fetch=False):
-        """Execute a database query"""
+    def release_request_connection():
+        """Return the connection pinned to the current request, if any"""
+        connection = g.pop('_db_connection', None)
+        if connection is not None:
+            connection.release()
+    
+    @classmethod
+    def pool_stats(cls):
+        """Return connection pool counters"""
+        if cls._connection_pool is None:
+            return {}
+        return cls._connection_pool.stats()
+    
+    @classmethod
+    def explain(cls, query, params=None):
+        """
+        The driver's query plan for query, run with params
+        
+        Returns:
+            list: Plan rows as dicts
+        """
+        return cls.execute_query(cls.driver().explain(query), params, fetch=True)
+    
+    @staticmethod
+    def execute_query(query, params=None, fetch=False, prepared=None):
+        """
+        Execute a database query
+        
+        When prepared statements are enabled (Config.DB_PREPARED_STATEMENTS,
+        or prepared=True) the query is prepared once per pooled connection
+        and reused on later calls. If the server cannot prepare or has lost
+        the statement, the query falls back to the text protocol.
+        """
+        if prepared is None:
+            prepared = Config.DB_PREPARED_STATEMENTS
+        
+        started = time.perf_counter()
         connection = None
         cursor = None
+        cached = False
+        rows = None
         
         try:
             connection = Database.get_connection()
-            cursor = connection.cursor(dictionary=True)
             
-            cursor.execute(query, params or ())
+            if prepared and query not in Database._unpreparable:
+                cursor, cached = Database._execute_prepared(connection, query, params)
+            
+            if cursor is None:
+                cursor = connection.cursor(dictionary=True)
+                cursor.execute(query, params or ())
             
             if fetch:
                 result = cursor.fetchall()
+                rows = len(result)
                 return result
             else:
                 connection.commit()
+                rows = cursor.rowcount
                 return cursor.lastrowid
                 
-        except Error as e:
+        except Database.driver().Error as e:
             if connection:
                 connection.rollback()
             logger.error(f"Database query error: {e}")
             raise
             
         finally:
-            if cursor:
+            # Cached prepared cursors stay open with their connection
+            if cursor and not cached:
                 cursor.close()
             if connection:
-                connection.close()
\ No newline at end of file
+                connection.close()
+            elapsed = time.perf_counter() - started
+            db_query_seconds.observe(elapsed, 'read' if fetch else 'write')
+            query_profiler.record(query, params, elapsed, rows)
+    
+    @staticmethod
+    def _execute_prepared(connection, query, params):
+        """
+        Execute query through the connection's prepared statement cache
+        
+        Returns:
+            tuple: (cursor, True) on success, (None, False) to fall back
+        """
+        try:
+            cursor, statement = connection.prepared_cursor(query)
+            cursor.execute(statement, tuple(params or ()))
+            return cursor, True
+        except Database.driver().Error as e:
+            errno = getattr(e, 'errno', None)
+            if errno not in PREPARE_FALLBACK_ERRORS:
+                raise
+            connection.discard_statement(query)
+            if errno == ER_UNSUPPORTED_PS:
+                Database._unpreparable.add(query)
+            logger.warning(f"Prepared statement unavailable, using text protocol: {e}")
+            return None, False
+    
+    @staticmethod
+    def execute_many(query, params_list, chunk_size=None, cursor=None):
+        """
+        Execute a statement for every parameter tuple, in chunks
+        
+        Each chunk of an INSERT ... VALUES statement is sent as one multi-row
+        INSERT; other statements run row by row on the same connection.
+        Without a cursor every chunk runs in one transaction with a single
+        commit. Pass the cursor of an open Database.transaction() to join it.
+        
+        Args:
+            query (str): Statement with %s placeholders
+            params_list (iterable): Parameter tuples, consumed lazily
+            chunk_size (int): Rows per statement (default Config.DB_BATCH_SIZE)
+            cursor: Cursor from Database.transaction(), or None
+            
+        Returns:
+            int: Number of affected rows
+        """
+        if cursor is None:
+            with Database.transaction() as cursor:
+                return Database.execute_many(query, params_list, chunk_size, cursor)
+        
+        chunk_size = chunk_size or Config.DB_BATCH_SIZE
+        affected = 0
+        chunk = []
+        
+        for params in params_list:
+            chunk.append(params)
+            if len(chunk) >= chunk_size:
+                cursor.executemany(query, chunk)
+                affected += cursor.rowcount
+                chunk = []
+        
+        if chunk:
+            cursor.executemany(query, chunk)
+            affected += cursor.rowcount
+        
+        return affected
+    
+    @staticmethod
+    @contextmanager
+    def transaction():
+        """
+        Run several statements on one connection and commit once
+        
+        Usage:
+            with Database.transaction() as cursor:
+                cursor.execute(query, params)
+                
+        Commits when the block exits normally, rolls back on any exception.
+        """
+        started = time.perf_counter()
+        connection = Database.get_connection()
+        cursor = None
+        
+        try:
+            cursor = connection.cursor(dictionary=True)
+            if query_profiler.active:
+                yield ProfiledCursor(cursor, query_profiler)
+            else:
+                yield cursor
+            connection.commit()
+        except Exception as e:
+            connection.rollback()
+            logger.error(f"Database transaction error: {e}")
+            raise
+        finally:
+            if cursor:
+                cursor.close()
+            connection.close()
+            db_transaction_seconds.observe(time.perf_counter() - started)
@@ -0,0 +1,284 @@
+# backend/drivers.py
+import re
+import sqlite3
+import threading
+import logging
+from datetime import date, datetime
+from functools import lru_cache
+import mysql.connector
+from app_config import Config
+
+logger = logging.getLogger(__name__)
+
+ER_DUP_ENTRY = 1062
+
+# "Duplicate entry '<value>' for key '[table.]<key>'"; the value may hold
+# anything, so only the key name at the very end of the message is read
+MYSQL_DUPLICATE_KEY = re.compile(r"for key '(?:[^'.]*\.)?([^'.]+)'$")
+
+
+class MySQLDriver:
+    """
+    mysql.connector connections and MySQL dialect SQL
+    
+    Queries elsewhere are written in the subset both drivers understand
+    (%s placeholders, cutoffs passed as parameters); the statements that
+    cannot be written that way are produced here.
+    """
+    
+    name = 'mysql'
+    Error = mysql.connector.Error
+    IntegrityError = mysql.connector.IntegrityError
+    
+    # Appended to a SELECT that must lock the rows it reads
+    for_update = ' FOR UPDATE'
+    
+    # Appended to CREATE TABLE
+    table_options = ' ENGINE = InnoDB DEFAULT CHARSET = utf8mb4'
+    
+    version_query = "SELECT VERSION() AS version"
+    
+    # Most connections one database can use at once (None = no limit)
+    max_connections = None
+    
+    def connect(self):
+        """Open a new driver connection"""
+        return mysql.connector.connect(
+            host=Config.DB_HOST,
+            port=Config.DB_PORT,
+            database=Config.DB_NAME,
+            user=Config.DB_USER,
+            password=Config.DB_PASSWORD
+        )
+    
+    def describe(self):
+        """Connection target for log messages"""
+        return f"MySQL {Config.DB_USER}@{Config.DB_HOST}:{Config.DB_PORT}/{Config.DB_NAME}"
+    
+    def is_duplicate_key(self, error):
+        """True if error is a UNIQUE/PRIMARY KEY violation"""
+        return getattr(error, 'errno', None) == ER_DUP_ENTRY
+    
+    def duplicate_key(self, error):
+        """
+        Name of the key a duplicate-key error violated
+        
+        Returns:
+            str: Key name ('email', 'PRIMARY', ...), or None if error is
+                 not a duplicate-key error
+        """
+        if not self.is_duplicate_key(error):
+            return None
+        match = MYSQL_DUPLICATE_KEY.search(getattr(error, 'msg', None) or str(error))
+        return match.group(1) if match else None
+    
+    def limited_delete(self, table, condition, order_by):
+        """DELETE of at most %s rows (the last parameter), oldest first"""
+        return f"""
+            DELETE FROM {table}
+            WHERE {condition}
+            ORDER BY {order_by}
+            LIMIT %s
+        """
+    
+    def explain(self, query):
+        """Statement that shows the plan of query"""
+        return f"EXPLAIN {query}"
+    
+    def full_scans(self, plan):
+        """Tables a plan from explain() reads in full"""
+        return [row.get('table') for row in plan if row.get('type') == 'ALL']
+
+
+# %s -> ?, %% -> %
+PLACEHOLDER = re.compile(r'%([s%])')
+
+
+@lru_cache(maxsize=1024)
+def to_qmark(query):
+    """Rewrite a %s-style query for sqlite3's ? placeholders"""
+    return PLACEHOLDER.sub(lambda match: '?' if match.group(1) == 's' else '%', query)
+
+
+def _dict_row(cursor, row):
+    return {column[0]: value for column, value in zip(cursor.description, row)}
+
+
+def _parse_timestamp(value):
+    return datetime.fromisoformat(value.decode())
+
+
+def _parse_date(value):
+    return date.fromisoformat(value.decode())
+
+
+# Timestamps are stored as local-time 'YYYY-MM-DD HH:MM:SS' text, which
+# sorts and compares like MySQL TIMESTAMP and round-trips to datetime
+sqlite3.register_adapter(datetime, lambda value: value.isoformat(' '))
+sqlite3.register_adapter(date, lambda value: value.isoformat())
+sqlite3.register_converter('TIMESTAMP', _parse_timestamp)
+sqlite3.register_converter('DATE', _parse_date)
+
+
+class SQLiteCursor:
+    """sqlite3 cursor that accepts %s placeholders and returns dict rows"""
+    
+    def __init__(self, cursor, dictionary=False):
+        self._cursor = cursor
+        if dictionary:
+            self._cursor.row_factory = _dict_row
+    
+    def execute(self, query, params=()):
+        return self._cursor.execute(to_qmark(query), tuple(params or ()))
+    
+    def executemany(self, query, params_list):
+        return self._cursor.executemany(to_qmark(query), params_list)
+    
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class SQLiteConnection:
+    """sqlite3 connection with the mysql.connector methods Database uses"""
+    
+    def __init__(self, connection, shared=False):
+        self._connection = connection
+        self._shared = shared
+    
+    def cursor(self, dictionary=False, prepared=False):
+        # sqlite3 keeps its own per-connection statement cache, so a
+        # "prepared" cursor is an ordinary one
+        return SQLiteCursor(self._connection.cursor(), dictionary)
+    
+    def ping(self, reconnect=False):
+        self._connection.execute('SELECT 1')
+    
+    def close(self):
+        # The in-memory database lives as long as its one connection
+        if not self._shared:
+            self._connection.close()
+    
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+
+class SQLiteDriver:
+    """
+    Embedded SQLite database, file-backed or in memory
+    
+    Meant for benchmarks, tests and single-machine demos. File databases
+    use WAL so readers do not block the writer; SQLite still allows one
+    writer at a time, and waits up to busy_timeout seconds for it. An
+    in-memory database exists only inside one connection, so it is shared
+    by the whole process and the pool is limited to that connection.
+    """
+    
+    name = 'sqlite'
+    Error = sqlite3.Error
+    IntegrityError = sqlite3.IntegrityError
+    
+    # SQLite locks the whole database for writing instead
+    for_update = ''
+    
+    table_options = ''
+    
+    version_query = "SELECT sqlite_version() AS version"
+    
+    def __init__(self, path, busy_timeout=5.0):
+        """
+        Args:
+            path (str): Database file, or ':memory:'
+            busy_timeout (float): Seconds to wait for a write lock
+        """
+        self.path = path
+        self.busy_timeout = busy_timeout
+        self.memory = path == ':memory:'
+        self.max_connections = 1 if self.memory else None
+        self._shared = None
+        self._lock = threading.Lock()
+    
+    def connect(self):
+        """Open a new driver connection (the same one for :memory:)"""
+        if self.memory:
+            with self._lock:
+                if self._shared is None:
+                    self._shared = SQLiteConnection(self._open(), shared=True)
+                return self._shared
+        return SQLiteConnection(self._open())
+    
+    def _open(self):
+        connection = sqlite3.connect(
+            self.path,
+            timeout=self.busy_timeout,
+            detect_types=sqlite3.PARSE_DECLTYPES,
+            check_same_thread=False  # Pooled connections move between threads
+        )
+        connection.execute('PRAGMA foreign_keys = ON')
+        if not self.memory:
+            connection.execute('PRAGMA journal_mode = WAL')
+            connection.execute('PRAGMA synchronous = NORMAL')
+        return connection
+    
+    def describe(self):
+        """Connection target for log messages"""
+        return f"SQLite {self.path}"
+    
+    def is_duplicate_key(self, error):
+        """True if error is a UNIQUE/PRIMARY KEY violation"""
+        return isinstance(error, sqlite3.IntegrityError) and 'UNIQUE constraint failed' in str(error)
+    
+    def duplicate_key(self, error):
+        """
+        Column(s) of the constraint a duplicate-key error violated
+        
+        Returns:
+            str: Column name ('email', 'user_id', or 'a, b' for a composite
+                 key), or None if error is not a duplicate-key error
+        """
+        if not self.is_duplicate_key(error):
+            return None
+        # "UNIQUE constraint failed: users.email"; values are never included
+        columns = str(error).split('UNIQUE constraint failed:', 1)[1].split(',')
+        return ', '.join(column.strip().rsplit('.', 1)[-1] for column in columns)
+    
+    def limited_delete(self, table, condition, order_by):
+        """DELETE of at most %s rows (the last parameter), oldest first"""
+        # DELETE ... LIMIT needs a compile-time option; go through rowid
+        return f"""
+            DELETE FROM {table}
+            WHERE rowid IN (
+                SELECT rowid FROM {table}
+                WHERE {condition}
+                ORDER BY {order_by}
+                LIMIT %s
+            )
+        """
+    
+    def explain(self, query):
+        """Statement that shows the plan of query"""
+        return f"EXPLAIN QUERY PLAN {query}"
+    
+    def full_scans(self, plan):
+        """Tables a plan from explain() reads in full"""
+        # 'SCAN users' is a full scan; 'SCAN users USING INDEX x' walks an index
+        scans = []
+        for row in plan:
+            match = re.match(r'SCAN (?:TABLE )?(\w+)$', row.get('detail', ''))
+            if match:
+                scans.append(match.group(1))
+        return scans
+
+
+def create_driver(name=None):
+    """
+    Build the driver named by Config.DB_DRIVER (or name)
+    
+    Raises:
+        ValueError: If the driver name is unknown
+    """
+    name = (name or Config.DB_DRIVER).lower()
+    if name == 'mysql':
+        return MySQLDriver()
+    if name == 'sqlite':
+        return SQLiteDriver(Config.DB_SQLITE_PATH, Config.DB_SQLITE_BUSY_TIMEOUT)
+    raise ValueError(f"Unknown database driver: {name}")
@@ -0,0 +1,109 @@
+# backend/email_domains.py
+import time
+import threading
+import logging
+from email_validator import EmailUndeliverableError
+from email_validator.deliverability import validate_email_deliverability
+from backend.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+
+class DomainChecker:
+    """
+    Email domain deliverability check with a TTL cache
+    
+    Each domain is looked up in DNS at most once per ttl seconds; repeat
+    registrations from the same domain are answered from memory.
+    Timeouts and unreachable nameservers are let through (as
+    email_validator does) and cached for the shorter unknown_ttl, so an
+    outage costs one timeout per domain per unknown_ttl rather than one
+    per registration.
+    """
+    
+    def __init__(self, cache_size, ttl, timeout, lookup=None, unknown_ttl=60):
+        """
+        Args:
+            cache_size (int): Domains kept in the cache
+            ttl (float): Seconds a domain result stays cached
+            timeout (float): DNS timeout per lookup in seconds
+            lookup (callable): lookup(domain, domain_i18n, timeout), raises
+                               EmailUndeliverableError; defaults to
+                               email_validator's DNS check (swap for tests)
+            unknown_ttl (float): Seconds an unknown result is allowed
+                                 before the domain is looked up again
+        """
+        self.timeout = timeout
+        self._lookup = lookup or validate_email_deliverability
+        self._cache = TTLCache(cache_size, ttl)
+        self._unknown_cache = TTLCache(cache_size, unknown_ttl)
+        self._lock = threading.Lock()
+        self._lookups = 0
+        self._unknown = 0
+        self._lookup_time_total = 0.0
+        self._lookup_time_max = 0.0
+    
+    def check(self, domain, domain_i18n=None):
+        """
+        Check that a domain accepts email
+        
+        Args:
+            domain (str): ASCII (IDNA) domain name
+            domain_i18n (str): Domain as typed, used in messages
+            
+        Raises:
+            EmailUndeliverableError: If the domain does not accept email
+        """
+        key = domain.lower()
+        message = self._cache.get(key)
+        if message is None:
+            message = self._unknown_cache.get(key)
+        if message is None:
+            message = self._resolve(key, domain_i18n or domain)
+        
+        if message:
+            raise EmailUndeliverableError(message)
+    
+    def _resolve(self, domain, domain_i18n):
+        started = time.perf_counter()
+        try:
+            info = self._lookup(domain, domain_i18n, timeout=self.timeout)
+            message = ''
+        except EmailUndeliverableError as e:
+            info = None
+            message = str(e)
+        finally:
+            self._record(time.perf_counter() - started)
+        
+        if info and 'unknown-deliverability' in info:
+            logger.warning(f"Deliverability of {domain} unknown: {info['unknown-deliverability']}")
+            with self._lock:
+                self._unknown += 1
+            self._unknown_cache.set(domain, '')
+        else:
+            self._cache.set(domain, message)
+        return message
+    
+    def _record(self, elapsed):
+        with self._lock:
+            self._lookups += 1
+            self._lookup_time_total += elapsed
+            self._lookup_time_max = max(self._lookup_time_max, elapsed)
+    
+    def clear(self):
+        """Forget all cached domains"""
+        self._cache.clear()
+        self._unknown_cache.clear()
+    
+    def stats(self):
+        """Return cache counters and DNS lookup latency"""
+        with self._lock:
+            lookups = self._lookups
+            return {
+                'cache': self._cache.stats(),
+                'unknown_cache': self._unknown_cache.stats(),
+                'lookups': lookups,
+                'unknown_results': self._unknown,
+                'avg_lookup_ms': round(self._lookup_time_total / lookups * 1000, 2) if lookups else 0.0,
+                'max_lookup_ms': round(self._lookup_time_max * 1000, 2)
+            }
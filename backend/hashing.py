@@ -0,0 +1,182 @@
+# backend/hashing.py
+import os
+import time
+import asyncio
+import threading
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from app_config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class HashingPoolFull(Exception):
+    """Raised when the hashing queue is at capacity"""
+    
+    def __init__(self, retry_after):
+        super().__init__("Password hashing queue is full")
+        self.retry_after = retry_after
+
+
+class HashingPool:
+    """
+    Bounded worker pool for Argon2 hashing and verification
+    
+    argon2-cffi releases the GIL while hashing, so a thread pool is enough to
+    spread work across cores. Admission is limited to workers + queue_size
+    jobs; anything beyond that is rejected with HashingPoolFull so callers
+    can answer 503 instead of queueing without limit.
+    """
+    
+    def __init__(self, workers, queue_size, retry_after=1):
+        self.workers = workers
+        self.queue_size = queue_size
+        self.retry_after = retry_after
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix='argon2'
+        )
+        self._slots = threading.BoundedSemaphore(workers + queue_size)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._running = 0
+        self._completed = 0
+        self._rejected = 0
+        self._hash_time_total = 0.0
+        self._hash_time_max = 0.0
+        self._wait_time_total = 0.0
+    
+    @staticmethod
+    def default_workers(memory_cost_kib, parallelism):
+        """
+        Size the pool from the CPU count and the memory budget
+        
+        Args:
+            memory_cost_kib (int): Argon2 memory cost per hash in KiB
+            parallelism (int): Argon2 lanes per hash
+            
+        Returns:
+            int: Number of concurrent hashes to allow
+        """
+        if Config.HASH_WORKERS > 0:
+            return Config.HASH_WORKERS
+        
+        cpu_workers = (os.cpu_count() or 1) // max(parallelism, 1)
+        memory_workers = (Config.HASH_MEMORY_BUDGET_MB * 1024) // memory_cost_kib
+        return max(1, min(cpu_workers, memory_workers))
+    
+    def run(self, fn, *args):
+        """
+        Run fn(*args) on the pool and wait for the result
+        
+        Raises:
+            HashingPoolFull: If the queue is at capacity
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise HashingPoolFull(self.retry_after)
+        
+        with self._lock:
+            self._pending += 1
+        
+        try:
+            future = self._executor.submit(self._timed, fn, time.perf_counter(), *args)
+        except Exception:
+            self._finish(0.0)
+            raise
+        
+        return future.result()
+    
+    async def run_async(self, fn, *args):
+        """
+        Like run(), but awaits the result instead of blocking the thread
+        
+        For the asyncio auth path: the event loop keeps serving other
+        requests while the hash runs on a worker.
+        
+        Raises:
+            HashingPoolFull: If the queue is at capacity
+        """
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise HashingPoolFull(self.retry_after)
+        
+        with self._lock:
+            self._pending += 1
+        
+        try:
+            future = self._executor.submit(self._timed, fn, time.perf_counter(), *args)
+        except Exception:
+            self._finish(0.0)
+            raise
+        
+        return await asyncio.wrap_future(future)
+    
+    def run_many(self, fn, args_list):
+        """
+        Run fn(*args) for every args tuple and return the results in order
+        
+        Meant for bulk jobs: instead of being rejected they wait for free
+        slots, and never hold more than `workers` of them, so the rest of
+        the queue stays available to interactive requests.
+        """
+        limiter = threading.BoundedSemaphore(self.workers)
+        futures = []
+        
+        for args in args_list:
+            limiter.acquire()
+            self._slots.acquire()
+            with self._lock:
+                self._pending += 1
+            try:
+                future = self._executor.submit(self._timed, fn, time.perf_counter(), *args)
+            except Exception:
+                self._finish(0.0)
+                raise
+            future.add_done_callback(lambda _: limiter.release())
+            futures.append(future)
+        
+        return [future.result() for future in futures]
+    
+    def _timed(self, fn, queued_at, *args):
+        started = time.perf_counter()
+        with self._lock:
+            self._running += 1
+            self._wait_time_total += started - queued_at
+        
+        try:
+            return fn(*args)
+        finally:
+            self._finish(time.perf_counter() - started, ran=True)
+    
+    def _finish(self, elapsed, ran=False):
+        with self._lock:
+            self._pending -= 1
+            if ran:
+                self._running -= 1
+                self._completed += 1
+                self._hash_time_total += elapsed
+                self._hash_time_max = max(self._hash_time_max, elapsed)
+        self._slots.release()
+    
+    def stats(self):
+        """Return queue depth and timing counters"""
+        with self._lock:
+            completed = self._completed
+            return {
+                'workers': self.workers,
+                'queue_size': self.queue_size,
+                'in_flight': self._running,
+                'queue_depth': self._pending - self._running,
+                'completed': completed,
+                'rejected': self._rejected,
+                'avg_hash_ms': round(self._hash_time_total / completed * 1000, 2) if completed else 0.0,
+                'max_hash_ms': round(self._hash_time_max * 1000, 2),
+                'avg_wait_ms': round(self._wait_time_total / completed * 1000, 2) if completed else 0.0
+            }
+    
+    def shutdown(self):
+        """Stop accepting work and wait for running hashes"""
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,222 @@
+# backend/inventory.py
+import re
+import logging
+from backend.database import Database
+
+logger = logging.getLogger(__name__)
+
+PRODUCT_COLUMNS = """
+    product_id, sku, name, category, stock, min_stock, price, description,
+    stock_status, created_at, updated_at
+"""
+
+# Words of a name or SKU; dashed groups such as 'hdw-001' stay whole
+TERM_PATTERN = re.compile(r'[a-z0-9]+(?:-[a-z0-9]+)*')
+
+# Longest stored term (product_search_terms.term) and most query words used
+MAX_TERM_LENGTH = 50
+MAX_QUERY_TERMS = 5
+
+INSERT_PRODUCT_QUERY = """
+    INSERT INTO products (sku, name, category, stock, min_stock, price, description)
+    VALUES (%s, %s, %s, %s, %s, %s, %s)
+"""
+
+UPDATE_PRODUCT_QUERY = """
+    UPDATE products
+    SET sku = %s, name = %s, category = %s, stock = %s, min_stock = %s,
+        price = %s, description = %s
+    WHERE product_id = %s
+"""
+
+INSERT_TERM_QUERY = "INSERT INTO product_search_terms (term, product_id) VALUES (%s, %s)"
+
+DELETE_TERMS_QUERY = "DELETE FROM product_search_terms WHERE product_id = %s"
+
+
+def search_terms(name, sku):
+    """
+    Index terms for a product: every word of its name and SKU, plus the
+    parts of dashed words, so 'HDW-001' is found by 'hdw-0', 'hdw' and '001'
+    
+    Returns:
+        set: Lower-cased terms
+    """
+    terms = set()
+    for word in TERM_PATTERN.findall(f"{name} {sku}".lower()):
+        terms.add(word[:MAX_TERM_LENGTH])
+        if '-' in word:
+            terms.update(part[:MAX_TERM_LENGTH] for part in word.split('-'))
+    return terms
+
+
+def query_terms(text):
+    """Words of a search box query, each matched as a term prefix"""
+    return TERM_PATTERN.findall(text.lower())[:MAX_QUERY_TERMS]
+
+
+def prefix_pattern(value):
+    """LIKE pattern matching values that start with value ('!' escapes)"""
+    return value.replace('!', '!!').replace('%', '!%').replace('_', '!_') + '%'
+
+
+def build_search(text=None, sku=None, category=None, stock=None, after=None, limit=25):
+    """
+    Product search statement, in name order
+    
+    Every filter is an index range: query words through the primary key
+    of product_search_terms, the SKU prefix through the unique SKU index,
+    and category or stock status through indexes that end in
+    (name, product_id), which also serve the ORDER BY.
+    
+    Args:
+        text (str): Search box text; every word must prefix a name/SKU word
+        sku (str): SKU prefix
+        category (str): Only this category, or None
+        stock (str): 'low', 'critical' or None for every product
+        after (list): [name, product_id] of the previous page's last row
+        limit (int): Maximum rows returned
+        
+    Returns:
+        tuple: (query, params)
+    """
+    conditions = []
+    params = []
+    
+    for term in query_terms(text or ''):
+        conditions.append("""product_id IN (
+            SELECT product_id FROM product_search_terms WHERE term LIKE %s ESCAPE '!'
+        )""")
+        params.append(prefix_pattern(term))
+    if sku:
+        conditions.append("sku LIKE %s ESCAPE '!'")
+        params.append(prefix_pattern(sku.upper()))
+    if category:
+        conditions.append("category = %s")
+        params.append(category)
+    if stock:
+        conditions.append("stock_status = %s")
+        params.append(stock)
+    if after:
+        conditions.append("(name > %s OR (name = %s AND product_id > %s))")
+        params.extend([after[0], after[0], after[1]])
+    
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    query = f"""
+        SELECT {PRODUCT_COLUMNS}
+        FROM products
+        {where}
+        ORDER BY name, product_id
+        LIMIT %s
+    """
+    params.append(limit)
+    return query, tuple(params)
+
+
+def _product(row):
+    # DECIMAL comes back as Decimal from MySQL; the page does arithmetic on it
+    row['price'] = float(row['price'])
+    return row
+
+
+class InventoryManager:
+    """Product catalogue reads and writes, keeping search terms in step"""
+    
+    @staticmethod
+    def search(text=None, sku=None, category=None, stock=None, after=None, limit=25):
+        """
+        Fetch a page of products (see build_search for the arguments)
+        
+        Returns:
+            list: Product rows
+        """
+        query, params = build_search(text, sku, category, stock, after, limit)
+        return [_product(row) for row in Database.execute_query(query, params, fetch=True)]
+    
+    @staticmethod
+    def get(product_id):
+        """
+        Fetch one product
+        
+        Returns:
+            dict: The product, or None if it does not exist
+        """
+        rows = Database.execute_query(
+            f"SELECT {PRODUCT_COLUMNS} FROM products WHERE product_id = %s",
+            (product_id,), fetch=True
+        )
+        return _product(rows[0]) if rows else None
+    
+    @staticmethod
+    def create(product):
+        """
+        Insert a product and its search terms in one transaction
+        
+        Args:
+            product (dict): Validated sku, name, category, stock, min_stock,
+                            price and description
+                            
+        Returns:
+            int: New product_id
+            
+        Raises:
+            IntegrityError: If the SKU is taken (driver.is_duplicate_key)
+        """
+        with Database.transaction() as cursor:
+            cursor.execute(INSERT_PRODUCT_QUERY, (
+                product['sku'], product['name'], product['category'], product['stock'],
+                product['min_stock'], product['price'], product['description']
+            ))
+            product_id = cursor.lastrowid
+            Database.execute_many(INSERT_TERM_QUERY, (
+                (term, product_id) for term in search_terms(product['name'], product['sku'])
+            ), cursor=cursor)
+        
+        logger.info(f"Product created: {product['sku']} ({product_id})")
+        return product_id
+    
+    @staticmethod
+    def update(product_id, product):
+        """
+        Replace a product's fields and search terms in one transaction
+        
+        Returns:
+            bool: False if the product does not exist
+            
+        Raises:
+            IntegrityError: If the new SKU is taken (driver.is_duplicate_key)
+        """
+        check_query = ("SELECT product_id FROM products WHERE product_id = %s"
+                       + Database.driver().for_update)
+        
+        with Database.transaction() as cursor:
+            cursor.execute(check_query, (product_id,))
+            if not cursor.fetchall():
+                return False
+            cursor.execute(UPDATE_PRODUCT_QUERY, (
+                product['sku'], product['name'], product['category'], product['stock'],
+                product['min_stock'], product['price'], product['description'], product_id
+            ))
+            cursor.execute(DELETE_TERMS_QUERY, (product_id,))
+            Database.execute_many(INSERT_TERM_QUERY, (
+                (term, product_id) for term in search_terms(product['name'], product['sku'])
+            ), cursor=cursor)
+        
+        logger.info(f"Product updated: {product['sku']} ({product_id})")
+        return True
+    
+    @staticmethod
+    def delete(product_id):
+        """
+        Delete a product (its search terms go with it)
+        
+        Returns:
+            bool: False if the product does not exist
+        """
+        with Database.transaction() as cursor:
+            cursor.execute("DELETE FROM products WHERE product_id = %s", (product_id,))
+            deleted = cursor.rowcount > 0
+        
+        if deleted:
+            logger.info(f"Product deleted: {product_id}")
+        return deleted
@@ -0,0 +1,152 @@
+# backend/lockout.py
+import time
+import asyncio
+import threading
+import logging
+from datetime import datetime, timedelta
+from collections import OrderedDict, deque
+from backend.database import Database
+
+logger = logging.getLogger(__name__)
+
+REBUILD_QUERY = """
+    SELECT username, attempt_time
+    FROM login_attempts
+    WHERE success = FALSE
+    AND attempt_time > %s
+    ORDER BY attempt_time
+"""
+
+
+class LockoutTracker:
+    """
+    Per-username sliding window of failed login times
+    
+    Each username keeps a ring buffer of its last max_attempts failure
+    timestamps. The account is locked when the buffer is full and its
+    oldest entry is still inside the window. It stays locked until the
+    newest failure is window seconds old. Both checks are O(1).
+    
+    State is per process and is rebuilt from login_attempts on first use.
+    If the rebuild fails, checks answer from what is in memory and the
+    rebuild is retried at most once per retry_interval.
+    """
+    
+    def __init__(self, max_attempts, window, max_tracked, retry_interval=30):
+        """
+        Args:
+            max_attempts (int): Failures within the window that lock an account
+            window (float): Window and lockout length in seconds
+            max_tracked (int): Maximum usernames kept in memory
+            retry_interval (float): Seconds between rebuild attempts after
+                                    a failed one
+        """
+        self.max_attempts = max_attempts
+        self.window = window
+        self.max_tracked = max_tracked
+        self.retry_interval = retry_interval
+        self._failures = OrderedDict()
+        self._lock = threading.Lock()
+        self._loaded = False
+        self._retry_at = 0.0
+        self._rebuild_failures = 0
+        self._last_prune = time.time()
+        self._evictions = 0
+    
+    def record_failure(self, username, when=None):
+        """Record a failed login for username"""
+        self._ensure_loaded()
+        with self._lock:
+            self._append(username.lower(), when or time.time())
+    
+    def check(self, username, now=None):
+        """
+        Check whether username is locked out
+        
+        Returns:
+            tuple: (is_locked: bool, remaining_seconds: float)
+        """
+        self._ensure_loaded()
+        now = now or time.time()
+        with self._lock:
+            failures = self._failures.get(username.lower())
+            if not failures or len(failures) < self.max_attempts:
+                return False, 0
+            if failures[0] <= now - self.window:
+                return False, 0
+            remaining = failures[-1] + self.window - now
+            return (True, remaining) if remaining > 0 else (False, 0)
+    
+    async def load_async(self):
+        """
+        Run a due rebuild on a worker thread
+        
+        Await before check() or record_failure() in a coroutine so the
+        rebuild query never runs on the event loop.
+        """
+        if not self._loaded and time.time() >= self._retry_at:
+            await asyncio.get_running_loop().run_in_executor(None, self._ensure_loaded)
+    
+    def rebuild(self):
+        """Reload recent failures from the login_attempts table"""
+        since = datetime.now() - timedelta(seconds=self.window)
+        rows = Database.execute_query(REBUILD_QUERY, (since,), fetch=True)
+        
+        with self._lock:
+            self._failures.clear()
+            for row in rows:
+                self._append(row['username'].lower(), row['attempt_time'].timestamp())
+            self._loaded = True
+        logger.info(f"Lockout tracker rebuilt from {len(rows)} recent failure(s)")
+    
+    def stats(self):
+        """Return tracked username counts"""
+        now = time.time()
+        with self._lock:
+            locked = sum(
+                1 for failures in self._failures.values()
+                if len(failures) == self.max_attempts
+                and failures[0] > now - self.window
+            )
+            return {
+                'tracked_usernames': len(self._failures),
+                'locked_usernames': locked,
+                'evictions': self._evictions,
+                'loaded': self._loaded,
+                'rebuild_failures': self._rebuild_failures,
+                'max_attempts': self.max_attempts,
+                'window_seconds': self.window
+            }
+    
+    def _ensure_loaded(self):
+        if self._loaded or time.time() < self._retry_at:
+            return
+        try:
+            self.rebuild()
+        except Exception as e:
+            # Back off so an outage does not cost every login a failed query
+            with self._lock:
+                self._retry_at = time.time() + self.retry_interval
+                self._rebuild_failures += 1
+            logger.error(f"Error rebuilding lockout tracker, retrying in {self.retry_interval}s: {e}")
+    
+    def _append(self, key, timestamp):
+        failures = self._failures.get(key)
+        if failures is None:
+            failures = self._failures[key] = deque(maxlen=self.max_attempts)
+        failures.append(timestamp)
+        self._failures.move_to_end(key)
+        
+        if timestamp - self._last_prune > self.window or len(self._failures) > self.max_tracked:
+            self._prune(max(timestamp, time.time()))
+    
+    def _prune(self, now):
+        # Idle keys are dropped first; LRU keys only if still over the limit
+        cutoff = now - self.window
+        idle = [key for key, failures in self._failures.items() if failures[-1] <= cutoff]
+        for key in idle:
+            del self._failures[key]
+        while len(self._failures) > self.max_tracked:
+            self._failures.popitem(last=False)
+            self._evictions += 1
+        self._last_prune = now
@@ -0,0 +1,178 @@
+# backend/metrics.py
+import bisect
+import threading
+from app_config import Config
+
+# Seconds; from session cache hits to Argon2 under a queue
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05,
+    0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0
+)
+
+
+def _escape(value):
+    return str(value).replace('\\', r'\\').replace('"', r'\"').replace('\n', r'\n')
+
+
+def _labels(names, values, extra=''):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _number(value):
+    if value == float('inf'):
+        return '+Inf'
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Histogram:
+    """
+    Latency histogram with fixed buckets, one series per label tuple
+    
+    observe() is a bisect and three list updates under an uncontended
+    lock, about a microsecond; buckets are made cumulative only when the
+    histogram is rendered.
+    """
+    
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS, enabled=True):
+        """
+        Args:
+            name (str): Metric name, e.g. 'db_query_duration_seconds'
+            documentation (str): HELP text
+            labelnames (tuple): Label names, matched by position in observe()
+            buckets (tuple): Ascending upper bounds (+Inf is implied)
+            enabled (bool): False makes observe() a no-op
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self.enabled = enabled
+        self._series = {}  # label values -> [count per bucket..., count above, sum]
+        self._lock = threading.Lock()
+    
+    def observe(self, value, *labels):
+        """Record one value (seconds) for the given label values"""
+        if not self.enabled:
+            return
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(labels)
+            if series is None:
+                series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+            series[index] += 1
+            series[-1] += value
+    
+    def render(self):
+        """Prometheus text exposition lines"""
+        with self._lock:
+            snapshot = {labels: list(series) for labels, series in self._series.items()}
+        
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for labels, series in sorted(snapshot.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float('inf'),), series):
+                cumulative += count
+                le = f'le="{_number(bound)}"'
+                lines.append(f"{self.name}_bucket{_labels(self.labelnames, labels, le)} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.labelnames, labels)} {_number(series[-1])}")
+            lines.append(f"{self.name}_count{_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+    
+    def clear(self):
+        """Drop every series"""
+        with self._lock:
+            self._series.clear()
+
+
+class Gauge:
+    """Value read from a callback when metrics are rendered"""
+    
+    def __init__(self, name, documentation, callback):
+        """
+        Args:
+            name (str): Metric name
+            documentation (str): HELP text
+            callback (callable): Returns the current value
+        """
+        self.name = name
+        self.documentation = documentation
+        self.callback = callback
+    
+    def render(self):
+        """Prometheus text exposition lines"""
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} gauge"]
+        try:
+            value = self.callback()
+        except Exception:
+            return []  # Skip a gauge whose source is unavailable
+        if value is not None:
+            lines.append(f"{self.name} {_number(value)}")
+        return lines
+
+
+class MetricsRegistry:
+    """In-process metrics rendered in Prometheus text format"""
+    
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self._metrics = []
+        self._lock = threading.Lock()
+    
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        """Create and register a Histogram"""
+        return self._register(Histogram(name, documentation, labelnames, buckets, self.enabled))
+    
+    def gauge(self, name, documentation, callback):
+        """Create and register a callback Gauge"""
+        return self._register(Gauge(name, documentation, callback))
+    
+    def _register(self, metric):
+        with self._lock:
+            if any(existing.name == metric.name for existing in self._metrics):
+                raise ValueError(f"Metric already registered: {metric.name}")
+            self._metrics.append(metric)
+        return metric
+    
+    def render(self):
+        """The whole registry as a text/plain; version=0.0.4 payload"""
+        with self._lock:
+            metrics = list(self._metrics)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+
+metrics = MetricsRegistry(Config.METRICS_ENABLED)
+
+# Hot-path timers; observed in app.py, backend/database.py and backend/auth.py
+http_request_seconds = metrics.histogram(
+    'http_request_duration_seconds',
+    'Request latency by route template',
+    ('method', 'route', 'status')
+)
+
+db_query_seconds = metrics.histogram(
+    'db_query_duration_seconds',
+    'Database.execute_query latency, including checkout on first use in a request',
+    ('kind',)
+)
+
+db_transaction_seconds = metrics.histogram(
+    'db_transaction_duration_seconds',
+    'Database.transaction() block latency, from checkout to commit or rollback'
+)
+
+db_checkout_seconds = metrics.histogram(
+    'db_pool_checkout_duration_seconds',
+    'Time to check a connection out of the pool, including waits and reconnects'
+)
+
+password_seconds = metrics.histogram(
+    'password_hashing_duration_seconds',
+    'Argon2 hash/verify latency, including the hashing pool queue',
+    ('operation',)
+)
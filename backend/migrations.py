@@ -0,0 +1,249 @@
+# backend/migrations.py
+import os
+import re
+import hashlib
+import logging
+from datetime import datetime, timedelta
+from backend.database import Database
+from backend.auth import SESSION_QUERY, LOGIN_QUERY
+from backend.inventory import build_search
+from backend.lockout import REBUILD_QUERY
+from backend.photos import PHOTO_REFS_QUERY
+from backend.retention import SESSIONS_DELETE, ATTEMPTS_DELETE
+
+logger = logging.getLogger(__name__)
+
+# One subfolder per driver: database/migrations/mysql, .../sqlite
+MIGRATIONS_FOLDER = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'database', 'migrations'
+)
+
+# 0001_initial_schema.sql -> (1, 'initial_schema')
+MIGRATION_NAME = re.compile(r'^(?P<version>\d{4})_(?P<name>\w+)\.sql$')
+
+TRIGGER_START = re.compile(r'CREATE\s+TRIGGER\b', re.IGNORECASE)
+TRIGGER_END = re.compile(r'\bEND$', re.IGNORECASE)
+
+CREATE_MIGRATIONS_TABLE = """
+    CREATE TABLE IF NOT EXISTS schema_migrations (
+        version INT PRIMARY KEY,
+        name VARCHAR(100) NOT NULL,
+        checksum CHAR(64) NOT NULL,
+        applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    ){table_options}
+"""
+
+
+def hot_queries():
+    """
+    (name, query, params) for the hot query shapes
+    
+    Queries that live in module constants are imported so the check
+    cannot drift; the retention DELETEs are written by the driver.
+    """
+    driver = Database.driver()
+    now = datetime.now()
+    return (
+        ('login user lookup', LOGIN_QUERY, ('admin',)),
+        ('session validation', SESSION_QUERY, ('0' * 64, now - timedelta(hours=1))),
+        ('lockout rebuild', REBUILD_QUERY, (now - timedelta(minutes=15),)),
+        ('failed attempts for user', """
+            SELECT COUNT(*) AS failed_count
+            FROM login_attempts
+            WHERE username = %s
+            AND success = FALSE
+            AND attempt_time > %s
+        """, ('admin', now - timedelta(minutes=15))),
+        ('user list', """
+            SELECT user_id, username, full_name, email, phone, role, status,
+                   employment_date, created_at, last_login
+            FROM users
+            ORDER BY created_at DESC, user_id DESC
+            LIMIT %s
+        """, (51,)),
+        ('user list by role, next page', """
+            SELECT user_id, username, full_name, email, phone, role, status,
+                   employment_date, created_at, last_login
+            FROM users
+            WHERE role = %s
+            AND (created_at < %s OR (created_at = %s AND user_id < %s))
+            ORDER BY created_at DESC, user_id DESC
+            LIMIT %s
+        """, ('Cashier', '2030-01-01', '2030-01-01', 'f' * 32, 51)),
+        ('user list by status', """
+            SELECT user_id, username, full_name, email, phone, role, status,
+                   employment_date, created_at, last_login
+            FROM users
+            WHERE status = %s
+            ORDER BY created_at DESC, user_id DESC
+            LIMIT %s
+        """, ('Active', 51)),
+        ('photo references', PHOTO_REFS_QUERY, ('/uploads/photos/' + '0' * 64 + '.jpg',)),
+        ('username/email uniqueness', """
+            SELECT username, email
+            FROM users
+            WHERE username = %s OR email = %s
+        """, ('admin', 'admin@example.com')),
+        ('session retention sweep', driver.limited_delete(*SESSIONS_DELETE),
+         (now - timedelta(days=1), 500)),
+        ('attempt retention sweep', driver.limited_delete(*ATTEMPTS_DELETE),
+         (now - timedelta(days=30), 500)),
+        ('inventory list', *build_search(limit=26)),
+        ('inventory search, next page', *build_search('drill', after=['Drill', 10], limit=26)),
+        ('inventory sku prefix', *build_search(sku='HDW-', limit=26)),
+        ('inventory by category', *build_search(category='Tools', limit=26)),
+        ('inventory low stock', *build_search(stock='low', limit=26)),
+    )
+
+
+class MigrationError(Exception):
+    """Raised when migrations cannot be applied safely"""
+
+
+def split_statements(sql):
+    """Split a migration file into statements, dropping -- comments"""
+    lines = []
+    for line in sql.splitlines():
+        if line.strip().startswith('--'):
+            continue
+        lines.append(re.sub(r'\s--\s.*$', '', line))
+    
+    statements = []
+    pending = ''
+    for part in '\n'.join(lines).split(';'):
+        pending = f"{pending};{part}" if pending else part
+        statement = pending.strip()
+        # A trigger body has its own ';'s: keep going until its END
+        if TRIGGER_START.match(statement) and not TRIGGER_END.search(statement):
+            continue
+        if statement:
+            statements.append(statement)
+        pending = ''
+    return statements
+
+
+class MigrationRunner:
+    """
+    Versioned, forward-only schema migrations
+    
+    Migrations are database/migrations/<driver>/NNNN_name.sql files
+    applied in version order; each driver keeps its own dialect of the
+    same versions. Each applied version is recorded in schema_migrations
+    with the file's checksum; editing an applied file is an error - add a
+    new migration instead. MySQL commits DDL implicitly, so a migration
+    that fails half way must be finished by hand before re-running.
+    """
+    
+    def __init__(self, folder=None):
+        """
+        Args:
+            folder (str): Migration files (default: the driver's subfolder)
+        """
+        self.folder = folder or os.path.join(MIGRATIONS_FOLDER, Database.driver().name)
+    
+    def discover(self):
+        """
+        Returns:
+            list: (version, name, path) of every migration file, in order
+        """
+        migrations = []
+        for filename in sorted(os.listdir(self.folder)):
+            match = MIGRATION_NAME.match(filename)
+            if match:
+                migrations.append((int(match.group('version')), match.group('name'),
+                                   os.path.join(self.folder, filename)))
+        versions = [version for version, _, _ in migrations]
+        if len(versions) != len(set(versions)):
+            raise MigrationError("Duplicate migration version")
+        return migrations
+    
+    def applied(self):
+        """
+        Returns:
+            dict: version -> checksum of applied migrations
+        """
+        Database.execute_query(CREATE_MIGRATIONS_TABLE.format(
+            table_options=Database.driver().table_options
+        ))
+        rows = Database.execute_query(
+            "SELECT version, checksum FROM schema_migrations", fetch=True
+        )
+        return {row['version']: row['checksum'] for row in rows}
+    
+    def pending(self):
+        """
+        Returns:
+            list: (version, name, path) not applied yet
+            
+        Raises:
+            MigrationError: If an applied file changed or is missing
+        """
+        applied = self.applied()
+        migrations = self.discover()
+        known = {version for version, _, _ in migrations}
+        
+        missing = set(applied) - known
+        if missing:
+            raise MigrationError(f"Applied migration(s) missing from disk: {sorted(missing)}")
+        
+        pending = []
+        for version, name, path in migrations:
+            if version not in applied:
+                pending.append((version, name, path))
+            elif applied[version] != self._checksum(path):
+                raise MigrationError(f"Migration {version:04d}_{name} was edited after it was applied")
+        
+        if pending and applied and pending[0][0] < max(applied):
+            raise MigrationError(
+                f"Migration {pending[0][0]:04d} is older than the latest applied "
+                f"({max(applied):04d}); migrations are forward-only"
+            )
+        return pending
+    
+    def migrate(self):
+        """
+        Apply every pending migration in order
+        
+        Returns:
+            list: Names of the migrations applied
+        """
+        done = []
+        for version, name, path in self.pending():
+            with open(path, encoding='utf-8') as f:
+                statements = split_statements(f.read())
+            
+            logger.info(f"Applying migration {version:04d}_{name} ({len(statements)} statement(s))")
+            with Database.transaction() as cursor:
+                for statement in statements:
+                    cursor.execute(statement)
+                cursor.execute(
+                    "INSERT INTO schema_migrations (version, name, checksum) VALUES (%s, %s, %s)",
+                    (version, name, self._checksum(path))
+                )
+            done.append(f"{version:04d}_{name}")
+        return done
+    
+    @staticmethod
+    def _checksum(path):
+        with open(path, 'rb') as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+
+def check_query_plans(queries=None):
+    """
+    EXPLAIN every hot query and report full table scans
+    
+    Run against a database with realistic row counts: on nearly empty
+    tables MySQL may legitimately prefer a scan.
+    
+    Returns:
+        list: (name, table) pairs that use a full scan
+    """
+    driver = Database.driver()
+    failures = []
+    for name, query, params in queries or hot_queries():
+        plan = Database.execute_query(driver.explain(query), params, fetch=True)
+        for table in driver.full_scans(plan):
+            failures.append((name, table))
+    return failures
@@ -0,0 +1,78 @@
+# backend/pagination.py
+import base64
+import json
+from datetime import datetime
+
+
+class InvalidCursor(ValueError):
+    """Raised when a pagination cursor cannot be decoded"""
+
+
+def encode_cursor(*values):
+    """
+    Encode the sort key of the last row of a page as an opaque cursor
+
+    Args:
+        *values: Sort key values (datetimes are stored as ISO strings)
+
+    Returns:
+        str: URL-safe cursor
+    """
+    payload = [
+        {'dt': value.isoformat()} if isinstance(value, datetime) else value
+        for value in values
+    ]
+    raw = json.dumps(payload, separators=(',', ':')).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+
+def decode_cursor(cursor, length):
+    """
+    Decode a cursor produced by encode_cursor
+
+    Args:
+        cursor (str): Cursor from a previous page
+        length (int): Expected number of sort key values
+
+    Returns:
+        list: Sort key values
+
+    Raises:
+        InvalidCursor: If the cursor is malformed or holds anything but
+                       strings, numbers and datetimes
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except ValueError as e:
+        raise InvalidCursor(f"Invalid cursor: {e}") from e
+
+    if not isinstance(payload, list):
+        raise InvalidCursor("Invalid cursor payload")
+    if len(payload) != length:
+        raise InvalidCursor("Invalid cursor length")
+    return [_decode_value(value) for value in payload]
+
+
+def _decode_value(value):
+    # Only what encode_cursor writes reaches the SQL parameters
+    if isinstance(value, dict) and set(value) == {'dt'} and isinstance(value['dt'], str):
+        try:
+            return datetime.fromisoformat(value['dt'])
+        except ValueError as e:
+            raise InvalidCursor(f"Invalid cursor: {e}") from e
+    if isinstance(value, (str, int, float)) and not isinstance(value, bool):
+        return value
+    raise InvalidCursor("Invalid cursor value")
+
+
+def parse_limit(value, default, maximum):
+    """
+    Parse a page-size parameter, clamped to 1..maximum
+
+    Raises:
+        ValueError: If value is not an integer
+    """
+    if value in (None, ''):
+        return default
+    return max(1, min(int(value), maximum))
@@ -0,0 +1,293 @@
+# backend/photos.py
+import io
+import os
+import re
+import hashlib
+import threading
+import logging
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
+from app_config import Config
+from backend.database import Database
+
+logger = logging.getLogger(__name__)
+
+# Output sizes, largest first; the first one is stored as users.photo_path
+PHOTO_SIZES = (
+    ('avatar', 300),
+    ('thumb', 64)
+)
+
+READ_CHUNK_SIZE = 64 * 1024
+
+# Allowance for the non-file fields of a multipart form with a photo
+FORM_OVERHEAD_BYTES = 64 * 1024
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# {sha256}.jpg plus one {sha256}_{name}.jpg per smaller size
+STORED_NAME = re.compile(
+    r'^(?P<digest>[0-9a-f]{64})(?:_(?P<size>' +
+    '|'.join(name for name, _ in PHOTO_SIZES[1:]) +
+    r'))?\.jpg$'
+)
+
+# What the old uploader wrote: secure_filename(f"{username}_{%Y%m%d%H%M%S}.jpg")
+LEGACY_NAME = re.compile(r'^[A-Za-z0-9_]+_\d{14}\.jpg$')
+
+# Served by idx_users_photo_path (migration 0004)
+PHOTO_REFS_QUERY = "SELECT COUNT(*) AS refs FROM users WHERE photo_path = %s"
+
+
+class InvalidPhoto(ValueError):
+    """Raised when an upload is too large or is not a usable image"""
+
+
+def read_limited(stream, max_bytes, chunk_size=READ_CHUNK_SIZE):
+    """
+    Read a stream in chunks, giving up as soon as it exceeds max_bytes
+    
+    Raises:
+        InvalidPhoto: If the stream holds more than max_bytes
+    """
+    buffer = io.BytesIO()
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return buffer.getvalue()
+        if buffer.tell() + len(chunk) > max_bytes:
+            raise InvalidPhoto(f"File size must not exceed {max_bytes / (1024 * 1024):g}MB")
+        buffer.write(chunk)
+
+
+def variant_path(photo_path, name):
+    """Path of a size variant, derived from the stored (largest) photo path"""
+    if name == PHOTO_SIZES[0][0]:
+        return photo_path
+    stem, extension = os.path.splitext(photo_path)
+    return f"{stem}_{name}{extension}"
+
+
+class PhotoProcessor:
+    """
+    Decode and resize profile photos on a small worker pool
+    
+    Each upload is decoded once: JPEGs are decoded straight at a reduced
+    scale with draft(), other formats are shrunk with reduce() before the
+    final resample, and every size is cut from the next larger one. Pillow
+    releases the GIL while decoding and resampling, so the request thread
+    only waits instead of competing for the interpreter.
+    """
+    
+    def __init__(self, workers, quality=85, max_pixels=40_000_000):
+        """
+        Args:
+            workers (int): Concurrent photo jobs
+            quality (int): JPEG quality of the stored images
+            max_pixels (int): Largest decoded image accepted (width x height)
+        """
+        self.quality = quality
+        self.max_pixels = max_pixels
+        self._executor = ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix='photo'
+        )
+    
+    def process(self, data, photo_path):
+        """
+        Write every size of an uploaded image and wait for the result
+        
+        Args:
+            data (bytes): Uploaded file contents
+            photo_path (str): Destination of the largest size (.jpg)
+            
+        Returns:
+            dict: Size name -> written path
+            
+        Raises:
+            InvalidPhoto: If the data is not a JPEG/PNG image or is too big
+        """
+        return self._executor.submit(self.render, data, photo_path).result()
+    
+    def render(self, data, photo_path):
+        """Decode once and write every size (runs on the calling thread)"""
+        try:
+            image = Image.open(io.BytesIO(data))
+            if image.format not in ('JPEG', 'PNG'):
+                raise InvalidPhoto("Only JPG and PNG files are allowed")
+            if image.width * image.height > self.max_pixels:
+                raise InvalidPhoto("Image dimensions are too large")
+            
+            largest = PHOTO_SIZES[0][1]
+            if image.format == 'JPEG':
+                image.draft('RGB', (largest, largest))
+            factor = min(image.width, image.height) // (largest * 2)
+            if factor > 1:
+                image = image.reduce(factor)
+            image = self._to_rgb(image)
+        except InvalidPhoto:
+            raise
+        except (OSError, ValueError, Image.DecompressionBombError) as e:
+            raise InvalidPhoto("Invalid image file") from e
+        
+        written = {}
+        for name, size in PHOTO_SIZES:
+            image.thumbnail((size, size), Image.LANCZOS)
+            path = variant_path(photo_path, name)
+            image.save(path, 'JPEG', quality=self.quality)
+            written[name] = path
+        return written
+    
+    @staticmethod
+    def _to_rgb(image):
+        # JPEG has no alpha channel: flatten transparent PNGs onto white
+        if image.mode in ('RGBA', 'LA') or (image.mode == 'P' and 'transparency' in image.info):
+            image = image.convert('RGBA')
+            background = Image.new('RGB', image.size, (255, 255, 255))
+            background.paste(image, mask=image.getchannel('A'))
+            return background
+        return image.convert('RGB') if image.mode != 'RGB' else image
+    
+    def shutdown(self):
+        """Wait for running jobs and stop the workers"""
+        self._executor.shutdown(wait=True)
+
+
+class PhotoStore:
+    """
+    Content-addressed photo files shared between users
+    
+    Photos are named after the SHA-256 of the uploaded bytes, so the same
+    upload is processed and stored once however many users use it. Files
+    are removed only when no users row references them any more. Names
+    never change content, which lets them be cached forever.
+    
+    A saved photo is held until unhold() is called, so a release() for
+    another user cannot remove it before the new row referencing it is
+    written. Holds, the reference count and removal share one lock.
+    """
+    
+    def __init__(self, folder, processor):
+        """
+        Args:
+            folder (str): Directory holding the photo files
+            processor (PhotoProcessor): Renders new uploads
+        """
+        self.folder = os.path.join(BASE_DIR, folder)  # Relative folders are from the project root
+        # users.photo_path values are the configured folder plus the file name
+        self.url_prefix = folder.replace(os.sep, '/').rstrip('/') + '/'
+        self.processor = processor
+        self._lock = threading.Lock()
+        self._holds = Counter()  # file name -> saves awaiting their users row
+        self._stored = 0
+        self._deduplicated = 0
+        self._removed = 0
+        os.makedirs(self.folder, exist_ok=True)
+    
+    def save(self, data):
+        """
+        Store an upload in every size unless the same bytes are stored already
+        
+        The photo stays held until unhold(); call it once the users row
+        is written or has failed.
+        
+        Returns:
+            str: Value for users.photo_path
+            
+        Raises:
+            InvalidPhoto: If the data is not a usable image
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        final = os.path.join(self.folder, f"{digest}.jpg")
+        
+        # Existence is checked under the lock release() deletes under
+        with self._lock:
+            if all(os.path.exists(variant_path(final, name)) for name, _ in PHOTO_SIZES):
+                self._holds[os.path.basename(final)] += 1
+                self._deduplicated += 1
+                return self.url_prefix + os.path.basename(final)
+        
+        # Render to private names, then move into place atomically
+        temporary = os.path.join(self.folder, f"{digest}.{threading.get_ident()}.tmp.jpg")
+        written = self.processor.process(data, temporary)
+        with self._lock:
+            for name, path in written.items():
+                os.replace(path, variant_path(final, name))
+            self._holds[os.path.basename(final)] += 1
+            self._stored += 1
+        
+        return self.url_prefix + os.path.basename(final)
+    
+    def unhold(self, photo_path):
+        """Drop the hold taken by save()"""
+        name = os.path.basename(photo_path)
+        with self._lock:
+            self._holds[name] -= 1
+            if self._holds[name] <= 0:
+                del self._holds[name]
+    
+    def release(self, photo_path):
+        """
+        Remove a photo's files if no user references it any more
+        
+        Call after the referencing row is deleted or was never inserted
+        (after unhold() in the latter case). Held photos are kept.
+        
+        Returns:
+            bool: True if the files were removed
+        """
+        base = os.path.join(self.folder, os.path.basename(photo_path))
+        with self._lock:
+            if self._holds[os.path.basename(photo_path)]:
+                return False
+            references = Database.execute_query(PHOTO_REFS_QUERY, (photo_path,), fetch=True)[0]['refs']
+            if references:
+                return False
+            
+            for name, _ in PHOTO_SIZES:
+                path = variant_path(base, name)
+                if os.path.exists(path):
+                    os.remove(path)
+            self._removed += 1
+        return True
+    
+    def file_path(self, name):
+        """
+        Absolute path of a stored file served by name
+        
+        Only content-hash names and the old uploader's names are served,
+        never the temporary files of saves in progress.
+        
+        Returns:
+            tuple: (path, immutable) - immutable is False for legacy names;
+                   path is None if the name is not a stored photo
+        """
+        immutable = STORED_NAME.match(name) is not None
+        if not immutable and not LEGACY_NAME.match(name):
+            return None, False
+        
+        path = os.path.join(self.folder, name)
+        if not os.path.isfile(path):
+            return None, False
+        return path, immutable
+    
+    def stats(self):
+        """Return store and deduplication counters"""
+        with self._lock:
+            saves = self._stored + self._deduplicated
+            return {
+                'stored': self._stored,
+                'deduplicated': self._deduplicated,
+                'removed': self._removed,
+                'dedup_rate': round(self._deduplicated / saves, 4) if saves else 0.0
+            }
+
+
+photo_processor = PhotoProcessor(
+    Config.PHOTO_WORKERS,
+    Config.PHOTO_JPEG_QUALITY,
+    Config.PHOTO_MAX_PIXELS
+)
+
+photo_store = PhotoStore(Config.UPLOAD_FOLDER, photo_processor)
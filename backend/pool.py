@@ -0,0 +1,266 @@
+# backend/pool.py
+import time
+import threading
+import logging
+from collections import OrderedDict, deque
+
+logger = logging.getLogger(__name__)
+
+
+class PoolError(Exception):
+    """Raised when no pooled connection frees up in time"""
+
+
+class PooledConnection:
+    """
+    Connection checked out of a ConnectionPool
+    
+    Behaves like the underlying connection; close() hands it back to the
+    pool instead of closing it. Pinned connections ignore close() until
+    release() is called, so several queries in one request can share them.
+    
+    Prepared statements live as long as the driver connection: they are
+    kept across checkouts and dropped when the connection is recycled.
+    """
+    
+    def __init__(self, pool, connection, created_at, statements=None):
+        self._pool = pool
+        self._connection = connection
+        self.created_at = created_at
+        self.statements = statements if statements is not None else OrderedDict()
+        self.pinned = False
+        self.released = False
+    
+    @property
+    def raw(self):
+        """The underlying driver connection"""
+        return self._connection
+    
+    def prepared_cursor(self, query):
+        """
+        Return a cached prepared-statement cursor for query
+        
+        Returns:
+            tuple: (cursor, query) - execute with the returned query object,
+                   the driver only reuses a statement for the identical string
+        """
+        entry = self.statements.get(query)
+        if entry is not None:
+            self.statements.move_to_end(query)
+            return entry
+        
+        entry = (self._connection.cursor(prepared=True, dictionary=True), query)
+        self.statements[query] = entry
+        while len(self.statements) > self._pool.statement_cache_size:
+            _, (cursor, _) = self.statements.popitem(last=False)
+            self._close_cursor(cursor)
+        return entry
+    
+    def discard_statement(self, query):
+        """Forget a cached statement, e.g. after it failed"""
+        entry = self.statements.pop(query, None)
+        if entry is not None:
+            self._close_cursor(entry[0])
+    
+    @staticmethod
+    def _close_cursor(cursor):
+        try:
+            cursor.close()
+        except Exception:
+            pass
+    
+    def close(self):
+        """Return the connection to the pool (no-op while pinned)"""
+        if not self.pinned:
+            self.release()
+    
+    def release(self):
+        """Return the connection to the pool"""
+        if not self.released:
+            self.released = True
+            self._pool.release(self)
+    
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+
+class ConnectionPool:
+    """
+    Bounded connection pool with overflow, waiting checkout and recycling
+    
+    Up to size connections are kept open. Another max_overflow connections
+    may be opened under load; they are closed when returned. When every
+    connection is in use, acquire() waits up to timeout seconds for one to
+    be returned before raising PoolError. Connections older than recycle
+    seconds are replaced, and connections idle for longer than ping_idle
+    seconds are pinged before reuse.
+    """
+    
+    def __init__(self, connect, size, max_overflow=0, timeout=10,
+                 recycle=3600, ping_idle=30, statement_cache_size=64):
+        """
+        Args:
+            connect (callable): Returns a new driver connection
+            size (int): Connections kept open
+            max_overflow (int): Extra connections allowed under load
+            timeout (float): Seconds to wait for a free connection
+            recycle (float): Maximum connection age in seconds (0 = never)
+            ping_idle (float): Idle seconds before a ping on checkout (0 = always)
+            statement_cache_size (int): Prepared statements kept per connection
+        """
+        self._connect = connect
+        self.size = size
+        self.max_overflow = max_overflow
+        self.timeout = timeout
+        self.recycle = recycle
+        self.ping_idle = ping_idle
+        self.statement_cache_size = statement_cache_size
+        self._idle = deque()
+        self._cond = threading.Condition()
+        self._open = 0
+        self._in_use = 0
+        self._waiters = 0
+        self._checkouts = 0
+        self._timeouts = 0
+        self._recycled = 0
+        self._ping_failures = 0
+        self._wait_time_total = 0.0
+        self._wait_time_max = 0.0
+    
+    def acquire(self):
+        """
+        Check out a connection, waiting if the pool is exhausted
+        
+        Returns:
+            PooledConnection: Connection to use and close()
+            
+        Raises:
+            PoolError: If no connection frees up within the timeout
+        """
+        started = time.perf_counter()
+        deadline = started + self.timeout
+        entry = None
+        
+        with self._cond:
+            while True:
+                if self._idle:
+                    entry = self._idle.pop()
+                    break
+                if self._open < self.size + self.max_overflow:
+                    self._open += 1
+                    break
+                
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    self._timeouts += 1
+                    raise PoolError(
+                        f"No connection available within {self.timeout}s "
+                        f"({self._in_use} in use)"
+                    )
+                self._waiters += 1
+                try:
+                    self._cond.wait(remaining)
+                finally:
+                    self._waiters -= 1
+            
+            waited = time.perf_counter() - started
+            self._in_use += 1
+            self._checkouts += 1
+            self._wait_time_total += waited
+            self._wait_time_max = max(self._wait_time_max, waited)
+        
+        try:
+            connection, created_at, statements = self._prepare(entry)
+        except Exception:
+            with self._cond:
+                self._open -= 1
+                self._in_use -= 1
+                self._cond.notify()
+            raise
+        
+        return PooledConnection(self, connection, created_at, statements)
+    
+    def release(self, pooled):
+        """Return a checked-out connection to the pool"""
+        connection = pooled.raw
+        reusable = True
+        try:
+            # End any open transaction so the next user gets a fresh snapshot
+            if connection.in_transaction:
+                connection.rollback()
+        except Exception as e:
+            logger.warning(f"Discarding connection after failed rollback: {e}")
+            reusable = False
+        
+        with self._cond:
+            self._in_use -= 1
+            if reusable and self._open <= self.size:
+                self._idle.append((connection, pooled.created_at, time.monotonic(),
+                                   pooled.statements))
+                connection = None
+            else:
+                self._open -= 1
+            self._cond.notify()
+        
+        if connection is not None:
+            self._close_quietly(connection)
+    
+    def close(self):
+        """Close the idle connections; checked-out ones close when returned"""
+        with self._cond:
+            idle, self._idle = list(self._idle), deque()
+            self._open -= len(idle)
+            self.size = 0
+        for connection, _, _, _ in idle:
+            self._close_quietly(connection)
+    
+    def stats(self):
+        """Return connection counts and checkout wait times"""
+        with self._cond:
+            checkouts = self._checkouts
+            return {
+                'size': self.size,
+                'max_overflow': self.max_overflow,
+                'open': self._open,
+                'idle': len(self._idle),
+                'in_use': self._in_use,
+                'waiters': self._waiters,
+                'checkouts': checkouts,
+                'timeouts': self._timeouts,
+                'recycled': self._recycled,
+                'ping_failures': self._ping_failures,
+                'avg_wait_ms': round(self._wait_time_total / checkouts * 1000, 3) if checkouts else 0.0,
+                'max_wait_ms': round(self._wait_time_max * 1000, 3)
+            }
+    
+    def _prepare(self, entry):
+        now = time.monotonic()
+        if entry is not None:
+            connection, created_at, returned_at, statements = entry
+            if self.recycle and now - created_at > self.recycle:
+                self._close_quietly(connection)
+                with self._cond:
+                    self._recycled += 1
+            elif now - returned_at >= self.ping_idle and not self._ping(connection):
+                self._close_quietly(connection)
+                with self._cond:
+                    self._ping_failures += 1
+            else:
+                return connection, created_at, statements
+        
+        return self._connect(), now, None
+    
+    @staticmethod
+    def _ping(connection):
+        try:
+            connection.ping(reconnect=False)
+            return True
+        except Exception:
+            return False
+    
+    @staticmethod
+    def _close_quietly(connection):
+        try:
+            connection.close()
+        except Exception:
+            pass
@@ -0,0 +1,219 @@
+# backend/profiler.py
+import re
+import time
+import threading
+import logging
+from functools import lru_cache
+from app_config import Config
+
+logger = logging.getLogger(__name__)
+
+WHITESPACE = re.compile(r'\s+')
+
+# IN (%s, %s, %s) -> IN (...), so batches of any size share one entry
+IN_LIST = re.compile(r'\bIN\s*\(\s*%s(?:\s*,\s*%s)*\s*\)', re.IGNORECASE)
+
+# Multi-row VALUES (...), (...) written by execute_many chunks
+VALUES_LIST = re.compile(r'(\bVALUES\s*\([^()]*\))(?:\s*,\s*\([^()]*\))+', re.IGNORECASE)
+
+# Statements EXPLAIN understands in both dialects
+EXPLAINABLE = ('SELECT', 'UPDATE', 'DELETE', 'INSERT')
+
+# Entry used once max_statements distinct texts are tracked
+OVERFLOW = '<other statements>'
+
+
+@lru_cache(maxsize=2048)
+def normalize(query):
+    """One-line query text with variable-length lists collapsed"""
+    text = WHITESPACE.sub(' ', query).strip()
+    text = IN_LIST.sub('IN (...)', text)
+    return VALUES_LIST.sub(r'\1, ...', text)
+
+
+class QueryProfiler:
+    """
+    Per-statement timings for Database queries, plus a slow-query log
+    
+    Statements are grouped by normalized text (whitespace collapsed,
+    IN lists folded) and each keeps its call count, total and max time
+    and rows returned or affected. Statements slower than slow_threshold
+    are logged without their parameters, whether or not profiling is on.
+    
+    With explain enabled, each statement's slowest run (query and
+    parameters) is kept in memory, never logged or reported, so report()
+    can EXPLAIN the statement as it actually ran.
+    """
+    
+    def __init__(self, enabled=False, slow_threshold=0.0, explain=False, max_statements=1000):
+        """
+        Args:
+            enabled (bool): Collect per-statement aggregates
+            slow_threshold (float): Seconds above which a query is logged (0 = off)
+            explain (bool): Keep parameters of the slowest run for EXPLAIN
+            max_statements (int): Distinct statements tracked before the
+                                  rest are counted under one entry
+        """
+        self.enabled = enabled
+        self.slow_threshold = slow_threshold
+        self.explain = explain
+        self.max_statements = max_statements
+        self._lock = threading.Lock()
+        self._statements = {}  # text -> [calls, total, max, rows, slow calls, slowest run]
+        self._slow_logged = 0
+    
+    @property
+    def active(self):
+        """True if record() does anything with the current settings"""
+        return self.enabled or self.slow_threshold > 0
+    
+    def record(self, query, params, elapsed, rows=None):
+        """
+        Account one execution
+        
+        Args:
+            query (str): Statement as executed
+            params: Its parameters (only kept for EXPLAIN, never logged)
+            elapsed (float): Seconds taken
+            rows (int): Rows returned or affected, if known
+        """
+        slow = 0 < self.slow_threshold <= elapsed
+        if not (slow or self.enabled):
+            return
+        
+        text = normalize(query)
+        if text.startswith('EXPLAIN'):
+            return  # the profiler's own EXPLAINs
+        
+        if slow:
+            with self._lock:
+                self._slow_logged += 1
+            logger.warning(
+                f"Slow query ({elapsed * 1000:.1f}ms, {rows if rows is not None else '?'} row(s), "
+                f"{len(params or ())} parameter(s) redacted): {text}"
+            )
+        
+        if not self.enabled:
+            return
+        
+        with self._lock:
+            entry = self._statements.get(text)
+            if entry is None:
+                if len(self._statements) >= self.max_statements:
+                    text = OVERFLOW
+                    entry = self._statements.get(text)
+                if entry is None:
+                    entry = self._statements[text] = [0, 0.0, 0.0, 0, 0, None]
+            entry[0] += 1
+            entry[1] += elapsed
+            entry[3] += rows or 0
+            entry[4] += slow
+            if elapsed >= entry[2]:
+                entry[2] = elapsed
+                if self.explain and text != OVERFLOW:
+                    entry[5] = (query, tuple(params or ()))
+    
+    def report(self, top=10, order='total', explain=None):
+        """
+        The top statements by total or max time
+        
+        Args:
+            top (int): Statements to return
+            order (str): 'total', 'max', 'mean' or 'calls'
+            explain (callable): explain(query, params) -> plan rows; when
+                                given, each reported statement is EXPLAINed
+                                as it ran the slowest time
+                                
+        Returns:
+            list: dicts with query, calls, total_ms, mean_ms, max_ms,
+                  rows, rows_per_call, slow_calls (and plan)
+        """
+        with self._lock:
+            snapshot = [(text, list(entry)) for text, entry in self._statements.items()]
+        
+        entries = []
+        for text, (calls, total, maximum, rows, slow_calls, slowest) in snapshot:
+            entries.append({
+                'query': text,
+                'calls': calls,
+                'total_ms': round(total * 1000, 3),
+                'mean_ms': round(total / calls * 1000, 3),
+                'max_ms': round(maximum * 1000, 3),
+                'rows': rows,
+                'rows_per_call': round(rows / calls, 2),
+                'slow_calls': slow_calls,
+                '_slowest': slowest
+            })
+        
+        key = {'total': 'total_ms', 'max': 'max_ms', 'mean': 'mean_ms', 'calls': 'calls'}[order]
+        entries.sort(key=lambda entry: entry[key], reverse=True)
+        entries = entries[:top]
+        
+        for entry in entries:
+            slowest = entry.pop('_slowest')
+            if explain is None or slowest is None:
+                continue
+            if entry['query'].split(' ', 1)[0].upper() not in EXPLAINABLE:
+                continue
+            try:
+                entry['plan'] = explain(*slowest)
+            except Exception as e:
+                entry['plan_error'] = str(e)
+        return entries
+    
+    def reset(self):
+        """Forget every aggregate"""
+        with self._lock:
+            self._statements.clear()
+            self._slow_logged = 0
+    
+    def stats(self):
+        """Return profiler settings and totals"""
+        with self._lock:
+            return {
+                'enabled': self.enabled,
+                'slow_threshold_ms': round(self.slow_threshold * 1000, 3),
+                'explain': self.explain,
+                'statements': len(self._statements),
+                'calls': sum(entry[0] for entry in self._statements.values()),
+                'slow_logged': self._slow_logged
+            }
+
+
+class ProfiledCursor:
+    """Cursor whose execute()/executemany() calls are recorded by a profiler"""
+    
+    def __init__(self, cursor, profiler):
+        self._cursor = cursor
+        self._profiler = profiler
+    
+    def execute(self, query, params=()):
+        started = time.perf_counter()
+        try:
+            return self._cursor.execute(query, params)
+        finally:
+            self._profiler.record(query, params, time.perf_counter() - started, self._rowcount())
+    
+    def executemany(self, query, params_list):
+        started = time.perf_counter()
+        try:
+            return self._cursor.executemany(query, params_list)
+        finally:
+            # No single parameter tuple to EXPLAIN with
+            self._profiler.record(query, None, time.perf_counter() - started, self._rowcount())
+    
+    def _rowcount(self):
+        # -1 until a SELECT has been fetched
+        rowcount = self._cursor.rowcount
+        return rowcount if rowcount >= 0 else None
+    
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+query_profiler = QueryProfiler(
+    enabled=Config.QUERY_PROFILING,
+    slow_threshold=Config.SLOW_QUERY_THRESHOLD_MS / 1000,
+    explain=Config.QUERY_PROFILE_EXPLAIN,
+    max_statements=Config.QUERY_PROFILE_MAX_STATEMENTS
+)
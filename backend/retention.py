@@ -0,0 +1,143 @@
+# backend/retention.py
+import time
+import atexit
+import threading
+import logging
+from datetime import datetime, timedelta
+from backend.database import Database
+
+logger = logging.getLogger(__name__)
+
+# (table, condition, order) of each batched DELETE; the driver writes the
+# statement. Sessions age from their last activity; logout also sets
+# last_activity, so logged-out sessions age from logout. Every one of these
+# timestamps is written from the app clock, the same clock as the cutoff.
+SESSIONS_DELETE = ('user_sessions', 'last_activity < %s', 'last_activity')
+ATTEMPTS_DELETE = ('login_attempts', 'attempt_time < %s', 'attempt_time')
+
+
+class RetentionSweeper:
+    """
+    Periodic pruning of expired sessions and old login attempts
+    
+    Rows are deleted batch_size at a time, each batch in its own short
+    transaction with a pause in between, so a large backlog never holds
+    locks for long or starves the request path of connections.
+    """
+    
+    def __init__(self, interval, batch_size, session_retention, attempt_retention,
+                 pause=0.05):
+        """
+        Args:
+            interval (float): Seconds between sweeps
+            batch_size (int): Rows deleted per statement
+            session_retention (float): Seconds a session is kept after its
+                                       last activity (expired or logged out)
+            attempt_retention (float): Seconds login attempts are kept
+            pause (float): Seconds to sleep between batches
+        """
+        self.interval = interval
+        self.batch_size = batch_size
+        self.session_retention = session_retention
+        self.attempt_retention = attempt_retention
+        self.pause = pause
+        self._lock = threading.Lock()
+        self._sweep_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopping = False
+        self._thread = None
+        self._runs = 0
+        self._errors = 0
+        self._sessions_removed = 0
+        self._attempts_removed = 0
+        self._last_run = None
+    
+    def start(self):
+        """Start sweeping in a background thread"""
+        with self._lock:
+            if self._thread is not None or self._stopping:
+                return
+            self._thread = threading.Thread(
+                target=self._run,
+                name='retention-sweeper',
+                daemon=True
+            )
+            self._thread.start()
+        atexit.register(self.stop)
+    
+    def sweep(self):
+        """
+        Run one sweep over both tables
+        
+        Returns:
+            dict: Rows removed per table, batches and elapsed time
+        """
+        with self._sweep_lock:
+            started = time.perf_counter()
+            report = {'sessions_removed': 0, 'attempts_removed': 0, 'batches': 0}
+            try:
+                report['sessions_removed'] = self._delete(
+                    SESSIONS_DELETE, self.session_retention, report)
+                report['attempts_removed'] = self._delete(
+                    ATTEMPTS_DELETE, self.attempt_retention, report)
+            except Exception as e:
+                with self._lock:
+                    self._errors += 1
+                logger.error(f"Retention sweep failed: {e}")
+            
+            report['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 2)
+            with self._lock:
+                self._runs += 1
+                self._sessions_removed += report['sessions_removed']
+                self._attempts_removed += report['attempts_removed']
+                self._last_run = report
+            
+            if report['sessions_removed'] or report['attempts_removed']:
+                logger.info(
+                    f"Retention sweep removed {report['sessions_removed']} session(s) and "
+                    f"{report['attempts_removed']} login attempt(s) in {report['elapsed_ms']}ms"
+                )
+            return report
+    
+    def _delete(self, spec, retention, report):
+        query = Database.driver().limited_delete(*spec)
+        cutoff = datetime.now() - timedelta(seconds=retention)
+        removed = 0
+        while not self._stopping:
+            with Database.transaction() as cursor:
+                cursor.execute(query, (cutoff, self.batch_size))
+                deleted = cursor.rowcount
+            removed += deleted
+            report['batches'] += 1
+            if deleted < self.batch_size:
+                break
+            time.sleep(self.pause)
+        return removed
+    
+    def stop(self):
+        """Stop the background thread"""
+        with self._lock:
+            self._stopping = True
+            thread = self._thread
+        self._wakeup.set()
+        if thread is not None:
+            thread.join(timeout=5)
+    
+    def stats(self):
+        """Return totals and the last sweep's report"""
+        with self._lock:
+            return {
+                'interval_seconds': self.interval,
+                'session_retention_seconds': self.session_retention,
+                'attempt_retention_seconds': self.attempt_retention,
+                'runs': self._runs,
+                'errors': self._errors,
+                'sessions_removed': self._sessions_removed,
+                'attempts_removed': self._attempts_removed,
+                'last_run': self._last_run
+            }
+    
+    def _run(self):
+        while not self._stopping:
+            self.sweep()
+            self._wakeup.wait(self.interval)
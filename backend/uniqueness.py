@@ -0,0 +1,154 @@
+# backend/uniqueness.py
+import time
+import threading
+import logging
+from app_config import Config
+from backend.database import Database
+
+logger = logging.getLogger(__name__)
+
+
+# Unique keys of the users table (named after their columns in both
+# dialects) and what to tell the user when one is taken
+DUPLICATE_MESSAGES = {
+    'username': 'Username already exists',
+    'email': 'Email already registered'
+}
+
+
+def duplicate_message(error):
+    """
+    Turn a duplicate-key error from an INSERT into a validation message
+    
+    Returns:
+        str: Message for the user, or None if error is not a duplicate
+             username or email (e.g. a user_id collision)
+    """
+    return DUPLICATE_MESSAGES.get(Database.driver().duplicate_key(error))
+
+
+class UniquenessIndex:
+    """
+    In-process index of taken usernames and emails
+    
+    A name that is in neither set has never been seen, so it is reported
+    free without a query. A name that is in a set is confirmed with one
+    combined query, since the row may have been deleted elsewhere. Names
+    taken by other processes since the last load are caught by the UNIQUE
+    constraints on INSERT; use duplicate_message() to report them.
+    
+    Keys are lower-cased to match the table's case-insensitive collation.
+    The index loads on first use and reloads every refresh_interval seconds.
+    """
+    
+    def __init__(self, refresh_interval):
+        """
+        Args:
+            refresh_interval (float): Seconds between reloads (0 = never)
+        """
+        self.refresh_interval = refresh_interval
+        self._usernames = set()
+        self._emails = set()
+        self._lock = threading.Lock()
+        self._loaded_at = None
+        self._skipped = 0
+        self._db_checks = 0
+        self._loads = 0
+    
+    def check(self, username, email):
+        """
+        Check whether a username or email is already taken
+        
+        Returns:
+            list: Validation messages, empty if both are free
+        """
+        self._ensure_loaded()
+        username_key = (username or '').lower()
+        email_key = (email or '').lower()
+        
+        with self._lock:
+            if (self._loaded_at is not None
+                    and username_key not in self._usernames
+                    and email_key not in self._emails):
+                self._skipped += 1
+                return []
+            self._db_checks += 1
+        
+        rows = Database.execute_query("""
+            SELECT username, email
+            FROM users
+            WHERE username = %s OR email = %s
+        """, (username, email), fetch=True)
+        
+        taken_usernames = {row['username'].lower() for row in rows}
+        taken_emails = {row['email'].lower() for row in rows}
+        
+        # Bring the index in line with what the database just said
+        with self._lock:
+            self._usernames.update(taken_usernames)
+            self._emails.update(taken_emails)
+            if username_key not in taken_usernames:
+                self._usernames.discard(username_key)
+            if email_key not in taken_emails:
+                self._emails.discard(email_key)
+        
+        errors = []
+        if username_key in taken_usernames:
+            errors.append('Username already exists')
+        if email_key in taken_emails:
+            errors.append('Email already registered')
+        return errors
+    
+    def add(self, username, email):
+        """Record a newly inserted user"""
+        with self._lock:
+            self._usernames.add(username.lower())
+            self._emails.add(email.lower())
+    
+    def discard(self, username, email):
+        """Forget a deleted user"""
+        with self._lock:
+            self._usernames.discard(username.lower())
+            self._emails.discard(email.lower())
+    
+    def rebuild(self):
+        """Reload every username and email from the users table"""
+        rows = Database.execute_query("SELECT username, email FROM users", fetch=True)
+        usernames = {row['username'].lower() for row in rows}
+        emails = {row['email'].lower() for row in rows}
+        
+        with self._lock:
+            self._usernames = usernames
+            self._emails = emails
+            self._loaded_at = time.monotonic()
+            self._loads += 1
+        logger.info(f"Uniqueness index loaded {len(rows)} user(s)")
+    
+    def stats(self):
+        """Return index size and how often the database was skipped"""
+        with self._lock:
+            checks = self._skipped + self._db_checks
+            return {
+                'usernames': len(self._usernames),
+                'emails': len(self._emails),
+                'loaded': self._loaded_at is not None,
+                'loads': self._loads,
+                'skipped_queries': self._skipped,
+                'db_checks': self._db_checks,
+                'skip_rate': round(self._skipped / checks, 4) if checks else 0.0
+            }
+    
+    def _ensure_loaded(self):
+        loaded_at = self._loaded_at
+        if loaded_at is not None and (
+            not self.refresh_interval
+            or time.monotonic() - loaded_at < self.refresh_interval
+        ):
+            return
+        try:
+            self.rebuild()
+        except Exception as e:
+            logger.error(f"Error loading uniqueness index: {e}")
+
+
+uniqueness_index = UniquenessIndex(Config.UNIQUENESS_REFRESH_INTERVAL)
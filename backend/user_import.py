@@ -0,0 +1,274 @@
+# backend/user_import.py
+import csv
+import codecs
+import json
+import time
+import logging
+from app_config import Config
+from backend.database import Database
+from backend.validation import Validator
+from backend.auth import AuthManager, hashing_pool, ph
+from backend.uniqueness import uniqueness_index, duplicate_message
+
+logger = logging.getLogger(__name__)
+
+IMPORT_FIELDS = (
+    'full_name', 'email', 'phone', 'username', 'role',
+    'password', 'employment_date', 'status'
+)
+
+INSERT_QUERY = """
+    INSERT INTO users (
+        user_id, username, password_hash, full_name, email, phone,
+        role, employment_date, status
+    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+"""
+
+
+class ImportFileError(ValueError):
+    """Raised when an import file cannot be read (any further)"""
+
+
+class DecodedLines:
+    """
+    Text lines of a binary stream, decoded one at a time
+    
+    A bad byte is reported with its line number instead of somewhere in
+    a block read ahead, and line_number is the line a parser last took.
+    """
+    
+    def __init__(self, stream):
+        self._stream = iter(stream)
+        self.line_number = 0
+    
+    def __iter__(self):
+        return self
+    
+    def __next__(self):
+        line = next(self._stream)
+        self.line_number += 1
+        if self.line_number == 1:
+            line = line.removeprefix(codecs.BOM_UTF8)
+        try:
+            return line.decode('utf-8')
+        except UnicodeDecodeError:
+            raise ImportFileError(f"Line {self.line_number} is not UTF-8 text") from None
+
+
+def read_rows(stream, file_format):
+    """
+    Lazily parse an uploaded CSV or JSONL file into row dicts
+    
+    Args:
+        stream: Binary file-like object
+        file_format (str): 'csv' or 'jsonl'
+        
+    Yields:
+        dict: One row per record
+        
+    Raises:
+        ImportFileError: If the file cannot be parsed; rows before the
+                         failing line have been yielded already
+    """
+    lines = DecodedLines(stream)
+    
+    if file_format == 'csv':
+        reader = csv.DictReader(lines)
+        try:
+            missing = set(IMPORT_FIELDS) - {'status'} - set(reader.fieldnames or ())
+            if missing:
+                raise ImportFileError(f"Missing columns: {', '.join(sorted(missing))}")
+            yield from reader
+        except csv.Error as e:
+            raise ImportFileError(f"Line {lines.line_number}: {e}") from None
+    elif file_format == 'jsonl':
+        for line_number, line in enumerate(lines, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                record = None
+            yield record if isinstance(record, dict) else {'_invalid': f"Line {line_number} is not a JSON object"}
+    else:
+        raise ImportFileError("File must be CSV or JSONL")
+
+
+class UserImporter:
+    """
+    Bulk user import: validate, de-duplicate, hash and insert in chunks
+    
+    Rows are processed chunk_size at a time so memory stays flat however
+    large the file is. Each chunk costs one uniqueness query, one parallel
+    hashing pass and one multi-row INSERT.
+    """
+    
+    def __init__(self, chunk_size=None, max_rows=None):
+        self.chunk_size = chunk_size or Config.IMPORT_CHUNK_SIZE
+        self.max_rows = max_rows or Config.IMPORT_MAX_ROWS
+        self.imported = 0
+        self.errors = []
+        self._seen_usernames = set()
+        self._seen_emails = set()
+    
+    def run(self, rows):
+        """
+        Import rows and return a per-row report
+        
+        Args:
+            rows (iterable): Row dicts, e.g. from read_rows()
+            
+        Returns:
+            dict: imported/failed counts and per-row errors (1-based row
+                  numbers); file_error is set if reading stopped partway,
+                  in which case the rows before it were still imported
+                  
+        Raises:
+            ImportFileError: If not even the first row could be read
+        """
+        started = time.perf_counter()
+        chunk = []
+        total = 0
+        file_error = None
+        
+        try:
+            for row_number, row in enumerate(rows, start=1):
+                if row_number > self.max_rows:
+                    self.errors.append({
+                        'row': row_number,
+                        'errors': [f"Import is limited to {self.max_rows} rows"]
+                    })
+                    break
+                total = row_number
+                chunk.append((row_number, row))
+                if len(chunk) >= self.chunk_size:
+                    self._import_chunk(chunk)
+                    chunk = []
+        except ImportFileError as e:
+            # Earlier chunks are committed: report them rather than fail
+            if not total:
+                raise
+            file_error = str(e)
+            self.errors.append({'row': total + 1, 'errors': [file_error]})
+        
+        if chunk:
+            self._import_chunk(chunk)
+        
+        elapsed = time.perf_counter() - started
+        self.errors.sort(key=lambda error: error['row'])
+        logger.info(f"Imported {self.imported}/{total} users in {elapsed:.1f}s")
+        
+        return {
+            'total': total,
+            'imported': self.imported,
+            'failed': len(self.errors),
+            'errors': self.errors,
+            'file_error': file_error,
+            'elapsed_seconds': round(elapsed, 2)
+        }
+    
+    def _import_chunk(self, chunk):
+        rows = []
+        for row_number, row in chunk:
+            if '_invalid' in row:
+                self.errors.append({'row': row_number, 'errors': [row['_invalid']]})
+            else:
+                rows.append((row_number, self._clean_row(row)))
+        
+        columns = {field: [row[field] for _, row in rows] for field in IMPORT_FIELDS}
+        values, errors = Validator.validate_batch(columns)
+        
+        valid = []
+        for index, (row_number, _) in enumerate(rows):
+            if index in errors:
+                self.errors.append({
+                    'row': row_number,
+                    'errors': [message for messages in errors[index].values() for message in messages]
+                })
+            else:
+                valid.append((row_number, {field: values[field][index] for field in IMPORT_FIELDS}))
+        
+        if not valid:
+            return
+        
+        valid = self._drop_duplicates(valid)
+        if not valid:
+            return
+        
+        hashes = hashing_pool.run_many(ph.hash, [(user['password'],) for _, user in valid])
+        records = [
+            (
+                AuthManager.generate_user_id(user['username'], user['email']),
+                user['username'], password_hash, user['full_name'], user['email'],
+                user['phone'], user['role'], user['employment_date'], user['status']
+            )
+            for (_, user), password_hash in zip(valid, hashes)
+        ]
+        
+        try:
+            Database.execute_many(INSERT_QUERY, records)
+            self.imported += len(records)
+            for _, user in valid:
+                uniqueness_index.add(user['username'], user['email'])
+        except Database.driver().IntegrityError:
+            # A concurrent registration took a name; retry row by row
+            for (row_number, user), record in zip(valid, records):
+                try:
+                    Database.execute_query(INSERT_QUERY, record)
+                    self.imported += 1
+                    uniqueness_index.add(user['username'], user['email'])
+                except Database.driver().IntegrityError as e:
+                    self.errors.append({
+                        'row': row_number,
+                        'errors': [duplicate_message(e) or 'Username or email already exists']
+                    })
+    
+    @staticmethod
+    def _clean_row(row):
+        values = {field: str(row.get(field) or '').strip() for field in IMPORT_FIELDS}
+        values['password'] = str(row.get('password') or '')
+        values['status'] = values['status'] or 'Active'
+        return values
+    
+    def _drop_duplicates(self, valid):
+        """Reject rows whose username/email repeats in the file or exists in the DB"""
+        usernames = [user['username'] for _, user in valid]
+        emails = [user['email'] for _, user in valid]
+        
+        username_marks = ', '.join(['%s'] * len(usernames))
+        email_marks = ', '.join(['%s'] * len(emails))
+        existing = Database.execute_query(f"""
+            SELECT username, email
+            FROM users
+            WHERE username IN ({username_marks}) OR email IN ({email_marks})
+        """, tuple(usernames + emails), fetch=True)
+        
+        taken_usernames = {row['username'].lower() for row in existing}
+        taken_emails = {row['email'].lower() for row in existing}
+        
+        unique = []
+        for row_number, user in valid:
+            username = user['username'].lower()
+            email = user['email'].lower()
+            errors = []
+            
+            if username in taken_usernames:
+                errors.append('Username already exists')
+            elif username in self._seen_usernames:
+                errors.append('Username is duplicated in the import file')
+            
+            if email in taken_emails:
+                errors.append('Email already registered')
+            elif email in self._seen_emails:
+                errors.append('Email is duplicated in the import file')
+            
+            if errors:
+                self.errors.append({'row': row_number, 'errors': errors})
+            else:
+                # Only accepted rows claim their keys; a rejected row must not
+                # make a later valid one look like an in-file duplicate
+                self._seen_usernames.add(username)
+                self._seen_emails.add(email)
+                unique.append((row_number, user))
+        
+        return unique
@@ -1,10 +1,61 @@
 # backend/validation.py
 import re
+from datetime import date
 from email_validator import validate_email, EmailNotValidError
+from app_config import Config
+from backend.email_domains import DomainChecker
+
+# Patterns are compiled once at import instead of on every call
+NAME_PATTERN = re.compile(r'^[a-zA-Z\s\-.]+$')
+USERNAME_PATTERN = re.compile(r'^[a-zA-Z0-9_]+$')
+PHONE_PATTERN = re.compile(r'^09\d{9}$')
+SKU_PATTERN = re.compile(r'^[A-Z0-9]+(-[A-Z0-9]+)*$')
+PASSWORD_RULES = (
+    (re.compile(r'[A-Z]'), "Password must contain at least one uppercase letter"),
+    (re.compile(r'[a-z]'), "Password must contain at least one lowercase letter"),
+    (re.compile(r'\d'), "Password must contain at least one number"),
+    (re.compile(r'[!@#$%^&*(),.?":{}|<>]'), "Password must contain at least one special character")
+)
+
+# Domain deliverability results shared by all email checks
+domain_checker = DomainChecker(
+    Config.EMAIL_DOMAIN_CACHE_SIZE,
+    Config.EMAIL_DOMAIN_CACHE_TTL,
+    Config.EMAIL_DNS_TIMEOUT,
+    unknown_ttl=Config.EMAIL_DOMAIN_UNKNOWN_TTL
+)
 
 class Validator:
     """Input validation utilities"""
     
+    # Allowed values, matching the ENUM columns of the users table
+    ROLES = ('Owner', 'Admin', 'Inventory Clerk', 'Cashier')
+    STATUSES = ('Active', 'Inactive')
+    
+    # Product categories offered by the inventory page, and the stock
+    # filters computed into products.stock_status
+    CATEGORIES = ('Tools', 'Hardware', 'Construction', 'Safety', 'Electrical', 'Plumbing')
+    STOCK_FILTERS = ('low', 'critical')
+    
+    @staticmethod
+    def validate_full_name(name):
+        """Validate full name (2-100 chars, letters, spaces, hyphens, periods)"""
+        if not name:
+            return False, "Full name is required"
+        
+        name = name.strip()
+        
+        if len(name) < 2:
+            return False, "Name must be at least 2 characters"
+        
+        if len(name) > 100:
+            return False, "Name must not exceed 100 characters"
+        
+        if not NAME_PATTERN.match(name):
+            return False, "Name can only contain letters, spaces, hyphens, and periods"
+        
+        return True, ""
+    
     @staticmethod
     def validate_username(username):
         """Validate username (4-20 chars, alphanumeric)"""
@@ -17,7 +68,7 @@ class Validator:
         if len(username) > 20:
             return False, "Username must not exceed 20 characters"
         
-        if not re.match(r'^[a-zA-Z0-9_]+$', username):
+        if not USERNAME_PATTERN.match(username):
             return False, "Username can only contain letters, numbers, and underscores"
         
         return True, ""
@@ -31,28 +82,25 @@ class Validator:
         if len(password) < 8:
             return False, "Password must be at least 8 characters"
         
-        if not re.search(r'[A-Z]', password):
-            return False, "Password must contain at least one uppercase letter"
-        
-        if not re.search(r'[a-z]', password):
-            return False, "Password must contain at least one lowercase letter"
-        
-        if not re.search(r'\d', password):
-            return False, "Password must contain at least one number"
-        
-        if not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
-            return False, "Password must contain at least one special character"
+        for pattern, message in PASSWORD_RULES:
+            if not pattern.search(password):
+                return False, message
         
         return True, ""
     
     @staticmethod
     def validate_email_address(email):
-        """Validate email format"""
+        """
+        Validate email format, and the domain's MX records unless
+        EMAIL_CHECK_DELIVERABILITY is off (syntax only, no network)
+        """
         if not email:
             return False, "Email is required"
         
         try:
-            valid = validate_email(email)
+            valid = validate_email(email, check_deliverability=False)
+            if Config.EMAIL_CHECK_DELIVERABILITY:
+                domain_checker.check(valid.ascii_domain, valid.domain)
             return True, valid.email
         except EmailNotValidError as e:
             return False, str(e)
@@ -65,7 +113,308 @@ class Validator:
         
         phone = phone.replace(' ', '').replace('-', '')
         
-        if not re.match(r'^09\d{9}$', phone):
+        if not PHONE_PATTERN.match(phone):
             return False, "Phone must be 11 digits starting with 09"
         
-        return True, phone
\ No newline at end of file
+        return True, phone
+    
+    @staticmethod
+    def validate_role(role):
+        """Validate role against the allowed user roles"""
+        if not role:
+            return False, "Role is required"
+        
+        if role not in Validator.ROLES:
+            return False, "Invalid role selected"
+        
+        return True, ""
+    
+    @staticmethod
+    def validate_status(status):
+        """Validate account status (Active/Inactive)"""
+        if status not in Validator.STATUSES:
+            return False, "Status must be Active or Inactive"
+        
+        return True, ""
+    
+    @staticmethod
+    def validate_employment_date(employment_date):
+        """Validate employment date (YYYY-MM-DD, not in the future)"""
+        if not employment_date:
+            return False, "Employment date is required"
+        
+        try:
+            parsed = date.fromisoformat(employment_date)
+        except (TypeError, ValueError):
+            return False, "Employment date must be in YYYY-MM-DD format"
+        
+        if parsed > date.today():
+            return False, "Employment date cannot be in the future"
+        
+        return True, ""
+    
+    @staticmethod
+    def validate_file_upload(filename, file_size):
+        """Validate photo upload (JPG/PNG, at most MAX_FILE_SIZE bytes)"""
+        extension = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
+        if extension not in Config.ALLOWED_EXTENSIONS:
+            return False, "Only JPG and PNG files are allowed"
+        
+        if file_size > Config.MAX_FILE_SIZE:
+            return False, f"File size must not exceed {Config.MAX_FILE_SIZE / (1024 * 1024):g}MB"
+        
+        return True, ""
+    
+    @staticmethod
+    def validate_product_name(name):
+        """Validate product name (2-100 chars)"""
+        if not name:
+            return False, "Product name is required"
+        
+        if len(name) < 2:
+            return False, "Product name must be at least 2 characters"
+        
+        if len(name) > 100:
+            return False, "Product name must not exceed 100 characters"
+        
+        return True, ""
+    
+    @staticmethod
+    def validate_sku(sku):
+        """Validate SKU (up to 32 letters/digits in dash-separated groups), returns it upper-cased"""
+        if not sku:
+            return False, "SKU is required"
+        
+        sku = sku.upper()
+        if len(sku) > 32:
+            return False, "SKU must not exceed 32 characters"
+        
+        if not SKU_PATTERN.match(sku):
+            return False, "SKU can only contain letters and numbers separated by dashes"
+        
+        return True, sku
+    
+    @staticmethod
+    def validate_category(category):
+        """Validate product category against the allowed categories"""
+        if not category:
+            return False, "Category is required"
+        
+        if category not in Validator.CATEGORIES:
+            return False, "Invalid category selected"
+        
+        return True, ""
+    
+    @staticmethod
+    def validate_quantity(value, label):
+        """Validate a whole, non-negative quantity, returns it as an int"""
+        if value in (None, ''):
+            return False, f"{label} is required"
+        
+        if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+            return False, f"{label} must be a whole number"
+        
+        try:
+            quantity = int(value)
+        except (TypeError, ValueError):
+            return False, f"{label} must be a whole number"
+        
+        if quantity < 0:
+            return False, f"{label} cannot be negative"
+        
+        if quantity > 1_000_000_000:
+            return False, f"{label} is too large"
+        
+        return True, quantity
+    
+    @staticmethod
+    def validate_price(value):
+        """Validate price (0 to 99,999,999.99), returns it rounded to centavos"""
+        if value in (None, ''):
+            return False, "Price is required"
+        
+        try:
+            price = float(value)
+        except (TypeError, ValueError):
+            return False, "Price must be a number"
+        
+        if isinstance(value, bool) or price != price:
+            return False, "Price must be a number"
+        
+        if price < 0:
+            return False, "Price cannot be negative"
+        
+        if price >= 100_000_000:
+            return False, "Price is too large"
+        
+        return True, round(price, 2)
+    
+    @staticmethod
+    def validate_batch(columns):
+        """
+        Validate columns of values, one pass per field
+        
+        Unlike the single-value validators, every failing rule of every
+        field is reported instead of stopping at the first.
+        
+        Args:
+            columns (dict): Field name -> list of values (equal lengths)
+            
+        Returns:
+            tuple: (values, errors) - values maps each field to its column
+                   with names trimmed and emails/phones normalized; errors
+                   maps the index of each failing row to {field: [messages]}
+                   
+        Raises:
+            ValueError: On unknown fields or columns of different lengths
+        """
+        unknown = set(columns) - set(COLUMN_CHECKS)
+        if unknown:
+            raise ValueError(f"Cannot batch-validate: {', '.join(sorted(unknown))}")
+        
+        if len({len(column) for column in columns.values()}) > 1:
+            raise ValueError("All columns must have the same length")
+        
+        values = {}
+        errors = {}
+        for field, column in columns.items():
+            values[field], failures = COLUMN_CHECKS[field](column)
+            for row, messages in failures:
+                errors.setdefault(row, {})[field] = messages
+        
+        return values, errors
+
+
+# Batch column checkers: column -> (cleaned column, [(row, messages)])
+# A single combined pattern accepts valid values; only failures are
+# re-checked rule by rule to collect every message.
+
+NAME_FAST = re.compile(r'^[a-zA-Z\s\-.]{2,100}$')
+USERNAME_FAST = re.compile(r'^[a-zA-Z0-9_]{4,20}$')
+PASSWORD_FAST = re.compile(r'^(?=.*[A-Z])(?=.*[a-z])(?=.*\d)(?=.*[!@#$%^&*(),.?":{}|<>]).{8,}$', re.DOTALL)
+
+
+def _name_column(column):
+    cleaned = []
+    failures = []
+    fast = NAME_FAST.match
+    for row, name in enumerate(column):
+        name = name.strip() if name else name
+        cleaned.append(name)
+        if name and fast(name):
+            continue
+        if not name:
+            failures.append((row, ["Full name is required"]))
+            continue
+        messages = []
+        if len(name) < 2:
+            messages.append("Name must be at least 2 characters")
+        if len(name) > 100:
+            messages.append("Name must not exceed 100 characters")
+        if not NAME_PATTERN.match(name):
+            messages.append("Name can only contain letters, spaces, hyphens, and periods")
+        failures.append((row, messages))
+    return cleaned, failures
+
+
+def _username_column(column):
+    failures = []
+    fast = USERNAME_FAST.match
+    for row, username in enumerate(column):
+        if username and fast(username):
+            continue
+        if not username:
+            failures.append((row, ["Username is required"]))
+            continue
+        messages = []
+        if len(username) < 4:
+            messages.append("Username must be at least 4 characters")
+        if len(username) > 20:
+            messages.append("Username must not exceed 20 characters")
+        if not USERNAME_PATTERN.match(username):
+            messages.append("Username can only contain letters, numbers, and underscores")
+        failures.append((row, messages))
+    return list(column), failures
+
+
+def _password_column(column):
+    failures = []
+    fast = PASSWORD_FAST.match
+    for row, password in enumerate(column):
+        if password and fast(password):
+            continue
+        if not password:
+            failures.append((row, ["Password is required"]))
+            continue
+        messages = []
+        if len(password) < 8:
+            messages.append("Password must be at least 8 characters")
+        for pattern, message in PASSWORD_RULES:
+            if not pattern.search(password):
+                messages.append(message)
+        failures.append((row, messages))
+    return list(column), failures
+
+
+def _phone_column(column):
+    cleaned = []
+    failures = []
+    fast = PHONE_PATTERN.match
+    for row, phone in enumerate(column):
+        if not phone:
+            cleaned.append(phone)
+            failures.append((row, ["Phone number is required"]))
+            continue
+        phone = phone.replace(' ', '').replace('-', '')
+        cleaned.append(phone)
+        if not fast(phone):
+            failures.append((row, ["Phone must be 11 digits starting with 09"]))
+    return cleaned, failures
+
+
+def _email_column(column):
+    cleaned = []
+    failures = []
+    for row, email in enumerate(column):
+        valid, result = Validator.validate_email_address(email)
+        if valid:
+            cleaned.append(result)
+        else:
+            cleaned.append(email)
+            failures.append((row, [result]))
+    return cleaned, failures
+
+
+def _choice_column(allowed, validate):
+    """Membership check for enum fields; messages come from validate"""
+    allowed = frozenset(allowed)
+    
+    def check(column):
+        failures = [
+            (row, [validate(value)[1]])
+            for row, value in enumerate(column)
+            if value not in allowed
+        ]
+        return list(column), failures
+    return check
+
+
+def _date_column(column):
+    failures = []
+    for row, value in enumerate(column):
+        valid, message = Validator.validate_employment_date(value)
+        if not valid:
+            failures.append((row, [message]))
+    return list(column), failures
+
+
+COLUMN_CHECKS = {
+    'full_name': _name_column,
+    'email': _email_column,
+    'phone': _phone_column,
+    'username': _username_column,
+    'password': _password_column,
+    'role': _choice_column(Validator.ROLES, Validator.validate_role),
+    'status': _choice_column(Validator.STATUSES, Validator.validate_status),
+    'employment_date': _date_column
+}
@@ -0,0 +1,5 @@
+# benchmarks/__init__.py
+"""
+DR3 Hardware - Performance benchmarks
+Run each module with python -m benchmarks.<name> against a configured database
+"""
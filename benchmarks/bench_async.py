@@ -0,0 +1,243 @@
+# benchmarks/bench_async.py
+"""
+Threaded Flask vs asyncio ASGI serving of the auth routes
+
+Seeds users and sessions, then serves the app in a child process twice:
+Flask's threaded server (what app.run uses) and asgi.py under uvicorn.
+Both are driven by the same asyncio load generator, which keeps
+--concurrency keep-alive connections busy validating sessions, with a
+--login-share of Argon2 logins mixed in. Reports throughput, p50/p95/p99
+per route and non-200 responses (503 = hashing queue full).
+
+--cold sets SESSION_CACHE_TTL=0 in the servers so every validation is a
+database round trip. The database is shared with the child processes, so
+it must be MySQL or a SQLite file. Seeded rows are removed at the end.
+
+Usage:
+    python -m benchmarks.bench_async --concurrency 1000 --duration 15
+    python -m benchmarks.bench_async --servers asgi --cold
+    DB_DRIVER=sqlite DB_SQLITE_PATH=async.db python -m benchmarks.bench_async --migrate
+"""
+import os
+import sys
+import json
+import random
+import socket
+import asyncio
+import argparse
+import resource
+import subprocess
+import time
+from collections import Counter, defaultdict
+from app_config import Config
+from backend.database import Database
+from backend.migrations import MigrationRunner
+from benchmarks.bench_load import seed, cleanup, percentile, PASSWORD, PERCENTILES
+
+HOST = '127.0.0.1'
+
+
+def serve(server, port):
+    """Child process: serve the app until terminated"""
+    if server == 'threaded':
+        from werkzeug.serving import make_server
+        from app import app
+        make_server(HOST, port, app, threaded=True).serve_forever()
+    else:
+        import uvicorn
+        uvicorn.run('asgi:application', host=HOST, port=port, log_level='warning',
+                    access_log=False, backlog=4096)
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind((HOST, 0))
+        return sock.getsockname()[1]
+
+
+def start_server(server, port, cold):
+    env = dict(os.environ, ASSET_PIPELINE='False', RETENTION_SWEEP_INTERVAL='0')
+    if cold:
+        env['SESSION_CACHE_TTL'] = '0'
+    process = subprocess.Popen(
+        [sys.executable, '-m', 'benchmarks.bench_async', '--serve', server, '--port', str(port)],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    deadline = time.monotonic() + 60
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"{server} server exited with code {process.returncode}")
+        try:
+            socket.create_connection((HOST, port), timeout=1).close()
+            return process
+        except OSError:
+            time.sleep(0.2)
+    process.kill()
+    raise RuntimeError(f"{server} server did not start")
+
+
+class Connection:
+    """One keep-alive HTTP/1.1 client connection"""
+    
+    def __init__(self, port):
+        self.port = port
+        self.reader = None
+        self.writer = None
+    
+    async def post_json(self, path, data):
+        body = json.dumps(data).encode()
+        request = (
+            f"POST {path} HTTP/1.1\r\nHost: {HOST}:{self.port}\r\n"
+            f"Content-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+        ).encode() + body
+        
+        for attempt in range(2):
+            if self.writer is None:
+                self.reader, self.writer = await asyncio.open_connection(HOST, self.port)
+            try:
+                self.writer.write(request)
+                head = await self.reader.readuntil(b'\r\n\r\n')
+                break
+            except (OSError, asyncio.IncompleteReadError):
+                # Server closed an idle connection; reconnect once
+                self.close()
+                if attempt:
+                    raise
+        
+        lines = head.decode('latin-1').split('\r\n')
+        status = int(lines[0].split(' ', 2)[1])
+        headers = dict(line.lower().split(': ', 1) for line in lines[1:] if ': ' in line)
+        payload = await self.reader.readexactly(int(headers.get('content-length', 0)))
+        if headers.get('connection') == 'close':
+            self.close()
+        return status, payload
+    
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.reader = self.writer = None
+
+
+async def client(port, usernames, session_ids, login_share, deadline, samples, rng):
+    """Issue requests on one connection until the deadline"""
+    connection = Connection(port)
+    while time.perf_counter() < deadline:
+        if rng.random() < login_share:
+            route, data = '/api/login', {'username': rng.choice(usernames), 'password': PASSWORD}
+        else:
+            route, data = '/api/validate-session', {'session_id': rng.choice(session_ids)}
+        started = time.perf_counter()
+        try:
+            status, _ = await connection.post_json(route, data)
+        except (OSError, ValueError, asyncio.IncompleteReadError):
+            status = 0
+            connection.close()
+            await asyncio.sleep(0.05)
+        samples.append((route, status, time.perf_counter() - started))
+    connection.close()
+
+
+async def drive(port, args, usernames, session_ids, duration):
+    samples = []
+    deadline = time.perf_counter() + duration
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        client(port, usernames, session_ids, args.login_share, deadline, samples, random.Random(i))
+        for i in range(args.concurrency)
+    ))
+    return samples, time.perf_counter() - started
+
+
+def summarize(samples, elapsed):
+    latencies = defaultdict(list)
+    statuses = defaultdict(Counter)
+    for route, status, latency in samples:
+        statuses[route][status] += 1
+        if status == 200:
+            latencies[route].append(latency)
+    
+    report = {}
+    for route in sorted(statuses):
+        values = sorted(latencies[route])
+        report[route] = {
+            'ok_per_second': round(len(values) / elapsed, 1),
+            **{f"p{p}_ms": round(percentile(values, p) * 1000, 2) for p in PERCENTILES},
+            'other': {str(status): count for status, count in statuses[route].items() if status != 200}
+        }
+    return report
+
+
+def run(server, args, usernames, session_ids):
+    port = free_port()
+    process = start_server(server, port, args.cold)
+    try:
+        asyncio.run(drive(port, args, usernames, session_ids, args.warmup))
+        samples, elapsed = asyncio.run(drive(port, args, usernames, session_ids, args.duration))
+    finally:
+        process.terminate()
+        process.wait(timeout=30)
+    return summarize(samples, elapsed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--servers', nargs='+', default=['threaded', 'asgi'], choices=['threaded', 'asgi'])
+    parser.add_argument('--concurrency', type=int, default=500)
+    parser.add_argument('--duration', type=float, default=15)
+    parser.add_argument('--warmup', type=float, default=3)
+    parser.add_argument('--login-share', type=float, default=0.01)
+    parser.add_argument('--users', type=int, default=200)
+    parser.add_argument('--sessions', type=int, default=5000)
+    parser.add_argument('--cold', action='store_true', help='Disable the session cache in the servers')
+    parser.add_argument('--migrate', action='store_true', help='Apply pending migrations first')
+    parser.add_argument('--serve', choices=['threaded', 'asgi'], help=argparse.SUPPRESS)
+    parser.add_argument('--port', type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    
+    # Thousands of client sockets (and server threads) need the hard limit
+    soft, hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+    resource.setrlimit(resource.RLIMIT_NOFILE, (hard, hard))
+    
+    if args.serve:
+        serve(args.serve, args.port)
+        return
+    
+    if Database.driver().name == 'sqlite' and Database.driver().memory:
+        parser.error("an in-memory SQLite database cannot be shared with the servers")
+    
+    print("=" * 50)
+    print("Threaded vs Async Auth Serving Benchmark")
+    print("=" * 50)
+    print(f"{Database.driver().describe()}, {args.concurrency} connections, "
+          f"{args.login_share:.0%} logins, session cache {'off' if args.cold else 'on'}")
+    
+    if args.migrate:
+        MigrationRunner().migrate()
+    cleanup()
+    usernames, session_ids = seed(args.users, args.sessions, 0, random.Random(0))
+    
+    results = {}
+    try:
+        for server in args.servers:
+            results[server] = run(server, args, usernames, session_ids)
+            print(f"\n{server}")
+            for route, figures in results[server].items():
+                other = ', '.join(f"{status}: {count}" for status, count in figures['other'].items())
+                print(f"   {route:<24}{figures['ok_per_second']:9.1f} req/s   "
+                      f"p50 {figures['p50_ms']:8.2f}   p95 {figures['p95_ms']:8.2f}   "
+                      f"p99 {figures['p99_ms']:8.2f} ms" + (f"   ({other})" if other else ''))
+    finally:
+        cleanup()
+    
+    if len(results) == 2:
+        route = '/api/validate-session'
+        threaded, asgi = results['threaded'].get(route), results['asgi'].get(route)
+        if threaded and asgi and threaded['ok_per_second']:
+            print("\n" + "=" * 50)
+            print(f"Session checks: asgi {asgi['ok_per_second'] / threaded['ok_per_second']:.1f}x "
+                  f"the throughput, p99 {asgi['p99_ms']:.1f} vs {threaded['p99_ms']:.1f} ms")
+            print("=" * 50)
+
+
+if __name__ == '__main__':
+    main()
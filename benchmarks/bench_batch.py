@@ -0,0 +1,103 @@
+# benchmarks/bench_batch.py
+"""
+Batch write throughput benchmark
+
+Inserts and updates 1k and 10k rows in a scratch table three ways:
+one execute_query per row, execute_many in one transaction, and
+execute_many with smaller chunks. Reports rows/second, statements and
+commits. The driver sends each chunk of INSERTs as one multi-row
+statement; UPDATE chunks still run row by row inside the transaction,
+so their gain comes from the single commit.
+
+Usage:
+    python -m benchmarks.bench_batch --rows 1000 10000 --chunk-sizes 100 1000
+"""
+import argparse
+import time
+from backend.database import Database
+from benchmarks.counting import CountingDatabase
+
+TABLE = 'bench_batch_rows'
+
+INSERT_QUERY = f"INSERT INTO {TABLE} (row_id, label, amount) VALUES (%s, %s, %s)"
+UPDATE_QUERY = f"UPDATE {TABLE} SET amount = %s WHERE row_id = %s"
+
+
+def create_table():
+    Database.execute_query(f"DROP TABLE IF EXISTS {TABLE}")
+    Database.execute_query(f"""
+        CREATE TABLE {TABLE} (
+            row_id INT PRIMARY KEY,
+            label VARCHAR(50) NOT NULL,
+            amount INT NOT NULL
+        ) ENGINE = InnoDB
+    """)
+
+
+def drop_table():
+    Database.execute_query(f"DROP TABLE IF EXISTS {TABLE}")
+
+
+def insert_rows(count):
+    return [(i, f"row-{i}", i) for i in range(count)]
+
+
+def update_rows(count):
+    return [(i * 2, i) for i in range(count)]
+
+
+def per_row(query, rows):
+    for params in rows:
+        Database.execute_query(query, params)
+
+
+def batched(chunk_size):
+    def run(query, rows):
+        Database.execute_many(query, rows, chunk_size=chunk_size)
+    return run
+
+
+def measure(label, method, rows_count):
+    results = {}
+    for name, query, rows in (
+        ('insert', INSERT_QUERY, insert_rows(rows_count)),
+        ('update', UPDATE_QUERY, update_rows(rows_count))
+    ):
+        if name == 'insert':
+            Database.execute_query(f"DELETE FROM {TABLE}")
+        
+        with CountingDatabase() as counters:
+            started = time.perf_counter()
+            method(query, rows)
+            elapsed = time.perf_counter() - started
+        
+        results[name] = (rows_count / elapsed, counters['statements'], counters['commits'])
+    
+    print(f"   {label:<28}"
+          f"insert {results['insert'][0]:>10,.0f} rows/s ({results['insert'][1]} stmts, {results['insert'][2]} commits)   "
+          f"update {results['update'][0]:>10,.0f} rows/s ({results['update'][1]} stmts, {results['update'][2]} commits)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--rows', type=int, nargs='+', default=[1000, 10000])
+    parser.add_argument('--chunk-sizes', type=int, nargs='+', default=[100, 1000])
+    args = parser.parse_args()
+    
+    print("=" * 50)
+    print("Batch Write Throughput Benchmark")
+    print("=" * 50)
+    
+    create_table()
+    try:
+        for rows_count in args.rows:
+            print(f"\n{rows_count:,} rows")
+            measure('execute_query per row', per_row, rows_count)
+            for chunk_size in args.chunk_sizes:
+                measure(f'execute_many chunk={chunk_size}', batched(chunk_size), rows_count)
+    finally:
+        drop_table()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,161 @@
+# benchmarks/bench_drivers.py
+"""
+Per-query overhead of the database drivers
+
+Runs the hot query shapes (session validation, login lookup, a user list
+page, a single-row write) through Database.execute_query against each
+driver: in-memory SQLite, file-backed SQLite and, when it is reachable,
+the configured MySQL server. Every driver gets the same seeded rows and
+pending migrations are applied first. Reports microseconds per query.
+
+Usage:
+    python -m benchmarks.bench_drivers --iterations 2000 --users 1000
+    python -m benchmarks.bench_drivers --drivers sqlite-memory sqlite-file
+"""
+import os
+import argparse
+import tempfile
+import time
+from datetime import datetime, timedelta
+from app_config import Config
+from backend.database import Database
+from backend.drivers import MySQLDriver, SQLiteDriver
+from backend.migrations import MigrationRunner
+from backend.auth import AuthManager, SESSION_QUERY
+
+PREFIX = 'drv_'
+
+LOGIN_QUERY = """
+    SELECT user_id, username, password_hash, full_name, role, status
+    FROM users
+    WHERE username = %s
+"""
+
+LIST_QUERY = """
+    SELECT user_id, username, full_name, email, phone, role, status,
+           employment_date, created_at, last_login
+    FROM users
+    WHERE role = %s
+    ORDER BY created_at DESC, user_id DESC
+    LIMIT %s
+"""
+
+TOUCH_QUERY = "UPDATE user_sessions SET last_activity = %s WHERE session_id = %s"
+
+
+def seed(users):
+    user_ids = [f"{PREFIX}{i:028d}" for i in range(users)]
+    Database.execute_many("""
+        INSERT INTO users (
+            user_id, username, password_hash, full_name, email, phone,
+            role, employment_date, status
+        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+    """, (
+        (user_id, f"{PREFIX}u{i:06d}", 'not-a-real-hash', f"Driver User {i}",
+         f"{PREFIX}u{i:06d}@example.com", f"09{i:09d}",
+         ('Admin', 'Inventory Clerk', 'Cashier')[i % 3], '2024-01-01', 'Active')
+        for i, user_id in enumerate(user_ids)
+    ))
+    session_ids = [AuthManager.generate_session_id() for _ in user_ids]
+    Database.execute_many("""
+        INSERT INTO user_sessions (session_id, user_id, ip_address, user_agent, last_activity)
+        VALUES (%s, %s, %s, %s, %s)
+    """, ((session_id, user_id, '127.0.0.1', 'bench_drivers', datetime.now())
+          for session_id, user_id in zip(session_ids, user_ids)))
+    return session_ids
+
+
+def cleanup():
+    # Sessions go with their users; '!' escapes '_' in both dialects
+    Database.execute_query("DELETE FROM users WHERE user_id LIKE %s ESCAPE '!'",
+                           (PREFIX.replace('_', '!_') + '%',))
+
+
+def workloads(session_ids, users):
+    """(label, query, params for iteration i, fetch)"""
+    active_since = datetime.now() - timedelta(seconds=Config.SESSION_TIMEOUT)
+    return (
+        ('Session validation', SESSION_QUERY,
+         lambda i: (session_ids[i % len(session_ids)], active_since), True),
+        ('Login lookup', LOGIN_QUERY,
+         lambda i: (f"{PREFIX}u{i % users:06d}",), True),
+        ('User list page (50)', LIST_QUERY,
+         lambda i: (('Admin', 'Inventory Clerk', 'Cashier')[i % 3], 50), True),
+        ('Activity update + commit', TOUCH_QUERY,
+         lambda i: (datetime.now(), session_ids[i % len(session_ids)]), False),
+    )
+
+
+def measure(query, params, fetch, iterations):
+    for i in range(min(iterations, 50)):  # warm up pool and statement caches
+        Database.execute_query(query, params(i), fetch=fetch)
+    started = time.perf_counter()
+    for i in range(iterations):
+        Database.execute_query(query, params(i), fetch=fetch)
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def run(label, driver, args):
+    Database.use_driver(driver)
+    try:
+        MigrationRunner().migrate()
+        cleanup()
+        session_ids = seed(args.users)
+    except driver.Error as e:
+        print(f"\n{label}: skipped ({e})")
+        return None
+    
+    results = {}
+    try:
+        print(f"\n{label} ({driver.describe()})")
+        for name, query, params, fetch in workloads(session_ids, args.users):
+            results[name] = measure(query, params, fetch, args.iterations)
+            print(f"   {name:<26}{results[name]:10.1f} us/query")
+    finally:
+        cleanup()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--iterations', type=int, default=2000)
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--drivers', nargs='+', default=['sqlite-memory', 'sqlite-file', 'mysql'],
+                        choices=['sqlite-memory', 'sqlite-file', 'mysql'])
+    args = parser.parse_args()
+    
+    print("=" * 50)
+    print("Database Driver Overhead Benchmark")
+    print("=" * 50)
+    
+    original = Database.driver()
+    all_results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        drivers = {
+            'sqlite-memory': lambda: SQLiteDriver(':memory:'),
+            'sqlite-file': lambda: SQLiteDriver(os.path.join(directory, 'bench.db')),
+            'mysql': MySQLDriver,
+        }
+        try:
+            for name in args.drivers:
+                results = run(name, drivers[name](), args)
+                if results:
+                    all_results[name] = results
+        finally:
+            Database.use_driver(original)
+    
+    if len(all_results) > 1:
+        baseline, *others = all_results
+        print("\n" + "=" * 50)
+        print(f"Relative to {baseline}")
+        for name in others:
+            ratios = ', '.join(
+                f"{query.split(' ')[0].lower()} {all_results[name][query] / all_results[baseline][query]:.1f}x"
+                for query in all_results[baseline]
+            )
+            print(f"   {name}: {ratios}")
+        print("=" * 50)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+# benchmarks/bench_inventory.py
+"""
+Inventory search latency over a large catalogue
+
+Seeds --products products (100k by default, with search terms) and times
+the inventory search shapes through InventoryManager.search: the first
+and a deep page in name order, word and SKU prefix searches, category and
+low/critical stock filters. For comparison it also times what the page
+used to do, loading every product and filtering in Python. Seeded
+products are removed at the end unless --keep is given.
+
+Usage:
+    python -m benchmarks.bench_inventory --products 100000 --iterations 200
+    DB_DRIVER=sqlite DB_SQLITE_PATH=inventory.db python -m benchmarks.bench_inventory --migrate
+"""
+import random
+import argparse
+import time
+from backend.database import Database
+from backend.migrations import MigrationRunner
+from backend.inventory import InventoryManager, INSERT_TERM_QUERY, search_terms, prefix_pattern
+from backend.validation import Validator
+
+SKU_PREFIX = 'BNC-'
+
+ADJECTIVES = ('Heavy Duty', 'Galvanized', 'Stainless', 'Cordless', 'Industrial', 'Compact',
+              'Heat Resistant', 'Waterproof', 'Precision', 'Adjustable', 'Insulated', 'Reinforced')
+NOUNS = ('Hammer', 'Drill', 'Hinge', 'Wrench', 'Gloves', 'Goggles', 'Pipe Fitting', 'Cable',
+         'Paint Roller', 'Screwdriver Set', 'Anchor Bolt', 'Ladder', 'Sealant', 'Switch', 'Valve')
+SIZES = ('1/4in', '1/2in', '3/4in', '1in', '2in', '5m', '10m', '25m', '1kg', '5kg', 'Small', 'Large')
+
+LIMIT = 25
+
+
+def seed(count, rng):
+    """Insert count products with their search terms"""
+    def products():
+        for i in range(count):
+            stock_roll = rng.random()
+            min_stock = rng.randint(5, 50)
+            stock = 0 if stock_roll < 0.03 else rng.randint(1, min_stock - 1) if stock_roll < 0.12 \
+                else rng.randint(min_stock, 500)
+            name = f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)} {rng.choice(SIZES)} #{i}"
+            yield (f"{SKU_PREFIX}{i:07d}", name, Validator.CATEGORIES[i % len(Validator.CATEGORIES)],
+                   stock, min_stock, round(rng.uniform(1, 5000), 2), None)
+    
+    Database.execute_many("""
+        INSERT INTO products (sku, name, category, stock, min_stock, price, description)
+        VALUES (%s, %s, %s, %s, %s, %s, %s)
+    """, products())
+    
+    rows = Database.execute_query(
+        "SELECT product_id, sku, name FROM products WHERE sku LIKE %s ESCAPE '!'",
+        (prefix_pattern(SKU_PREFIX),), fetch=True
+    )
+    Database.execute_many(INSERT_TERM_QUERY, (
+        (term, row['product_id']) for row in rows for term in search_terms(row['name'], row['sku'])
+    ))
+    return len(rows)
+
+
+def cleanup():
+    # Search terms go with their products
+    Database.execute_query("DELETE FROM products WHERE sku LIKE %s ESCAPE '!'",
+                           (prefix_pattern(SKU_PREFIX),))
+
+
+def deep_cursor(pages):
+    """[name, product_id] after `pages` full pages in name order"""
+    rows = Database.execute_query(
+        "SELECT name, product_id FROM products ORDER BY name, product_id LIMIT 1 OFFSET %s",
+        (pages * LIMIT - 1,), fetch=True
+    )
+    return [rows[0]['name'], rows[0]['product_id']] if rows else None
+
+
+def old_page_filter(text, stock):
+    """Every product loaded and filtered like the old renderInventory()"""
+    rows = Database.execute_query("SELECT * FROM products", fetch=True)
+    text = text.lower()
+    matches = []
+    for row in rows:
+        if text not in row['name'].lower() and text not in row['sku'].lower():
+            continue
+        if stock == 'low' and not 0 < row['stock'] < row['min_stock']:
+            continue
+        if stock == 'critical' and row['stock'] != 0:
+            continue
+        matches.append(row)
+    return matches[:LIMIT]
+
+
+def measure(fn, iterations):
+    fn()  # warm up caches
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return (time.perf_counter() - started) / iterations * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--products', type=int, default=100000)
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--migrate', action='store_true', help='Apply pending migrations first')
+    parser.add_argument('--keep', action='store_true', help='Leave the seeded products in place')
+    args = parser.parse_args()
+    
+    print("=" * 50)
+    print("Inventory Search Benchmark")
+    print("=" * 50)
+    
+    if args.migrate:
+        MigrationRunner().migrate()
+    cleanup()
+    
+    started = time.perf_counter()
+    seeded = seed(args.products, random.Random(0))
+    print(f"Seeded {seeded} products in {time.perf_counter() - started:.1f}s "
+          f"({Database.driver().describe()})")
+    
+    after = deep_cursor(100)
+    searches = (
+        ('First page, name order', lambda: InventoryManager.search(limit=LIMIT)),
+        ('Page 101, name order', lambda: InventoryManager.search(after=after, limit=LIMIT)),
+        ("Word prefix 'dril'", lambda: InventoryManager.search('dril', limit=LIMIT)),
+        ("Two words 'cordless drill'", lambda: InventoryManager.search('cordless drill', limit=LIMIT)),
+        ("Rare word '#4242'", lambda: InventoryManager.search('4242', limit=LIMIT)),
+        ("SKU prefix 'BNC-00123'", lambda: InventoryManager.search(sku='BNC-00123', limit=LIMIT)),
+        ('Category Tools', lambda: InventoryManager.search(category='Tools', limit=LIMIT)),
+        ('Low stock', lambda: InventoryManager.search(stock='low', limit=LIMIT)),
+        ('Critical + word', lambda: InventoryManager.search('valve', stock='critical', limit=LIMIT)),
+    )
+    
+    try:
+        print(f"\n{'Search':<32}{'ms/query':>10}")
+        for label, search in searches:
+            print(f"{label:<32}{measure(search, args.iterations):10.2f}")
+        
+        old = measure(lambda: old_page_filter('dril', 'low'), max(1, args.iterations // 50))
+        print(f"\n{'Load all + filter (old page)':<32}{old:10.2f}")
+    finally:
+        if not args.keep:
+            cleanup()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,488 @@
+# benchmarks/bench_load.py
+"""
+End-to-end load benchmark for the auth and user APIs
+
+Seeds users, sessions and login attempts, serves the app on a local
+threaded server and drives /api/login, /api/validate-session,
+/api/users/register and /api/users/list from concurrent clients in a
+weighted mix. Reports p50/p95/p99 latency and throughput per route, plus
+database round trips (statements + commits) per request, counted inside
+the server. Work done by background flushers is reported separately.
+The email DNS check is off for the run: the registered addresses are fake.
+
+Results are written as JSON; pass an earlier file with --compare to see
+the change between commits. Seeded and registered rows are removed at
+the end unless --keep is given.
+
+Usage:
+    python -m benchmarks.bench_load --users 1000 --clients 8 --duration 30
+    python -m benchmarks.bench_load --compare benchmarks/results/load-1a2b3c4.json
+    DB_DRIVER=sqlite DB_SQLITE_PATH=load.db python -m benchmarks.bench_load --migrate
+"""
+import os
+import json
+import random
+import itertools
+import logging
+import argparse
+import threading
+import subprocess
+import http.client
+import time
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta
+from urllib.parse import urlencode
+from flask import has_request_context, request
+from werkzeug.serving import make_server
+from app_config import Config
+from backend.database import Database
+from backend.auth import AuthManager, attempt_logger, activity_buffer
+from backend.migrations import MigrationRunner
+from benchmarks.counting import CountingDatabase, CountingConnection
+
+RESULTS_FOLDER = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'results')
+
+# Every seeded and registered username starts with this
+PREFIX = 'load_'
+PASSWORD = 'LoadTest#2024'
+
+# operation -> (route reported by the server, default weight)
+OPERATIONS = {
+    'login': ('/api/login', 1),
+    'validate': ('/api/validate-session', 6),
+    'register': ('/api/users/register', 1),
+    'list': ('/api/users/list', 2),
+}
+
+PERCENTILES = (50, 95, 99)
+
+
+class RouteCountingDatabase(CountingDatabase):
+    """
+    CountingDatabase split by the Flask route that made the call
+    
+    Server threads count into their own buckets, so concurrent requests
+    never share a counter; buckets are summed by totals(). Calls made
+    outside a request are counted under 'background'.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self._local = threading.local()
+        self._buckets = []
+        self._lock = threading.Lock()
+    
+    def _bucket(self, route):
+        buckets = getattr(self._local, 'buckets', None)
+        if buckets is None:
+            buckets = defaultdict(Counter)
+            self._local.buckets = buckets
+            with self._lock:
+                self._buckets.append(buckets)
+        return buckets[route]
+    
+    def __enter__(self):
+        self._original = Database.__dict__['get_connection']
+        original = Database.get_connection
+        
+        def get_connection():
+            route = 'background'
+            if has_request_context() and request.url_rule is not None:
+                route = request.url_rule.rule
+            counters = self._bucket(route)
+            counters['checkouts'] += 1
+            return CountingConnection(original(), counters)
+        
+        Database.get_connection = staticmethod(get_connection)
+        return self
+    
+    def totals(self):
+        """Return {route: Counter} summed over every thread"""
+        merged = defaultdict(Counter)
+        with self._lock:
+            for buckets in self._buckets:
+                for route, counters in list(buckets.items()):
+                    merged[route].update(counters)
+        return merged
+
+
+def seed(users, sessions, attempts, rng):
+    """
+    Insert benchmark users, active sessions and historical login attempts
+    
+    Returns:
+        tuple: (usernames, session_ids)
+    """
+    # One real Argon2 hash shared by every seeded user, so logins verify
+    password_hash = AuthManager.hash_password(PASSWORD)
+    usernames = [f"{PREFIX}u{i:06d}" for i in range(users)]
+    user_ids = [AuthManager.generate_user_id(name, '') for name in usernames]
+    roles = ('Admin', 'Inventory Clerk', 'Cashier')
+    
+    Database.execute_many("""
+        INSERT INTO users (
+            user_id, username, password_hash, full_name, email, phone,
+            role, employment_date, status
+        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+    """, (
+        (user_id, name, password_hash, f"Load User {i}", f"{name}@example.com",
+         f"09{i:09d}", roles[i % len(roles)], '2024-01-01', 'Active')
+        for i, (user_id, name) in enumerate(zip(user_ids, usernames))
+    ))
+    
+    session_ids = [AuthManager.generate_session_id() for _ in range(sessions)]
+    Database.execute_many("""
+        INSERT INTO user_sessions (session_id, user_id, ip_address, user_agent, last_activity)
+        VALUES (%s, %s, %s, %s, %s)
+    """, ((session_id, rng.choice(user_ids), '127.0.0.1', 'bench_load', datetime.now())
+          for session_id in session_ids))
+    
+    # Spread over the last 30 days, all older than the lockout window so
+    # seeded failures never lock out the accounts the clients log in to
+    now = datetime.now()
+    oldest = 30 * 86400
+    newest = Config.ACCOUNT_LOCKOUT_DURATION + 3600
+    Database.execute_many("""
+        INSERT INTO login_attempts
+        (username, attempt_time, ip_address, success, failure_reason)
+        VALUES (%s, %s, %s, %s, %s)
+    """, (
+        (name, now - timedelta(seconds=rng.randint(newest, oldest)), '127.0.0.1',
+         success, '' if success else 'Invalid password')
+        for name, success in ((rng.choice(usernames), rng.random() < 0.8)
+                              for _ in range(attempts))
+    ))
+    return usernames, session_ids
+
+
+def cleanup():
+    """Remove every benchmark row (sessions go with their users)"""
+    # '!' escapes '_' in both MySQL and SQLite
+    pattern = PREFIX.replace('_', '!_') + '%'
+    Database.execute_query("DELETE FROM login_attempts WHERE username LIKE %s ESCAPE '!'", (pattern,))
+    Database.execute_query("DELETE FROM users WHERE username LIKE %s ESCAPE '!'", (pattern,))
+
+
+class Client:
+    """One simulated client issuing requests over its own connection"""
+    
+    def __init__(self, host, port, usernames, session_ids, run_id, index, rng):
+        self.host = host
+        self.port = port
+        self.usernames = usernames
+        self.session_ids = session_ids
+        self.run_id = run_id
+        self.index = index
+        self.rng = rng
+        self.registered = 0
+        self.connection = http.client.HTTPConnection(host, port, timeout=60)
+    
+    def request(self, method, path, body=None, headers=None):
+        try:
+            self.connection.request(method, path, body=body, headers=headers or {})
+            response = self.connection.getresponse()
+            payload = response.read()
+        except (http.client.HTTPException, OSError):
+            # The development server may close idle connections; retry once
+            self.connection.close()
+            self.connection = http.client.HTTPConnection(self.host, self.port, timeout=60)
+            self.connection.request(method, path, body=body, headers=headers or {})
+            response = self.connection.getresponse()
+            payload = response.read()
+        if response.getheader('Connection', '').lower() == 'close':
+            self.connection.close()
+        return response.status, payload
+    
+    def post_json(self, path, data):
+        return self.request('POST', path, json.dumps(data),
+                            {'Content-Type': 'application/json'})
+    
+    def login(self):
+        status, payload = self.post_json('/api/login', {
+            'username': self.rng.choice(self.usernames),
+            'password': PASSWORD
+        })
+        if status == 200:
+            session_id = json.loads(payload).get('session_id')
+            if session_id:
+                self.session_ids.append(session_id)
+        return status
+    
+    def validate(self):
+        return self.post_json('/api/validate-session', {
+            'session_id': self.rng.choice(self.session_ids)
+        })[0]
+    
+    def register(self):
+        self.registered += 1
+        # load_r + run id + client + counter stays within the 20 character limit
+        username = f"{PREFIX}r{self.run_id}{self.index:02d}{self.registered:05d}"
+        form = urlencode({
+            'fullName': 'Load Registered User',
+            'email': f"{username}@example.com",
+            'phone': f"09{self.rng.randrange(10 ** 9):09d}",
+            'employmentDate': '2024-01-01',
+            'username': username,
+            'role': 'Cashier',
+            'password': PASSWORD,
+            'status': 'Active'
+        })
+        return self.request('POST', '/api/users/register', form,
+                            {'Content-Type': 'application/x-www-form-urlencoded'})[0]
+    
+    def list(self):
+        params = {'limit': 50}
+        if self.rng.random() < 0.5:
+            params['role'] = self.rng.choice(('Admin', 'Inventory Clerk', 'Cashier'))
+        return self.request('GET', f"/api/users/list?{urlencode(params)}")[0]
+    
+    def close(self):
+        self.connection.close()
+
+
+def drive(client, operations, weights, deadline, samples):
+    """Issue weighted random requests until the deadline"""
+    while time.perf_counter() < deadline:
+        operation = client.rng.choices(operations, weights)[0]
+        started = time.perf_counter()
+        try:
+            status = getattr(client, operation)()
+        except Exception:
+            status = 0
+        samples.append((operation, status, time.perf_counter() - started))
+    client.close()
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-p * len(sorted_values) // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def summarize(samples, counters, elapsed):
+    """
+    Per-operation latency, throughput and round trips
+    
+    Returns:
+        dict: operation -> figures; 'all' for the whole mix and
+              'background' for round trips made outside requests
+    """
+    by_operation = defaultdict(list)
+    for operation, status, latency in samples:
+        by_operation[operation].append((status, latency))
+    
+    report = {}
+    for operation, rows in sorted(by_operation.items()):
+        report[operation] = figures(rows, elapsed, counters.get(OPERATIONS[operation][0], Counter()))
+    
+    everything = [row for rows in by_operation.values() for row in rows]
+    total = Counter()
+    for route, route_counters in counters.items():
+        if route != 'background':
+            total.update(route_counters)
+    report['all'] = figures(everything, elapsed, total)
+    
+    background = counters.get('background', Counter())
+    trips = background['statements'] + background['commits']
+    report['background'] = {
+        'statements': background['statements'],
+        'commits': background['commits'],
+        'round_trips': trips,
+        'round_trips_per_request': round(trips / max(len(everything), 1), 3)
+    }
+    return report
+
+
+def figures(rows, elapsed, counters):
+    latencies = sorted(latency * 1000 for _, latency in rows)
+    statuses = Counter(str(status) for status, _ in rows)
+    result = {
+        'requests': len(rows),
+        'errors': sum(1 for status, _ in rows if status == 0 or status >= 500),
+        'statuses': dict(sorted(statuses.items())),
+        'throughput_rps': round(len(rows) / elapsed, 2),
+        'mean_ms': round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+        'max_ms': round(latencies[-1], 3) if latencies else 0.0,
+    }
+    for p in PERCENTILES:
+        result[f"p{p}_ms"] = round(percentile(latencies, p), 3)
+    
+    requests = max(len(rows), 1)
+    result['db'] = {
+        'checkouts_per_request': round(counters['checkouts'] / requests, 3),
+        'statements_per_request': round(counters['statements'] / requests, 3),
+        'commits_per_request': round(counters['commits'] / requests, 3),
+        'round_trips_per_request': round(
+            (counters['statements'] + counters['commits']) / requests, 3)
+    }
+    return result
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(RESULTS_FOLDER)
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def print_report(report, previous=None):
+    print(f"\n{'':<10}{'req/s':>9}{'p50':>9}{'p95':>9}{'p99':>9}{'trips':>8}{'errors':>8}")
+    for operation in list(OPERATIONS) + ['all']:
+        row = report.get(operation)
+        if row is None:
+            continue
+        print(f"{operation:<10}{row['throughput_rps']:>9.1f}{row['p50_ms']:>9.2f}"
+              f"{row['p95_ms']:>9.2f}{row['p99_ms']:>9.2f}"
+              f"{row['db']['round_trips_per_request']:>8.2f}{row['errors']:>8}")
+        
+        before = (previous or {}).get(operation)
+        if before:
+            print(f"{'  vs prev':<10}{change(before['throughput_rps'], row['throughput_rps']):>9}"
+                  f"{change(before['p50_ms'], row['p50_ms']):>9}"
+                  f"{change(before['p95_ms'], row['p95_ms']):>9}"
+                  f"{change(before['p99_ms'], row['p99_ms']):>9}")
+    
+    print(f"\nBackground round trips: {report['background']['round_trips']} "
+          f"({report['background']['round_trips_per_request']:.3f} per request)")
+    print("Latencies in ms; trips = statements + commits per request")
+
+
+def change(before, after):
+    if not before:
+        return '-'
+    return f"{(after - before) / before * 100:+.1f}%"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--users', type=int, default=1000)
+    parser.add_argument('--sessions', type=int, default=1000)
+    parser.add_argument('--attempts', type=int, default=10000)
+    parser.add_argument('--clients', type=int, default=8)
+    parser.add_argument('--duration', type=float, default=30, help='Seconds of load')
+    parser.add_argument('--warmup', type=float, default=3, help='Seconds of unrecorded load')
+    parser.add_argument('--mix', default=','.join(f"{name}={weight}" for name, (_, weight) in OPERATIONS.items()),
+                        help='Operation weights, e.g. login=1,validate=6,register=1,list=2')
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', help='Result file (default benchmarks/results/load-<commit>.json)')
+    parser.add_argument('--compare', help='Earlier result file to compare against')
+    parser.add_argument('--keep', action='store_true', help='Keep benchmark rows afterwards')
+    parser.add_argument('--migrate', action='store_true',
+                        help='Apply pending migrations first (e.g. a fresh SQLite database)')
+    args = parser.parse_args()
+    if args.duration <= 0:
+        parser.error("--duration must be positive")
+    
+    mix = dict(item.split('=') for item in args.mix.split(','))
+    unknown = set(mix) - set(OPERATIONS)
+    if unknown:
+        parser.error(f"Unknown operation(s) in --mix: {', '.join(sorted(unknown))}")
+    operations = list(mix)
+    weights = [float(mix[name]) for name in operations]
+    
+    print("=" * 50)
+    print("End-to-End Load Benchmark")
+    print("=" * 50)
+    
+    if args.migrate:
+        MigrationRunner().migrate()
+    
+    from app import app
+    
+    # Per-request INFO logs would dominate the measurement
+    logging.disable(logging.INFO)
+    
+    # Registered users get @example.com addresses, whose null MX record
+    # fails the DNS check: every registration would be a 400
+    Config.EMAIL_CHECK_DELIVERABILITY = False
+    
+    rng = random.Random(args.seed)
+    run_id = f"{rng.randrange(16 ** 4):04x}"
+    
+    cleanup()
+    started = time.perf_counter()
+    usernames, session_ids = seed(args.users, args.sessions, args.attempts, rng)
+    print(f"Seeded {args.users} users, {args.sessions} sessions and "
+          f"{args.attempts} login attempts in {time.perf_counter() - started:.1f}s")
+    
+    client_numbers = itertools.count()
+    server = make_server('127.0.0.1', 0, app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    
+    try:
+        for phase, duration in (('warmup', args.warmup), ('measured', args.duration)):
+            if duration <= 0:
+                continue
+            samples = []
+            clients = []
+            for _ in range(args.clients):
+                index = next(client_numbers)
+                clients.append(Client('127.0.0.1', server.server_port, usernames, session_ids,
+                                      run_id, index, random.Random(f"{args.seed}-{index}")))
+            counting = RouteCountingDatabase()
+            with counting:
+                deadline = time.perf_counter() + duration
+                threads = [
+                    threading.Thread(target=drive, args=(client, operations, weights, deadline, samples))
+                    for client in clients
+                ]
+                phase_started = time.perf_counter()
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                elapsed = time.perf_counter() - phase_started
+                
+                # Write-behind work queued by this phase belongs to it
+                attempt_logger.flush()
+                activity_buffer.flush()
+            
+            if phase == 'measured':
+                report = summarize(samples, counting.totals(), elapsed)
+    finally:
+        server.shutdown()
+        if not args.keep:
+            cleanup()
+    
+    result = {
+        'benchmark': 'load',
+        'commit': git_commit(),
+        'recorded_at': datetime.now().isoformat(timespec='seconds'),
+        'settings': {
+            'users': args.users,
+            'sessions': args.sessions,
+            'attempts': args.attempts,
+            'clients': args.clients,
+            'duration': args.duration,
+            'mix': {name: float(mix[name]) for name in operations},
+            'seed': args.seed,
+            'db_driver': Database.driver().describe(),
+            'db_prepared_statements': Config.DB_PREPARED_STATEMENTS,
+            'db_pool_size': Config.DB_POOL_SIZE
+        },
+        'results': report,
+        'db_pool': Database.pool_stats()
+    }
+    
+    previous = None
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as f:
+            previous = json.load(f)
+        print(f"\nComparing with {args.compare} (commit {previous.get('commit')})")
+    print_report(report, previous['results'] if previous else None)
+    
+    output = args.output or os.path.join(RESULTS_FOLDER, f"load-{result['commit']}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(result, f, indent=2, default=str)
+    print(f"\nResults written to {output}")
+
+
+if __name__ == '__main__':
+    main()
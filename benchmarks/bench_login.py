@@ -0,0 +1,159 @@
+# benchmarks/bench_login.py
+"""
+Login round-trip benchmark
+
+Compares the database work of the original /api/login flow (six separate
+execute_query calls, each with its own checkout and commit) against the
+current flow (in-memory lockout, one SELECT, one write transaction whose
+session INSERT sets last_login by trigger, and a batched attempt log).
+Both flows replace the password hash, and both include the
+/api/validate-session call the page a login redirects to makes first:
+originally a SELECT plus an UPDATE, now answered from the session cache
+the login fills. Argon2 is left out; only database work is measured.
+
+Dates are passed as parameters, so the same SQL runs on every driver.
+
+Usage:
+    python -m benchmarks.bench_login --iterations 200
+    DB_DRIVER=sqlite DB_SQLITE_PATH=login.db python -m benchmarks.bench_login --migrate
+"""
+import argparse
+import time
+from datetime import date, datetime, timedelta
+from backend.database import Database
+from backend.migrations import MigrationRunner
+from backend.auth import AuthManager, SESSION_QUERY, activity_buffer, attempt_logger, lockout_tracker
+from benchmarks.counting import CountingDatabase
+
+BENCH_USER_ID = 'bench0000000000000000000000login'
+BENCH_USERNAME = 'bench_login'
+
+
+def seed_user():
+    Database.execute_query("DELETE FROM users WHERE user_id = %s", (BENCH_USER_ID,))
+    Database.execute_query("""
+        INSERT INTO users (
+            user_id, username, password_hash, full_name, email, phone,
+            role, employment_date, status
+        ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, 'Active')
+    """, (BENCH_USER_ID, BENCH_USERNAME, 'not-a-real-hash', 'Benchmark User',
+          'bench_login@example.com', '09170000000', 'Cashier', date.today()))
+
+
+def cleanup():
+    Database.execute_query("DELETE FROM user_sessions WHERE user_id = %s", (BENCH_USER_ID,))
+    Database.execute_query("DELETE FROM login_attempts WHERE username = %s", (BENCH_USERNAME,))
+    Database.execute_query("DELETE FROM users WHERE user_id = %s", (BENCH_USER_ID,))
+
+
+def legacy_login(username):
+    """The original login() database sequence"""
+    Database.execute_query("""
+        SELECT COUNT(*) as failed_count,
+               MAX(attempt_time) as last_attempt
+        FROM login_attempts
+        WHERE username = %s
+        AND success = FALSE
+        AND attempt_time > %s
+    """, (username, datetime.now() - timedelta(minutes=15)), fetch=True)
+    
+    user = Database.execute_query("""
+        SELECT user_id, username, password_hash, full_name, role, status
+        FROM users
+        WHERE username = %s
+    """, (username,), fetch=True)[0]
+    
+    Database.execute_query(
+        "UPDATE users SET password_hash = %s WHERE user_id = %s",
+        (user['password_hash'], user['user_id'])
+    )
+    
+    session_id = AuthManager.create_session(user['user_id'], '127.0.0.1', 'bench')
+    
+    Database.execute_query("""
+        UPDATE users
+        SET last_login = %s, failed_login_attempts = 0
+        WHERE user_id = %s
+    """, (datetime.now(), user['user_id']))
+    
+    Database.execute_query("""
+        INSERT INTO login_attempts
+        (username, ip_address, success, failure_reason)
+        VALUES (%s, %s, %s, %s)
+    """, (username, '127.0.0.1', True, ''))
+    
+    # The landing page's session check
+    if Database.execute_query(SESSION_QUERY, (session_id, datetime.now() - timedelta(hours=1)), fetch=True):
+        Database.execute_query("UPDATE user_sessions SET last_activity = %s WHERE session_id = %s",
+                               (datetime.now(), session_id))
+
+
+def current_login(username):
+    """The current login() database sequence"""
+    lockout_tracker.check(username)
+    
+    user = Database.execute_query("""
+        SELECT user_id, username, password_hash, full_name, role, status
+        FROM users
+        WHERE username = %s
+    """, (username,), fetch=True)[0]
+    
+    session_id = AuthManager.complete_login(user['user_id'], '127.0.0.1', 'bench', user['password_hash'])
+    AuthManager.prime_session(session_id, user)
+    AuthManager.log_login_attempt(username, True, '127.0.0.1')
+    
+    # The landing page's session check
+    AuthManager.validate_session(session_id)
+
+
+def run(name, flow, iterations):
+    flow(BENCH_USERNAME)  # warm up pool and lockout tracker
+    
+    with CountingDatabase() as counters:
+        started = time.perf_counter()
+        for _ in range(iterations):
+            flow(BENCH_USERNAME)
+        attempt_logger.flush()
+        activity_buffer.flush()
+        elapsed = time.perf_counter() - started
+    
+    per_login = {key: value / iterations for key, value in counters.items()}
+    print(f"\n{name}")
+    print(f"   Checkouts per login:  {per_login['checkouts']:.2f}")
+    print(f"   Statements per login: {per_login['statements']:.2f}")
+    print(f"   Commits per login:    {per_login['commits']:.2f}")
+    print(f"   Round trips per login: {per_login['statements'] + per_login['commits']:.2f}")
+    print(f"   Mean latency:         {elapsed / iterations * 1000:.2f} ms")
+    return per_login
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--iterations', type=int, default=200)
+    parser.add_argument('--migrate', action='store_true', help='Apply pending migrations first')
+    args = parser.parse_args()
+    
+    print("=" * 50)
+    print("Login Round-Trip Benchmark")
+    print("=" * 50)
+    print(Database.driver().describe())
+    
+    if args.migrate:
+        MigrationRunner().migrate()
+    seed_user()
+    try:
+        before = run('Before (eight execute_query calls)', legacy_login, args.iterations)
+        after = run('After (one write transaction, cached session)', current_login, args.iterations)
+    finally:
+        cleanup()
+    
+    before_trips = before['statements'] + before['commits']
+    after_trips = after['statements'] + after['commits']
+    print("\n" + "=" * 50)
+    print(f"Round trips reduced {before_trips / after_trips:.1f}x, "
+          f"commits reduced {before['commits'] / max(after['commits'], 0.01):.1f}x")
+    print("=" * 50)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+# benchmarks/bench_photos.py
+"""
+Profile photo processing benchmark
+
+Generates large JPEG and PNG uploads and produces every PHOTO_SIZES
+variant two ways: the original approach (Image.open + thumbnail + save,
+once per size) and PhotoProcessor.render (one reduced decode, sizes cut
+from each other). Then pushes a batch of uploads through PhotoProcessor
+pools of different sizes to show throughput off the request thread.
+
+Usage:
+    python -m benchmarks.bench_photos --iterations 5 --workers 1 2 4
+"""
+import io
+import os
+import argparse
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
+from backend.photos import PhotoProcessor, PHOTO_SIZES, variant_path
+
+INPUTS = (
+    ('JPEG 4000x3000', 'JPEG', (4000, 3000)),
+    ('JPEG 6000x4000', 'JPEG', (6000, 4000)),
+    ('PNG  3000x3000', 'PNG', (3000, 3000)),
+)
+
+
+def make_upload(file_format, size):
+    # Noise over a gradient compresses like a photo rather than a flat fill
+    gradient = Image.linear_gradient('L').resize(size)
+    noise = Image.effect_noise(size, 40)
+    image = Image.merge('RGB', (gradient, noise, Image.blend(gradient, noise, 0.5)))
+    buffer = io.BytesIO()
+    image.save(buffer, file_format, quality=90) if file_format == 'JPEG' else image.save(buffer, file_format)
+    return buffer.getvalue()
+
+
+def legacy(data, photo_path):
+    """The original register_user() resize, repeated for each size"""
+    for name, size in PHOTO_SIZES:
+        image = Image.open(io.BytesIO(data))
+        image.thumbnail((size, size))
+        image.convert('RGB').save(variant_path(photo_path, name), 'JPEG', quality=85)
+
+
+def measure(fn, data, photo_path, iterations):
+    fn(data, photo_path)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn(data, photo_path)
+    return (time.perf_counter() - started) / iterations * 1000
+
+
+def throughput(data, directory, workers, uploads):
+    processor = PhotoProcessor(workers)
+    paths = [os.path.join(directory, f"upload_{i}.jpg") for i in range(uploads)]
+    try:
+        # Simulate concurrent request threads waiting on the pool
+        with ThreadPoolExecutor(max_workers=uploads) as requests:
+            started = time.perf_counter()
+            list(requests.map(lambda path: processor.process(data, path), paths))
+            return uploads / (time.perf_counter() - started)
+    finally:
+        processor.shutdown()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--iterations', type=int, default=5)
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4])
+    parser.add_argument('--uploads', type=int, default=16)
+    args = parser.parse_args()
+
+    print("=" * 50)
+    print("Photo Processing Benchmark")
+    print("=" * 50)
+
+    processor = PhotoProcessor(1)
+    with tempfile.TemporaryDirectory() as directory:
+        photo_path = os.path.join(directory, 'photo.jpg')
+        for label, file_format, size in INPUTS:
+            data = make_upload(file_format, size)
+            before = measure(legacy, data, photo_path, args.iterations)
+            after = measure(processor.render, data, photo_path, args.iterations)
+            print(f"\n{label} ({len(data) / 1024 / 1024:.1f} MB)")
+            print(f"   Open + thumbnail per size: {before:8.1f} ms/upload")
+            print(f"   Single reduced decode:     {after:8.1f} ms/upload")
+            print(f"   Speedup:                   {before / after:8.2f}x")
+            for workers in args.workers:
+                rate = throughput(data, directory, workers, args.uploads)
+                print(f"   Pool of {workers}:{'':<17}{rate:8.1f} uploads/s")
+    processor.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,94 @@
+# benchmarks/bench_prepared.py
+"""
+Prepared statement micro-benchmark
+
+Runs the login user lookup and the session validation query through
+Database.execute_query with the text protocol and with cached server-side
+prepared statements, and reports the mean time per query. MySQL only:
+SQLite has no server-side statements (its own cache is always on).
+
+Usage:
+    python -m benchmarks.bench_prepared --iterations 5000
+"""
+import argparse
+import time
+from backend.database import Database
+from app_config import Config
+from backend.auth import AuthManager
+
+BENCH_USER_ID = 'bench00000000000000000000prepare'
+BENCH_USERNAME = 'bench_prepared'
+
+LOGIN_QUERY = """
+    SELECT user_id, username, password_hash, full_name, role, status
+    FROM users
+    WHERE username = %s
+"""
+
+SESSION_QUERY = """
+    SELECT u.user_id, u.username, u.full_name, u.role, u.status
+    FROM user_sessions s
+    JOIN users u ON s.user_id = u.user_id
+    WHERE s.session_id = %s
+    AND s.is_active = TRUE
+    AND u.status = 'Active'
+    AND s.last_activity > DATE_SUB(NOW(), INTERVAL %s SECOND)
+"""
+
+
+def seed():
+    Database.execute_query("DELETE FROM users WHERE user_id = %s", (BENCH_USER_ID,))
+    Database.execute_query("""
+        INSERT INTO users (
+            user_id, username, password_hash, full_name, email, phone,
+            role, employment_date, status
+        ) VALUES (%s, %s, %s, %s, %s, %s, %s, CURDATE(), 'Active')
+    """, (BENCH_USER_ID, BENCH_USERNAME, 'not-a-real-hash', 'Benchmark User',
+          'bench_prepared@example.com', '09170000000', 'Cashier'))
+    return AuthManager.create_session(BENCH_USER_ID, '127.0.0.1', 'bench')
+
+
+def cleanup():
+    Database.execute_query("DELETE FROM users WHERE user_id = %s", (BENCH_USER_ID,))
+
+
+def measure(query, params, prepared, iterations):
+    # Warm up so the prepared variant has its statement cached
+    Database.execute_query(query, params, fetch=True, prepared=prepared)
+    
+    started = time.perf_counter()
+    for _ in range(iterations):
+        Database.execute_query(query, params, fetch=True, prepared=prepared)
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--iterations', type=int, default=5000)
+    args = parser.parse_args()
+    
+    if Database.driver().name != 'mysql':
+        parser.error(f"needs DB_DRIVER=mysql, not {Database.driver().name}")
+    
+    print("=" * 50)
+    print("Prepared Statement Benchmark")
+    print("=" * 50)
+    
+    session_id = seed()
+    try:
+        for name, query, params in (
+            ('Login user lookup', LOGIN_QUERY, (BENCH_USERNAME,)),
+            ('Session validation', SESSION_QUERY, (session_id, Config.SESSION_TIMEOUT))
+        ):
+            text = measure(query, params, False, args.iterations)
+            prepared = measure(query, params, True, args.iterations)
+            print(f"\n{name}")
+            print(f"   Text protocol:     {text:8.1f} us/query")
+            print(f"   Prepared (cached): {prepared:8.1f} us/query")
+            print(f"   Speedup:           {text / prepared:8.2f}x")
+    finally:
+        cleanup()
+
+
+if __name__ == '__main__':
+    main()
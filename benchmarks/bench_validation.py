@@ -0,0 +1,111 @@
+# benchmarks/bench_validation.py
+"""
+Batch validation benchmark
+
+Validates synthetic user records two ways: calling the per-field
+Validator functions for every record, and one Validator.validate_batch
+call over the same data laid out as columns. About a fifth of the
+records are invalid. Email is left out by default because
+validate_email_address does DNS lookups unless
+EMAIL_CHECK_DELIVERABILITY=False; pass --with-email to include it.
+
+Usage:
+    python -m benchmarks.bench_validation --records 100000
+"""
+import argparse
+import random
+import time
+from backend.validation import Validator
+
+FIELDS = ('full_name', 'phone', 'username', 'password', 'role', 'status', 'employment_date')
+
+PER_FIELD = {
+    'full_name': Validator.validate_full_name,
+    'email': Validator.validate_email_address,
+    'phone': Validator.validate_phone,
+    'username': Validator.validate_username,
+    'password': Validator.validate_password,
+    'role': Validator.validate_role,
+    'status': Validator.validate_status,
+    'employment_date': Validator.validate_employment_date
+}
+
+
+def make_records(count, seed=42):
+    rng = random.Random(seed)
+    records = []
+    for i in range(count):
+        record = {
+            'full_name': f"Juan Dela Cruz {chr(65 + i % 26)}.",
+            'email': f"user{i}@example.com",
+            'phone': f"0917{i % 10_000_000:07d}",
+            'username': f"user_{i}",
+            'password': f"Passw0rd!{i}",
+            'role': Validator.ROLES[i % len(Validator.ROLES)],
+            'status': Validator.STATUSES[i % len(Validator.STATUSES)],
+            'employment_date': '2024-01-15'
+        }
+        if rng.random() < 0.2:
+            field = rng.choice(FIELDS)
+            record[field] = {
+                'full_name': 'J0hn',
+                'phone': '12345',
+                'username': 'a!',
+                'password': 'short',
+                'role': 'Boss',
+                'status': 'Gone',
+                'employment_date': '15/01/2024'
+            }[field]
+        records.append(record)
+    return records
+
+
+def per_field(records, fields):
+    failed = 0
+    for record in records:
+        ok = True
+        for field in fields:
+            valid, _ = PER_FIELD[field](record[field])
+            ok = ok and valid
+        failed += not ok
+    return failed
+
+
+def batched(columns):
+    _, errors = Validator.validate_batch(columns)
+    return len(errors)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--records', type=int, default=100_000)
+    parser.add_argument('--with-email', action='store_true')
+    args = parser.parse_args()
+
+    fields = FIELDS + ('email',) if args.with_email else FIELDS
+    records = make_records(args.records)
+    columns = {field: [record[field] for record in records] for field in fields}
+
+    print("=" * 50)
+    print("Batch Validation Benchmark")
+    print("=" * 50)
+    print(f"\n{args.records:,} records, fields: {', '.join(fields)}")
+
+    started = time.perf_counter()
+    failed_loop = per_field(records, fields)
+    loop_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    failed_batch = batched(columns)
+    batch_time = time.perf_counter() - started
+
+    print(f"   Per-field functions: {loop_time:8.3f}s  {args.records / loop_time:>12,.0f} records/s  ({failed_loop:,} invalid)")
+    print(f"   validate_batch:      {batch_time:8.3f}s  {args.records / batch_time:>12,.0f} records/s  ({failed_batch:,} invalid)")
+    print(f"   Speedup:             {loop_time / batch_time:8.2f}x")
+
+    if failed_loop != failed_batch:
+        print("\n   WARNING: invalid record counts differ")
+
+
+if __name__ == '__main__':
+    main()
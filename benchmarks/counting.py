@@ -0,0 +1,76 @@
+# benchmarks/counting.py
+"""Round-trip counters shared by the database benchmarks"""
+from collections import Counter
+from backend.database import Database
+
+
+class CountingCursor:
+    """Cursor proxy that counts executed statements"""
+    
+    def __init__(self, cursor, counters):
+        self._cursor = cursor
+        self._counters = counters
+    
+    def execute(self, *args, **kwargs):
+        self._counters['statements'] += 1
+        return self._cursor.execute(*args, **kwargs)
+    
+    def executemany(self, *args, **kwargs):
+        self._counters['statements'] += 1
+        return self._cursor.executemany(*args, **kwargs)
+    
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class CountingConnection:
+    """Connection proxy that counts cursors' statements and commits"""
+    
+    def __init__(self, connection, counters):
+        self._connection = connection
+        self._counters = counters
+    
+    def cursor(self, *args, **kwargs):
+        return CountingCursor(self._connection.cursor(*args, **kwargs), self._counters)
+    
+    def prepared_cursor(self, query):
+        cursor, statement = self._connection.prepared_cursor(query)
+        return CountingCursor(cursor, self._counters), statement
+    
+    def commit(self):
+        self._counters['commits'] += 1
+        return self._connection.commit()
+    
+    def __getattr__(self, name):
+        return getattr(self._connection, name)
+
+
+class CountingDatabase:
+    """
+    Count pool checkouts, statements and commits made through Database
+    
+    Usage:
+        with CountingDatabase() as counters:
+            ...
+        print(counters['statements'])
+    """
+    
+    def __init__(self):
+        self.counters = Counter(checkouts=0, statements=0, commits=0)
+        self._original = None
+    
+    def __enter__(self):
+        self._original = Database.__dict__['get_connection']
+        original = Database.get_connection
+        counters = self.counters
+        
+        def get_connection():
+            counters['checkouts'] += 1
+            return CountingConnection(original(), counters)
+        
+        Database.get_connection = staticmethod(get_connection)
+        return self.counters
+    
+    def __exit__(self, *exc):
+        Database.get_connection = self._original
+        return False
@@ -1,14 +1,10 @@
-USE dr3_hardware_db;
-
--- Drop existing tables if they exist (for development)
-DROP TABLE IF EXISTS login_attempts;
-
-DROP TABLE IF EXISTS user_sessions;
-
-DROP TABLE IF EXISTS users;
+-- 0001: Tables as created by the original database/schema.sql
+--
+-- IF NOT EXISTS / INSERT IGNORE let a database built with the old
+-- drop-and-recreate script adopt the migration runner unchanged.
 
 -- Create users table
-CREATE TABLE users (
+CREATE TABLE IF NOT EXISTS users (
     user_id VARCHAR(64) PRIMARY KEY,
     username VARCHAR(20) UNIQUE NOT NULL,
     password_hash VARCHAR(255) NOT NULL,
@@ -34,7 +30,7 @@ CREATE TABLE users (
 ) ENGINE = InnoDB DEFAULT CHARSET = utf8mb4;
 
 -- Create user sessions table (for login management)
-CREATE TABLE user_sessions (
+CREATE TABLE IF NOT EXISTS user_sessions (
     session_id VARCHAR(64) PRIMARY KEY,
     user_id VARCHAR(64) NOT NULL,
     login_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -48,7 +44,7 @@ CREATE TABLE user_sessions (
 ) ENGINE = InnoDB DEFAULT CHARSET = utf8mb4;
 
 -- Create login attempts table (for security tracking)
-CREATE TABLE login_attempts (
+CREATE TABLE IF NOT EXISTS login_attempts (
     attempt_id INT AUTO_INCREMENT PRIMARY KEY,
     username VARCHAR(20) NOT NULL,
     attempt_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -60,7 +56,7 @@ CREATE TABLE login_attempts (
 ) ENGINE = InnoDB DEFAULT CHARSET = utf8mb4;
 
 -- Note: This is a hashed version using Argon2
-INSERT INTO
+INSERT IGNORE INTO
     users (
         user_id,
         username,
@@ -82,4 +78,4 @@ VALUES (
         'Owner',
         CURDATE(),
         'Active'
-    );
\ No newline at end of file
+    );
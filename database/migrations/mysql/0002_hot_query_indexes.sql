@@ -0,0 +1,41 @@
+-- 0002: Composite indexes for the hot query shapes
+--
+-- Each index is named after the query it serves; `flask check-indexes`
+-- EXPLAINs those queries and fails if any of them scans a whole table.
+
+-- Lockout tracker rebuild: success = FALSE AND attempt_time > ?
+-- ORDER BY attempt_time, reading username (covering)
+ALTER TABLE login_attempts
+    ADD INDEX idx_success_time_user (success, attempt_time, username);
+
+-- Failed attempts for one user in a window: username, success, attempt_time.
+-- Replaces idx_username, which is its prefix.
+ALTER TABLE login_attempts
+    ADD INDEX idx_username_success_time (username, success, attempt_time),
+    DROP INDEX idx_username;
+
+-- Session validation is a primary key lookup on session_id. Per-user
+-- session queries filter on user_id and is_active; the new index also
+-- backs the foreign key, so idx_user_id and the low-selectivity
+-- idx_is_active are dropped.
+ALTER TABLE user_sessions
+    ADD INDEX idx_user_active (user_id, is_active);
+
+ALTER TABLE user_sessions
+    DROP INDEX idx_user_id,
+    DROP INDEX idx_is_active;
+
+-- Retention sweeper: last_activity < ? ORDER BY last_activity LIMIT n
+ALTER TABLE user_sessions
+    ADD INDEX idx_last_activity (last_activity);
+
+-- User list: ORDER BY created_at DESC, user_id DESC with keyset paging,
+-- optionally filtered by role or status. idx_status is a prefix of
+-- idx_status_created; idx_username and idx_email duplicate the UNIQUE keys.
+ALTER TABLE users
+    ADD INDEX idx_created (created_at, user_id),
+    ADD INDEX idx_role_created (role, created_at, user_id),
+    ADD INDEX idx_status_created (status, created_at, user_id),
+    DROP INDEX idx_status,
+    DROP INDEX idx_username,
+    DROP INDEX idx_email;
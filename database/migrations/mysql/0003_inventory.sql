@@ -0,0 +1,42 @@
+-- 0003: Inventory products and their search terms
+--
+-- stock_status is computed by the server so the Low Stock and Critical
+-- filters are index lookups instead of a stock < min_stock comparison
+-- on every row. Lists are ordered by name, so each filter's index ends
+-- in (name, product_id) for keyset paging.
+
+CREATE TABLE IF NOT EXISTS products (
+    product_id INT AUTO_INCREMENT PRIMARY KEY,
+    sku VARCHAR(32) NOT NULL,
+    name VARCHAR(100) NOT NULL,
+    category VARCHAR(50) NOT NULL,
+    stock INT NOT NULL DEFAULT 0,
+    min_stock INT NOT NULL DEFAULT 0,
+    price DECIMAL(10, 2) NOT NULL,
+    description TEXT,
+    stock_status VARCHAR(8) GENERATED ALWAYS AS (
+        CASE
+            WHEN stock <= 0 THEN 'critical'
+            WHEN stock < min_stock THEN 'low'
+            ELSE 'good'
+        END
+    ) STORED,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    -- SKU lookups and SKU prefix search (sku LIKE 'HDW-%')
+    UNIQUE KEY uq_sku (sku),
+    INDEX idx_name (name, product_id),
+    INDEX idx_category_name (category, name, product_id),
+    INDEX idx_status_name (stock_status, name, product_id)
+) ENGINE = InnoDB DEFAULT CHARSET = utf8mb4;
+
+-- Lower-cased words of each product's name and SKU, written by
+-- backend/inventory.py. Search matches term prefixes on the primary key,
+-- so "drill" finds "Power Drill Set" without scanning products.
+CREATE TABLE IF NOT EXISTS product_search_terms (
+    term VARCHAR(50) NOT NULL,
+    product_id INT NOT NULL,
+    PRIMARY KEY (term, product_id),
+    INDEX idx_product (product_id),
+    FOREIGN KEY (product_id) REFERENCES products (product_id) ON DELETE CASCADE
+) ENGINE = InnoDB DEFAULT CHARSET = utf8mb4;
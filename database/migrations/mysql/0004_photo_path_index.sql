@@ -0,0 +1,9 @@
+-- 0004: Index for photo reference counts
+--
+-- Identical uploads share one set of files, so a photo is only removed
+-- once no users row points at it any more. Without an index that count
+-- scans users on every delete.
+
+-- Photo references: photo_path = ?
+ALTER TABLE users
+    ADD INDEX idx_photo_path (photo_path);
@@ -0,0 +1,17 @@
+-- 0005: Set users.last_login when a session is created
+--
+-- A successful login used to insert the session and then UPDATE users in
+-- the same transaction: two statements and a commit after the user
+-- SELECT. The trigger does the UPDATE inside the INSERT, so a login
+-- writes with one statement. last_login takes the session's
+-- last_activity, which the app writes from its own clock.
+--
+-- With binary logging on, creating a trigger needs the TRIGGER privilege
+-- plus SUPER or log_bin_trust_function_creators = 1.
+
+CREATE TRIGGER user_sessions_last_login
+AFTER INSERT ON user_sessions
+FOR EACH ROW
+BEGIN
+    UPDATE users SET last_login = NEW.last_activity, failed_login_attempts = 0 WHERE user_id = NEW.user_id;
+END;
@@ -0,0 +1,80 @@
+-- 0001: Tables of the MySQL 0001_initial_schema, in SQLite's dialect
+--
+-- ENUMs become CHECK constraints, usernames and emails compare
+-- case-insensitively like MySQL's default collation, and timestamps
+-- default to local time to match the datetimes the app writes.
+-- ON UPDATE CURRENT_TIMESTAMP is emulated with triggers.
+
+CREATE TABLE IF NOT EXISTS users (
+    user_id VARCHAR(64) PRIMARY KEY,
+    username VARCHAR(20) NOT NULL UNIQUE COLLATE NOCASE,
+    password_hash VARCHAR(255) NOT NULL,
+    full_name VARCHAR(100) NOT NULL,
+    email VARCHAR(100) NOT NULL UNIQUE COLLATE NOCASE,
+    phone VARCHAR(11) NOT NULL,
+    role TEXT NOT NULL CHECK (role IN ('Owner', 'Admin', 'Inventory Clerk', 'Cashier')),
+    employment_date DATE NOT NULL,
+    status TEXT DEFAULT 'Active' CHECK (status IN ('Active', 'Inactive')),
+    photo_path VARCHAR(255),
+    created_at TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+    updated_at TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+    failed_login_attempts INT DEFAULT 0,
+    last_login TIMESTAMP NULL
+);
+
+CREATE TRIGGER IF NOT EXISTS users_updated_at
+AFTER UPDATE ON users
+WHEN NEW.updated_at IS OLD.updated_at
+BEGIN
+    UPDATE users SET updated_at = datetime('now', 'localtime') WHERE user_id = NEW.user_id;
+END;
+
+CREATE TABLE IF NOT EXISTS user_sessions (
+    session_id VARCHAR(64) PRIMARY KEY,
+    user_id VARCHAR(64) NOT NULL REFERENCES users (user_id) ON DELETE CASCADE,
+    login_time TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+    last_activity TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+    ip_address VARCHAR(45),
+    user_agent TEXT,
+    is_active BOOLEAN DEFAULT TRUE
+);
+
+CREATE TRIGGER IF NOT EXISTS user_sessions_last_activity
+AFTER UPDATE ON user_sessions
+WHEN NEW.last_activity IS OLD.last_activity
+BEGIN
+    UPDATE user_sessions SET last_activity = datetime('now', 'localtime') WHERE session_id = NEW.session_id;
+END;
+
+CREATE TABLE IF NOT EXISTS login_attempts (
+    attempt_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    username VARCHAR(20) NOT NULL COLLATE NOCASE,
+    attempt_time TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+    ip_address VARCHAR(45),
+    success BOOLEAN DEFAULT FALSE,
+    failure_reason VARCHAR(100)
+);
+
+-- Same placeholder admin as the MySQL schema, updated by the app
+INSERT OR IGNORE INTO users (
+    user_id,
+    username,
+    password_hash,
+    full_name,
+    email,
+    phone,
+    role,
+    employment_date,
+    status
+)
+VALUES (
+    '00000000000000000000000000000001',
+    'admin',
+    '$argon2id$v=19$m=65536,t=3,p=4$placeholder',
+    'System Administrator',
+    'admin@dr3hardware.com',
+    '09171234567',
+    'Owner',
+    date('now', 'localtime'),
+    'Active'
+);
@@ -0,0 +1,36 @@
+-- 0002: Composite indexes for the hot query shapes
+--
+-- The same indexes as the MySQL 0002_hot_query_indexes. SQLite index
+-- names are per database rather than per table, so they carry the table
+-- name. 0001 created no secondary indexes here, so nothing is dropped;
+-- the UNIQUE constraints index username and email already.
+
+-- Lockout tracker rebuild (covering)
+CREATE INDEX IF NOT EXISTS idx_login_attempts_success_time_user
+    ON login_attempts (success, attempt_time, username);
+
+-- Failed attempts for one user in a window
+CREATE INDEX IF NOT EXISTS idx_login_attempts_username_success_time
+    ON login_attempts (username, success, attempt_time);
+
+-- Per-user sessions; also backs the foreign key for ON DELETE CASCADE
+CREATE INDEX IF NOT EXISTS idx_user_sessions_user_active
+    ON user_sessions (user_id, is_active);
+
+-- Retention sweeper
+CREATE INDEX IF NOT EXISTS idx_user_sessions_last_activity
+    ON user_sessions (last_activity);
+
+-- Retention sweeper for login attempts (MySQL's idx_attempt_time from 0001)
+CREATE INDEX IF NOT EXISTS idx_login_attempts_attempt_time
+    ON login_attempts (attempt_time);
+
+-- User list, newest first, optionally by role or status
+CREATE INDEX IF NOT EXISTS idx_users_created
+    ON users (created_at, user_id);
+
+CREATE INDEX IF NOT EXISTS idx_users_role_created
+    ON users (role, created_at, user_id);
+
+CREATE INDEX IF NOT EXISTS idx_users_status_created
+    ON users (status, created_at, user_id);
@@ -0,0 +1,51 @@
+-- 0003: Inventory products and their search terms
+--
+-- The tables of the MySQL 0003_inventory. Text columns that are searched
+-- with LIKE 'prefix%' use NOCASE, which is what lets SQLite turn the LIKE
+-- into an index range (and matches MySQL's case-insensitive collation).
+
+CREATE TABLE IF NOT EXISTS products (
+    product_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    sku VARCHAR(32) NOT NULL UNIQUE COLLATE NOCASE,
+    name VARCHAR(100) NOT NULL COLLATE NOCASE,
+    category VARCHAR(50) NOT NULL,
+    stock INT NOT NULL DEFAULT 0,
+    min_stock INT NOT NULL DEFAULT 0,
+    price DECIMAL(10, 2) NOT NULL,
+    description TEXT,
+    stock_status VARCHAR(8) GENERATED ALWAYS AS (
+        CASE
+            WHEN stock <= 0 THEN 'critical'
+            WHEN stock < min_stock THEN 'low'
+            ELSE 'good'
+        END
+    ) STORED,
+    created_at TIMESTAMP DEFAULT (datetime('now', 'localtime')),
+    updated_at TIMESTAMP DEFAULT (datetime('now', 'localtime'))
+);
+
+CREATE TRIGGER IF NOT EXISTS products_updated_at
+AFTER UPDATE ON products
+WHEN NEW.updated_at IS OLD.updated_at
+BEGIN
+    UPDATE products SET updated_at = datetime('now', 'localtime') WHERE product_id = NEW.product_id;
+END;
+
+CREATE INDEX IF NOT EXISTS idx_products_name
+    ON products (name, product_id);
+
+CREATE INDEX IF NOT EXISTS idx_products_category_name
+    ON products (category, name, product_id);
+
+CREATE INDEX IF NOT EXISTS idx_products_status_name
+    ON products (stock_status, name, product_id);
+
+CREATE TABLE IF NOT EXISTS product_search_terms (
+    term VARCHAR(50) NOT NULL COLLATE NOCASE,
+    product_id INTEGER NOT NULL REFERENCES products (product_id) ON DELETE CASCADE,
+    PRIMARY KEY (term, product_id)
+) WITHOUT ROWID;
+
+-- Backs the foreign key for ON DELETE CASCADE
+CREATE INDEX IF NOT EXISTS idx_product_search_terms_product
+    ON product_search_terms (product_id);
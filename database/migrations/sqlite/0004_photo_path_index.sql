@@ -0,0 +1,7 @@
+-- 0004: Index for photo reference counts
+--
+-- The same index as the MySQL 0004_photo_path_index.
+
+-- Photo references: photo_path = ?
+CREATE INDEX IF NOT EXISTS idx_users_photo_path
+    ON users (photo_path);
@@ -0,0 +1,11 @@
+-- 0005: Set users.last_login when a session is created
+--
+-- The same trigger as the MySQL 0005_session_last_login_trigger: the
+-- session INSERT updates last_login, so a login writes with one
+-- statement.
+
+CREATE TRIGGER IF NOT EXISTS user_sessions_last_login
+AFTER INSERT ON user_sessions
+BEGIN
+    UPDATE users SET last_login = NEW.last_activity, failed_login_attempts = 0 WHERE user_id = NEW.user_id;
+END;
@@ -24,6 +24,19 @@ document.addEventListener('DOMContentLoaded', function() {
     const submitBtnSpinner = document.getElementById('submitBtnSpinner');
     const resetBtn = document.getElementById('resetBtn');
     
+    // Users list paging: page size and the keyset cursor of each visited page
+    const USERS_PAGE_SIZE = 25;
+    const usersPaging = {
+        cursors: [null],
+        page: 0,
+        hasMore: false
+    };
+    
+    // The search box filters on the server; only the latest request may render
+    const USERS_SEARCH_DEBOUNCE_MS = 300;
+    let usersSearchTimer = null;
+    let usersRequest = null;
+    
     // Initialize
     setupEventListeners();
     setupPasswordToggles();
@@ -334,31 +347,82 @@ document.addEventListener('DOMContentLoaded', function() {
         hideAlert('formAlertMessage');
     }
     
+    document.getElementById('usersPrevPage')?.addEventListener('click', () => {
+        if (usersPaging.page > 0) {
+            usersPaging.page--;
+            loadUsersList(usersPaging.page);
+        }
+    });
+    
+    document.getElementById('usersNextPage')?.addEventListener('click', () => {
+        if (usersPaging.hasMore) {
+            usersPaging.page++;
+            loadUsersList(usersPaging.page);
+        }
+    });
+    
     /**
-     * Load users list
+     * Load one page of the users list (first page by default)
      */
-    async function loadUsersList() {
+    async function loadUsersList(page = 0) {
         const tableBody = document.getElementById('usersTableBody');
         if (!tableBody) return;
         
+        if (page === 0) {
+            usersPaging.cursors = [null];
+        }
+        usersPaging.page = page;
+        
         try {
             tableBody.innerHTML = '<tr><td colspan="7" class="no-data">Loading users...</td></tr>';
             
-            const response = await fetch('/api/users/list');
+            const params = new URLSearchParams({ limit: USERS_PAGE_SIZE });
+            const searchTerm = document.getElementById('searchUsers')?.value.trim();
+            if (searchTerm) {
+                params.set('q', searchTerm);
+            }
+            const cursor = usersPaging.cursors[page];
+            if (cursor) {
+                params.set('cursor', cursor);
+            }
+            
+            if (usersRequest) {
+                usersRequest.abort();
+            }
+            usersRequest = new AbortController();
+            
+            const response = await fetch(`/api/users/list?${params}`, { signal: usersRequest.signal });
             const result = await response.json();
             
             if (response.ok && result.success) {
+                usersPaging.hasMore = result.has_more;
+                usersPaging.cursors[page + 1] = result.next_cursor;
                 displayUsersList(result.users);
+                updateUsersPagination();
             } else {
                 tableBody.innerHTML = '<tr><td colspan="7" class="no-data">Failed to load users</td></tr>';
             }
             
         } catch (error) {
+            if (error.name === 'AbortError') return;
             console.error('Error loading users:', error);
             tableBody.innerHTML = '<tr><td colspan="7" class="no-data">Error loading users</td></tr>';
         }
     }
     
+    /**
+     * Update users list pagination controls
+     */
+    function updateUsersPagination() {
+        const prevBtn = document.getElementById('usersPrevPage');
+        const nextBtn = document.getElementById('usersNextPage');
+        const pageInfo = document.getElementById('usersPageInfo');
+        
+        if (prevBtn) prevBtn.disabled = usersPaging.page === 0;
+        if (nextBtn) nextBtn.disabled = !usersPaging.hasMore;
+        if (pageInfo) pageInfo.textContent = `Page ${usersPaging.page + 1}`;
+    }
+    
     /**
      * Display users in table
      */
@@ -441,7 +505,7 @@ document.addEventListener('DOMContentLoaded', function() {
             
             if (response.ok && result.success) {
                 showAlert('User deleted successfully', 'success', 'formAlertMessage');
-                loadUsersList();
+                loadUsersList(usersPaging.page);
             } else {
                 showAlert(result.message || 'Failed to delete user', 'error', 'formAlertMessage');
             }
@@ -488,17 +552,12 @@ document.addEventListener('DOMContentLoaded', function() {
     }
     
     /**
-     * Search users
+     * Search users (every page, on the server) once typing pauses
      */
     const searchInput = document.getElementById('searchUsers');
-    searchInput?.addEventListener('input', function(e) {
-        const searchTerm = e.target.value.toLowerCase();
-        const rows = document.querySelectorAll('#usersTableBody tr');
-        
-        rows.forEach(row => {
-            const text = row.textContent.toLowerCase();
-            row.style.display = text.includes(searchTerm) ? '' : 'none';
-        });
+    searchInput?.addEventListener('input', function() {
+        clearTimeout(usersSearchTimer);
+        usersSearchTimer = setTimeout(() => loadUsersList(0), USERS_SEARCH_DEBOUNCE_MS);
     });
     
     /**
@@ -1,61 +1,119 @@
-// Sample inventory data
-let inventoryData = [
-    { id: 1, name: 'Heavy Duty Hammer', sku: 'HDW-001', category: 'Tools', stock: 45, minStock: 10, price: 24.99, icon: '🔨' },
-    { id: 2, name: 'Power Drill Set', sku: 'HDW-002', category: 'Tools', stock: 12, minStock: 5, price: 89.99, icon: '🔧' },
-    { id: 3, name: 'Safety Goggles', sku: 'SAF-001', category: 'Safety', stock: 3, minStock: 15, price: 12.50, icon: '🥽' },
-    { id: 4, name: 'Construction Nails (5kg)', sku: 'HDW-003', category: 'Hardware', stock: 28, minStock: 20, price: 15.75, icon: '📌' },
-    { id: 5, name: 'Paint Roller Set', sku: 'CNS-001', category: 'Construction', stock: 1, minStock: 8, price: 18.99, icon: '🎨' },
-    { id: 6, name: 'Extension Cord 50ft', sku: 'ELC-001', category: 'Electrical', stock: 22, minStock: 10, price: 32.50, icon: '🔌' },
-    { id: 7, name: 'Measuring Tape', sku: 'TOL-001', category: 'Tools', stock: 35, minStock: 15, price: 9.99, icon: '📏' },
-    { id: 8, name: 'Work Gloves', sku: 'SAF-002', category: 'Safety', stock: 0, minStock: 20, price: 8.50, icon: '🧤' }
-];
+// Inventory page: products are searched, filtered and paged on the server
+const INVENTORY_PAGE_SIZE = 25;
+const SEARCH_DEBOUNCE_MS = 300;
+
+const CATEGORY_ICONS = {
+    Tools: '🔨',
+    Hardware: '📌',
+    Construction: '🎨',
+    Safety: '🥽',
+    Electrical: '🔌',
+    Plumbing: '🚰'
+};
 
 let currentFilter = 'all';
 let editingId = null;
 
+// Products on the current page, by id, for the edit form
+let currentProducts = {};
+
+// cursors[n] is the cursor of page n (null for the first page)
+const inventoryPaging = { page: 0, cursors: [null], hasMore: false };
+
+// Only the latest search may render; earlier requests are aborted
+let searchController = null;
+let searchTimer = null;
+
+// Load one page of products matching the search box and filter
+async function loadInventory(page = 0) {
+    const tbody = document.getElementById('inventoryBody');
+
+    if (page === 0) {
+        inventoryPaging.cursors = [null];
+    }
+    inventoryPaging.page = page;
+
+    const params = new URLSearchParams({ limit: INVENTORY_PAGE_SIZE });
+    const searchTerm = document.getElementById('searchInput').value.trim();
+    if (searchTerm) {
+        params.set('q', searchTerm);
+    }
+    if (currentFilter !== 'all') {
+        params.set('stock', currentFilter);
+    }
+    const cursor = inventoryPaging.cursors[page];
+    if (cursor) {
+        params.set('cursor', cursor);
+    }
+
+    if (searchController) {
+        searchController.abort();
+    }
+    searchController = new AbortController();
+
+    try {
+        const response = await fetch(`/api/inventory/search?${params}`, { signal: searchController.signal });
+        const result = await response.json();
+
+        if (response.ok && result.success) {
+            inventoryPaging.hasMore = result.has_more;
+            inventoryPaging.cursors[page + 1] = result.next_cursor;
+            renderInventory(result.products);
+            renderPagination();
+        } else {
+            tbody.innerHTML = `<tr><td colspan="7" class="no-data">${escapeHtml(result.message || 'Failed to load products')}</td></tr>`;
+        }
+    } catch (error) {
+        if (error.name === 'AbortError') return;
+        console.error('Error loading inventory:', error);
+        tbody.innerHTML = '<tr><td colspan="7" class="no-data">Error loading products</td></tr>';
+    }
+}
+
+// Search as the user types, once they pause
+function scheduleSearch() {
+    clearTimeout(searchTimer);
+    searchTimer = setTimeout(() => loadInventory(0), SEARCH_DEBOUNCE_MS);
+}
+
 // Render inventory table
-function renderInventory() {
+function renderInventory(products) {
     const tbody = document.getElementById('inventoryBody');
-    const searchTerm = document.getElementById('searchInput').value.toLowerCase();
-    
-    let filteredData = inventoryData.filter(item => {
-        const matchesSearch = item.name.toLowerCase().includes(searchTerm) || 
-                            item.sku.toLowerCase().includes(searchTerm);
-        
-        if (currentFilter === 'all') return matchesSearch;
-        if (currentFilter === 'low') return matchesSearch && item.stock < item.minStock && item.stock > 0;
-        if (currentFilter === 'critical') return matchesSearch && item.stock === 0;
-        return matchesSearch;
-    });
+    currentProducts = {};
+
+    if (!products || products.length === 0) {
+        tbody.innerHTML = '<tr><td colspan="7" class="no-data">No products found</td></tr>';
+        return;
+    }
+
+    tbody.innerHTML = products.map(item => {
+        currentProducts[item.product_id] = item;
+        const stockStatus = item.stock_status;
+        const statusText = stockStatus === 'critical' ? 'Out of Stock' :
+                         stockStatus === 'low' ? 'Low Stock' : 'In Stock';
 
-    tbody.innerHTML = filteredData.map(item => {
-        const stockStatus = item.stock === 0 ? 'critical' : 
-                          item.stock < item.minStock ? 'low' : 'good';
-        const statusText = item.stock === 0 ? 'Out of Stock' : 
-                         item.stock < item.minStock ? 'Low Stock' : 'In Stock';
-        
         return `
             <tr>
                 <td>
                     <div class="product-cell">
-                        <div class="product-image">${item.icon}</div>
+                        <div class="product-image">${CATEGORY_ICONS[item.category] || '📦'}</div>
                         <div class="product-info">
-                            <span class="product-name">${item.name}</span>
-                            <span class="product-sku">${item.sku}</span>
+                            <span class="product-name">${escapeHtml(item.name)}</span>
+                            <span class="product-sku">${escapeHtml(item.sku)}</span>
                         </div>
                     </div>
                 </td>
-                <td>${item.category}</td>
+                <td>${escapeHtml(item.category)}</td>
                 <td>${item.stock}</td>
-                <td>${item.minStock}</td>
+                <td>${item.min_stock}</td>
                 <td>$${item.price.toFixed(2)}</td>
                 <td><span class="stock-badge stock-${stockStatus}">${statusText}</span></td>
                 <td>
                     <div class="action-buttons">
-                        <button class="action-btn edit" onclick="editProduct(${item.id})">
+                        <button class="action-btn edit" onclick="editProduct(${item.product_id})">
                             <i class="fas fa-edit"></i>
                         </button>
-                        <button class="action-btn delete" onclick="deleteProduct(${item.id})">
+                        <button class="action-btn delete" onclick="deleteProduct(${item.product_id})">
                             <i class="fas fa-trash"></i>
                         </button>
                     </div>
@@ -65,10 +123,29 @@ function renderInventory() {
     }).join('');
 }
 
+// Previous/next page buttons
+function renderPagination() {
+    const pagination = document.getElementById('pagination');
+    const { page, hasMore } = inventoryPaging;
+
+    pagination.innerHTML = `
+        <button class="page-btn" id="prevPage" ${page === 0 ? 'disabled' : ''}>
+            <i class="fas fa-chevron-left"></i>
+        </button>
+        <span class="page-btn active">${page + 1}</span>
+        <button class="page-btn" id="nextPage" ${hasMore ? '' : 'disabled'}>
+            <i class="fas fa-chevron-right"></i>
+        </button>
+    `;
+
+    document.getElementById('prevPage').addEventListener('click', () => loadInventory(page - 1));
+    document.getElementById('nextPage').addEventListener('click', () => loadInventory(page + 1));
+}
+
 // Filter buttons
 document.addEventListener('DOMContentLoaded', function() {
     // Initialize inventory display
-    renderInventory();
+    loadInventory(0);
 
     // Filter button handlers
     document.querySelectorAll('.filter-btn').forEach(btn => {
@@ -76,12 +153,12 @@ document.addEventListener('DOMContentLoaded', function() {
             document.querySelectorAll('.filter-btn').forEach(b => b.classList.remove('active'));
             this.classList.add('active');
             currentFilter = this.dataset.filter;
-            renderInventory();
+            loadInventory(0);
         });
     });
 
     // Search functionality
-    document.getElementById('searchInput').addEventListener('input', renderInventory);
+    document.getElementById('searchInput').addEventListener('input', scheduleSearch);
 
     // Modal controls
     const modal = document.getElementById('productModal');
@@ -107,7 +184,7 @@ document.addEventListener('DOMContentLoaded', function() {
         }
     });
 
-    saveProductBtn.addEventListener('click', () => {
+    saveProductBtn.addEventListener('click', async () => {
         const form = document.getElementById('productForm');
         if (!form.checkValidity()) {
             form.reportValidity();
@@ -121,25 +198,42 @@ document.addEventListener('DOMContentLoaded', function() {
             stock: parseInt(document.getElementById('productStock').value),
             minStock: parseInt(document.getElementById('productMinStock').value),
             price: parseFloat(document.getElementById('productPrice').value),
-            icon: '📦'
+            description: document.getElementById('productDescription').value
         };
 
-        if (editingId) {
-            const index = inventoryData.findIndex(p => p.id === editingId);
-            inventoryData[index] = { ...inventoryData[index], ...productData };
-        } else {
-            const newId = Math.max(...inventoryData.map(p => p.id)) + 1;
-            inventoryData.push({ id: newId, ...productData });
-        }
+        const url = editingId ? `/api/inventory/update/${editingId}` : '/api/inventory/add';
+        saveProductBtn.disabled = true;
+
+        try {
+            const response = await fetch(url, {
+                method: editingId ? 'PUT' : 'POST',
+                headers: {
+                    'Content-Type': 'application/json'
+                },
+                body: JSON.stringify(productData)
+            });
+            const result = await response.json();
+
+            if (!response.ok || !result.success) {
+                alert(result.message || 'Failed to save product');
+                return;
+            }
 
-        modal.classList.remove('active');
-        renderInventory();
+            modal.classList.remove('active');
+            // Stay on the current page when editing; new products may land anywhere
+            loadInventory(editingId ? inventoryPaging.page : 0);
+        } catch (error) {
+            console.error('Error saving product:', error);
+            alert('Error saving product. Please try again.');
+        } finally {
+            saveProductBtn.disabled = false;
+        }
     });
 });
 
 // Edit product function
 function editProduct(id) {
-    const product = inventoryData.find(p => p.id === id);
+    const product = currentProducts[id];
     if (!product) return;
 
     editingId = id;
@@ -148,15 +242,37 @@ function editProduct(id) {
     document.getElementById('productSKU').value = product.sku;
     document.getElementById('productCategory').value = product.category;
     document.getElementById('productStock').value = product.stock;
-    document.getElementById('productMinStock').value = product.minStock;
+    document.getElementById('productMinStock').value = product.min_stock;
     document.getElementById('productPrice').value = product.price;
+    document.getElementById('productDescription').value = product.description || '';
     document.getElementById('productModal').classList.add('active');
 }
 
 // Delete product function
-function deleteProduct(id) {
-    if (confirm('Are you sure you want to delete this product?')) {
-        inventoryData = inventoryData.filter(p => p.id !== id);
-        renderInventory();
+async function deleteProduct(id) {
+    if (!confirm('Are you sure you want to delete this product?')) return;
+
+    try {
+        const response = await fetch(`/api/inventory/delete/${id}`, {
+            method: 'DELETE'
+        });
+        const result = await response.json();
+
+        if (!response.ok || !result.success) {
+            alert(result.message || 'Failed to delete product');
+            return;
+        }
+
+        loadInventory(inventoryPaging.page);
+    } catch (error) {
+        console.error('Error deleting product:', error);
+        alert('Error deleting product. Please try again.');
     }
-}
\ No newline at end of file
+}
+
+// Escape text before it is placed in table HTML
+function escapeHtml(text) {
+    const div = document.createElement('div');
+    div.textContent = text;
+    return div.innerHTML;
+}
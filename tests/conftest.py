@@ -0,0 +1,93 @@
+# tests/conftest.py
+"""
+Shared fixtures; every test runs against a fresh SQLite database
+
+The environment is set before app_config is imported so Config (read once
+at import) never points at a MySQL server or does DNS lookups.
+"""
+import os
+from datetime import datetime
+
+os.environ.update({
+    'DB_DRIVER': 'sqlite',
+    'DB_SQLITE_PATH': ':memory:',
+    'ASSET_PIPELINE': 'False',
+    'RETENTION_SWEEP_INTERVAL': '0',
+    'UNIQUENESS_REFRESH_INTERVAL': '0',
+    'EMAIL_CHECK_DELIVERABILITY': 'False',
+})
+
+import pytest
+from backend.database import Database
+from backend.drivers import SQLiteDriver
+from backend.migrations import MigrationRunner
+
+
+@pytest.fixture
+def db(tmp_path):
+    """Database switched to a migrated SQLite file in tmp_path"""
+    Database.use_driver(SQLiteDriver(str(tmp_path / 'test.db')))
+    MigrationRunner().migrate()
+    yield Database
+    Database.use_driver(SQLiteDriver(':memory:'))
+
+
+@pytest.fixture
+def client(db):
+    """Flask test client over the db fixture, with in-memory state reset"""
+    from app import app
+    from backend.auth import session_cache, activity_buffer, attempt_logger, lockout_tracker
+    from backend.uniqueness import uniqueness_index
+    
+    # No flusher threads: buffered writes land on flush(), never in a later test's database
+    activity_buffer.stop()
+    attempt_logger.stop()
+    session_cache.clear()
+    lockout_tracker.rebuild()
+    uniqueness_index.rebuild()
+    app.config['TESTING'] = True
+    yield app.test_client()
+    activity_buffer.flush()
+    attempt_logger.flush()
+
+
+def add_user(username, user_id=None, status='Active', password_hash='unused'):
+    """Insert an active user row directly; returns its user_id"""
+    user_id = user_id or f"USR-{username}"
+    Database.execute_query("""
+        INSERT INTO users (user_id, username, password_hash, full_name, email, phone, role,
+                           employment_date, status)
+        VALUES (%s, %s, %s, %s, %s, '09171234567', 'Cashier', '2024-01-01', %s)
+    """, (user_id, username, password_hash, username.title(), f"{username}@example.com", status))
+    return user_id
+
+
+def add_session(user_id, session_id=None):
+    """Insert an active session row directly; returns its session_id"""
+    session_id = session_id or f"sess-{user_id}"
+    Database.execute_query("""
+        INSERT INTO user_sessions (session_id, user_id, ip_address, user_agent, last_activity)
+        VALUES (%s, %s, '', '', %s)
+    """, (session_id, user_id, datetime.now()))
+    return session_id
+
+
+@pytest.fixture
+def photos(tmp_path, monkeypatch):
+    """A PhotoStore in tmp_path, used by the app in place of the real one"""
+    import app
+    from backend.photos import PhotoStore, photo_processor
+    
+    store = PhotoStore(str(tmp_path / 'photos'), photo_processor)
+    monkeypatch.setattr(app, 'photo_store', store)
+    return store
+
+
+def image_bytes(color='red', size=(400, 300), image_format='PNG'):
+    """Encoded test image"""
+    import io
+    from PIL import Image
+    
+    buffer = io.BytesIO()
+    Image.new('RGB', size, color).save(buffer, image_format)
+    return buffer.getvalue()
@@ -0,0 +1,89 @@
+# tests/test_activity.py
+import time
+from datetime import datetime, timedelta
+from backend.activity import ActivityBuffer
+from tests.conftest import add_user, add_session
+
+
+def idle_buffer(**kwargs):
+    """A buffer whose background thread never starts, so touches only land on flush()"""
+    buffer = ActivityBuffer(**{'flush_interval': 60, 'max_pending': 2, **kwargs})
+    buffer._stopping = True
+    return buffer
+
+
+def last_activity(db, session_id):
+    return db.execute_query(
+        "SELECT last_activity FROM user_sessions WHERE session_id = %s", (session_id,), fetch=True
+    )[0]['last_activity']
+
+
+def backdate(db, session_id, hours=1):
+    db.execute_query(
+        "UPDATE user_sessions SET last_activity = %s WHERE session_id = %s",
+        (datetime.now() - timedelta(hours=hours), session_id)
+    )
+
+
+def test_repeated_touches_coalesce_into_one_write(db):
+    session_ids = [add_session(add_user(name)) for name in ('alice', 'bob', 'carol')]
+    for session_id in session_ids:
+        backdate(db, session_id)
+    
+    buffer = idle_buffer()
+    for _ in range(5):
+        for session_id in session_ids:
+            buffer.touch(session_id)
+    assert buffer.stats()['pending'] == 3
+    
+    assert buffer.flush() == 3
+    for session_id in session_ids:
+        assert datetime.now() - last_activity(db, session_id) < timedelta(minutes=1)
+    stats = buffer.stats()
+    assert stats['flushes'] == 1 and stats['flushed_sessions'] == 3 and stats['pending'] == 0
+    assert buffer.flush() == 0
+
+
+def test_discarded_touches_are_not_written(db):
+    session_id = add_session(add_user('alice'))
+    backdate(db, session_id)
+    before = last_activity(db, session_id)
+    
+    buffer = idle_buffer()
+    buffer.touch(session_id)
+    buffer.discard(session_id)
+    assert buffer.flush() == 0
+    assert last_activity(db, session_id) == before
+
+
+def test_failed_flush_keeps_touches_for_the_next_one(db, monkeypatch):
+    session_id = add_session(add_user('alice'))
+    backdate(db, session_id)
+    buffer = idle_buffer()
+    buffer.touch(session_id)
+    
+    def broken_transaction():
+        raise RuntimeError('database is down')
+    
+    with monkeypatch.context() as patch:
+        patch.setattr(db, 'transaction', broken_transaction)
+        assert buffer.flush() == 0
+    assert buffer.stats()['errors'] == 1 and buffer.stats()['pending'] == 1
+    
+    assert buffer.flush() == 1
+    assert datetime.now() - last_activity(db, session_id) < timedelta(minutes=1)
+
+
+def test_reaching_max_pending_wakes_the_flusher(db):
+    session_ids = [add_session(add_user(name)) for name in ('alice', 'bob')]
+    buffer = ActivityBuffer(flush_interval=60, max_pending=2)
+    try:
+        for session_id in session_ids:
+            buffer.touch(session_id)
+        # Well before the 60 second interval
+        deadline = time.monotonic() + 5
+        while buffer.stats()['flushes'] == 0 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert buffer.stats()['flushed_sessions'] == 2
+    finally:
+        buffer.stop()
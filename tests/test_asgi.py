@@ -0,0 +1,154 @@
+# tests/test_asgi.py
+import json
+import asyncio
+import pytest
+from backend.async_database import AsyncDatabase
+from tests.conftest import add_user, add_session
+
+asgi = pytest.importorskip('asgi')
+
+
+async def request(path, body, method='POST'):
+    """Run one request through the ASGI app; returns (status, JSON body)"""
+    messages = [{'type': 'http.request', 'body': json.dumps(body).encode(), 'more_body': False}]
+    sent = []
+    
+    async def receive():
+        return messages.pop(0)
+    
+    async def send(message):
+        sent.append(message)
+    
+    scope = {'type': 'http', 'method': method, 'path': path, 'headers': [], 'client': ('127.0.0.1', 1)}
+    await asgi.application(scope, receive, send)
+    return sent[0]['status'], json.loads(b''.join(m.get('body', b'') for m in sent[1:]))
+
+
+@pytest.fixture
+def async_client(client):
+    yield lambda path, body: asyncio.run(request(path, body))
+    asyncio.run(asgi.async_db.close())
+
+
+def test_validate_session(async_client):
+    session_id = add_session(add_user('dave'))
+    
+    status, body = async_client('/api/validate-session', {'session_id': session_id})
+    assert status == 200 and body['valid'] is True and body['user']['username'] == 'dave'
+    
+    async_client('/api/logout', {'session_id': session_id})
+    assert async_client('/api/validate-session', {'session_id': session_id})[1]['valid'] is False
+
+
+def test_non_string_session_id_is_invalid_not_an_error(async_client):
+    for session_id in (['x'], {'a': 1}, 42):
+        assert async_client('/api/validate-session', {'session_id': session_id}) == \
+            (200, {'success': True, 'valid': False})
+        assert async_client('/api/logout', {'session_id': session_id})[0] == 200
+
+
+def test_body_must_be_a_json_object(async_client):
+    status, body = async_client('/api/validate-session', ['session_id'])
+    assert status == 400 and body['success'] is False
+
+
+def test_concurrent_start_opens_one_executor(db):
+    async_db = AsyncDatabase(pool_size=2)
+    opened = []
+    original = async_db._open
+    
+    async def slow_open():
+        await asyncio.sleep(0.01)
+        opened.append(1)
+        await original()
+    
+    async_db._open = slow_open
+    
+    async def main():
+        await asyncio.gather(*(async_db.start() for _ in range(10)))
+        rows = await async_db.execute_query("SELECT COUNT(*) AS n FROM users", fetch=True)
+        await async_db.close()
+        return rows
+    
+    assert asyncio.run(main())[0]['n'] >= 1
+    assert opened == [1]
+
+
+def test_flask_and_asgi_reject_the_same_bodies(client, async_client):
+    for path in ('/api/login', '/api/logout', '/api/validate-session'):
+        for body in (['session_id'], 'text', 3):
+            assert client.post(path, json=body).status_code == 400
+            assert async_client(path, body)[0] == 400
+    
+    body = {'username': ['admin'], 'password': {'x': 1}}
+    assert client.post('/api/login', json=body).status_code == async_client('/api/login', body)[0] == 401
+
+
+def test_async_login_uses_the_app_clock(async_client, monkeypatch):
+    from backend import async_auth
+    from backend.auth import ph, session_cache
+    from tests.test_clocks import SkewedDatetime
+    
+    monkeypatch.setattr(async_auth, 'datetime', SkewedDatetime)
+    add_user('erin', password_hash=ph.hash('correct horse'))
+    
+    status, body = async_client('/api/login', {'username': 'erin', 'password': 'correct horse'})
+    assert status == 200
+    session_cache.clear()  # Check the stored session, not the one the login cached
+    assert async_client('/api/validate-session', {'session_id': body['session_id']})[1]['valid'] is True
+
+
+def test_lockout_rebuild_and_overflow_writes_run_off_the_loop(async_client, monkeypatch):
+    import queue
+    import threading
+    from backend.auth import lockout_tracker, attempt_logger
+    
+    threads = {}
+    rebuild, write = lockout_tracker.rebuild, attempt_logger._write
+    
+    def recording(name, fn):
+        def wrapper(*args):
+            threads[name] = threading.current_thread()
+            return fn(*args)
+        return wrapper
+    
+    monkeypatch.setattr(lockout_tracker, '_loaded', False)
+    monkeypatch.setattr(lockout_tracker, 'rebuild', recording('rebuild', rebuild))
+    monkeypatch.setattr(attempt_logger, '_write', recording('write', write))
+    monkeypatch.setattr(attempt_logger, 'overflow', 'sync')
+    monkeypatch.setattr(attempt_logger, '_queue', queue.Queue(maxsize=1))
+    attempt_logger._queue.put_nowait(('filler', '', False, '', None))
+    
+    status, _ = async_client('/api/login', {'username': 'nobody', 'password': 'wrong'})
+    
+    assert status == 401
+    assert set(threads) == {'rebuild', 'write'}
+    assert threading.main_thread() not in threads.values()
+
+
+def test_async_login_caches_the_new_session(async_client):
+    from backend.auth import ph, session_cache
+    add_user('fran', password_hash=ph.hash('correct horse'))
+    
+    _, body = async_client('/api/login', {'username': 'fran', 'password': 'correct horse'})
+    assert session_cache.get(body['session_id'])['username'] == 'fran'
+
+
+def test_async_logout_during_validation_is_not_undone(async_client, monkeypatch):
+    from backend.async_auth import AsyncAuthManager
+    from backend.auth import SESSION_QUERY, session_cache
+    session_id = add_session(add_user('gina'))
+    original = asgi.async_db.execute_query
+    
+    async def logout_after_the_read(query, *args, **kwargs):
+        result = await original(query, *args, **kwargs)
+        if query is SESSION_QUERY:
+            monkeypatch.setattr(asgi.async_db, 'execute_query', original)
+            await AsyncAuthManager.logout(session_id)
+        return result
+    
+    monkeypatch.setattr(asgi.async_db, 'execute_query', logout_after_the_read)
+    assert asyncio.run(AsyncAuthManager.validate_session(session_id))['username'] == 'gina'
+    
+    assert session_cache.get(session_id) is None
+    assert async_client('/api/validate-session', {'session_id': session_id})[1]['valid'] is False
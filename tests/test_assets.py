@@ -0,0 +1,52 @@
+# tests/test_assets.py
+import os
+from backend.assets import StaticAssets
+
+
+def make_frontend(root):
+    for folder in ('css', 'js', 'pages'):
+        os.makedirs(root / folder)
+    (root / 'css' / 'styles.css').write_text('body { color: black; }\n' * 50)
+    (root / 'js' / 'app.js').write_text('console.log("hi");\n')
+    (root / 'pages' / 'index.html').write_text(
+        '<link href="../css/styles.css"><script src="/frontend/js/app.js"></script>'
+    )
+
+
+def test_build_fingerprints_and_rewrites_pages(tmp_path):
+    make_frontend(tmp_path / 'frontend')
+    assets = StaticAssets(str(tmp_path / 'frontend'), str(tmp_path / 'build'))
+    manifest = assets.build()
+    
+    built_css = manifest['css/styles.css']
+    assert built_css.startswith('css/styles.') and built_css != 'css/styles.css'
+    page = (tmp_path / 'build' / 'pages' / 'index.html').read_text()
+    assert f'href="/frontend/{built_css}"' in page
+    assert f'src="/frontend/{manifest["js/app.js"]}"' in page
+    
+    asset = assets.lookup(built_css, 'gzip, deflate')
+    assert asset['immutable'] and asset['encoding'] == 'gzip' and asset['file'].endswith('.gz')
+    assert assets.lookup('pages/index.html')['immutable'] is False
+
+
+def test_load_serves_a_previous_build(tmp_path):
+    make_frontend(tmp_path / 'frontend')
+    builder = StaticAssets(str(tmp_path / 'frontend'), str(tmp_path / 'build'))
+    manifest = builder.build()
+    
+    server = StaticAssets(str(tmp_path / 'frontend'), str(tmp_path / 'build'))
+    assert server.load() is True
+    assert server.manifest == manifest
+    assert server.lookup(manifest['css/styles.css']) == builder.lookup(manifest['css/styles.css'])
+
+
+def test_load_without_a_build(tmp_path):
+    assets = StaticAssets(str(tmp_path / 'frontend'), str(tmp_path / 'build'))
+    assert assets.load() is False
+    assert assets.lookup('css/styles.css') is None
+
+
+def test_accepted_encodings():
+    assert StaticAssets.accepted_encodings('gzip;q=0, br') == {'br'}
+    assert StaticAssets.accepted_encodings('*') >= {'br', 'gzip'}
+    assert StaticAssets.accepted_encodings('') == set()
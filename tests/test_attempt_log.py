@@ -0,0 +1,81 @@
+# tests/test_attempt_log.py
+from datetime import datetime
+from backend.attempt_log import LoginAttemptLogger
+
+
+def attempts(db):
+    return db.execute_query(
+        "SELECT username, ip_address, success, failure_reason FROM login_attempts ORDER BY attempt_id",
+        fetch=True
+    )
+
+
+def idle_logger(**kwargs):
+    """A logger whose background thread never starts, so the queue only drains on flush()"""
+    attempt_logger = LoginAttemptLogger(**{'queue_size': 10, 'batch_size': 3, 'flush_interval': 0.05, **kwargs})
+    attempt_logger._stopping = True
+    return attempt_logger
+
+
+def test_flush_writes_queued_attempts_in_batches(db):
+    attempt_logger = idle_logger()
+    for i in range(7):
+        attempt_logger.log(f"user{i}", i % 2 == 0, '10.0.0.1', '' if i % 2 == 0 else 'Invalid password')
+    
+    assert attempt_logger.flush() == 7
+    rows = attempts(db)
+    assert [row['username'] for row in rows] == [f"user{i}" for i in range(7)]
+    assert rows[1]['failure_reason'] == 'Invalid password'
+    stats = attempt_logger.stats()
+    assert stats['written'] == 7 and stats['batches'] == 3 and stats['queue_depth'] == 0
+
+
+def test_background_thread_writes_attempts(db):
+    attempt_logger = LoginAttemptLogger(queue_size=10, batch_size=5, flush_interval=0.05)
+    attempt_logger.log('alice', True)
+    attempt_logger.stop()
+    assert [row['username'] for row in attempts(db)] == ['alice']
+
+
+def test_fields_are_cut_to_column_widths(db):
+    attempt_logger = idle_logger()
+    attempt_logger.log('x' * 500, False, '1' * 100, 'r' * 300)
+    attempt_logger.flush()
+    
+    row = attempts(db)[0]
+    assert len(row['username']) == LoginAttemptLogger.USERNAME_LENGTH
+    assert len(row['ip_address']) == LoginAttemptLogger.IP_ADDRESS_LENGTH
+    assert len(row['failure_reason']) == LoginAttemptLogger.FAILURE_REASON_LENGTH
+
+
+def test_rejected_row_does_not_drop_its_batch(db, caplog):
+    attempt_logger = idle_logger()
+    now = datetime.now()
+    # username is NOT NULL, so the database rejects the middle row
+    rows = [('alice', '', True, '', now), (None, '', False, 'bad', now), ('bob', '', False, '', now)]
+    
+    assert attempt_logger._write(rows) == 2
+    assert [row['username'] for row in attempts(db)] == ['alice', 'bob']
+    assert attempt_logger.stats()['errors'] == 1
+    assert "Dropped login attempt" in caplog.text and "'bad'" in caplog.text
+
+
+def test_overflow_drop_counts_discarded_attempts(db):
+    attempt_logger = idle_logger(queue_size=2, overflow='drop')
+    for i in range(5):
+        attempt_logger.log(f"user{i}", False)
+    
+    stats = attempt_logger.stats()
+    assert stats['queued'] == 2 and stats['dropped'] == 3
+    assert attempt_logger.flush() == 2
+
+
+def test_overflow_sync_writes_inline(db):
+    attempt_logger = idle_logger(queue_size=2, overflow='sync')
+    for i in range(5):
+        attempt_logger.log(f"user{i}", False)
+    
+    assert attempt_logger.stats()['overflow_writes'] == 3
+    assert len(attempts(db)) == 3
+    attempt_logger.flush()
+    assert len(attempts(db)) == 5
@@ -0,0 +1,65 @@
+# tests/test_benchmarks.py
+from collections import Counter
+from benchmarks.bench_load import RouteCountingDatabase, percentile, summarize, change
+from benchmarks.counting import CountingDatabase
+
+
+def test_percentile_is_nearest_rank():
+    values = list(range(1, 101))
+    assert [percentile(values, p) for p in (50, 95, 99, 100)] == [50, 95, 99, 100]
+    assert percentile([7], 99) == 7
+    assert percentile([], 50) == 0.0
+
+
+def test_summarize_splits_operations_and_background_work():
+    samples = [('login', 200, 0.010), ('login', 401, 0.020), ('validate', 200, 0.001), ('list', 0, 1.0)]
+    counters = {
+        '/api/login': Counter(checkouts=2, statements=6, commits=2),
+        '/api/validate-session': Counter(checkouts=1, statements=1, commits=0),
+        'background': Counter(statements=1, commits=1),
+    }
+    report = summarize(samples, counters, elapsed=2.0)
+    
+    login = report['login']
+    assert login['requests'] == 2 and login['statuses'] == {'200': 1, '401': 1}
+    assert login['throughput_rps'] == 1.0 and login['p50_ms'] == 10.0 and login['max_ms'] == 20.0
+    assert login['db']['round_trips_per_request'] == 4.0
+    assert report['list']['errors'] == 1
+    
+    assert report['all']['requests'] == 4
+    assert report['all']['db']['statements_per_request'] == 1.75
+    assert report['background'] == {
+        'statements': 1, 'commits': 1, 'round_trips': 2, 'round_trips_per_request': 0.5
+    }
+
+
+def test_change_is_relative():
+    assert change(200, 150) == '-25.0%'
+    assert change(0, 5) == '-'
+
+
+def test_counting_database_counts_round_trips(db):
+    with CountingDatabase() as counters:
+        db.execute_query("SELECT 1 AS one", fetch=True)
+        db.execute_query("UPDATE users SET status = 'Active' WHERE username = 'admin'")
+        with db.transaction() as cursor:
+            cursor.execute("SELECT 1")
+            cursor.execute("SELECT 2")
+    assert counters == Counter(checkouts=3, statements=4, commits=2)
+    
+    # Restored afterwards
+    with CountingDatabase() as counters:
+        pass
+    db.execute_query("SELECT 1", fetch=True)
+    assert counters['checkouts'] == 0
+
+
+def test_route_counting_database_buckets_by_route(client, db):
+    counting = RouteCountingDatabase()
+    with counting:
+        client.get('/api/users/list?limit=5')
+        db.execute_query("SELECT 1", fetch=True)
+    
+    totals = counting.totals()
+    assert totals['/api/users/list']['statements'] >= 1
+    assert totals['background'] == Counter(checkouts=1, statements=1)
@@ -0,0 +1,43 @@
+# tests/test_clocks.py
+from datetime import datetime, timedelta
+import pytest
+from backend import auth, retention
+from backend.auth import AuthManager
+from backend.retention import RetentionSweeper
+from tests.conftest import add_user
+
+# The app server five hours ahead of the database (another time zone)
+SKEW = timedelta(hours=5)
+
+
+class SkewedDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return datetime.now(tz) + SKEW
+
+
+@pytest.fixture
+def skewed_app_clock(monkeypatch):
+    for module in (auth, retention):
+        monkeypatch.setattr(module, 'datetime', SkewedDatetime)
+
+
+def test_new_sessions_are_valid_when_clocks_differ(client, skewed_app_clock):
+    user_id = add_user('alice')
+    session_id = AuthManager.complete_login(user_id)
+    assert AuthManager.validate_session(session_id)['user_id'] == user_id
+    
+    session_id = AuthManager.create_session(user_id)
+    assert AuthManager.validate_session(session_id)['user_id'] == user_id
+
+
+def test_sweep_keeps_just_logged_out_sessions_when_clocks_differ(client, db, skewed_app_clock):
+    user_id = add_user('alice')
+    session_id = AuthManager.complete_login(user_id)
+    AuthManager.logout(session_id)
+    
+    sweeper = RetentionSweeper(interval=60, batch_size=10, session_retention=3600,
+                               attempt_retention=3600, pause=0)
+    assert sweeper.sweep()['sessions_removed'] == 0
+    assert db.execute_query("SELECT is_active FROM user_sessions WHERE session_id = %s",
+                            (session_id,), fetch=True)[0]['is_active'] == 0
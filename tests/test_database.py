@@ -0,0 +1,64 @@
+# tests/test_database.py
+from datetime import datetime
+import pytest
+from tests.conftest import add_user
+
+INSERT_ATTEMPT = "INSERT INTO login_attempts (username, success, attempt_time) VALUES (%s, %s, %s)"
+
+
+def count(db, table):
+    return db.execute_query(f"SELECT COUNT(*) AS n FROM {table}", fetch=True)[0]['n']
+
+
+def test_transaction_commits_every_statement_once(db):
+    with db.transaction() as cursor:
+        cursor.execute(INSERT_ATTEMPT, ('alice', True, datetime.now()))
+        cursor.execute(INSERT_ATTEMPT, ('bob', False, datetime.now()))
+    assert count(db, 'login_attempts') == 2
+
+
+def test_execute_many_joins_an_open_transaction(db):
+    with pytest.raises(RuntimeError):
+        with db.transaction() as cursor:
+            db.execute_many(INSERT_ATTEMPT, [('alice', True, datetime.now())] * 5,
+                            chunk_size=2, cursor=cursor)
+            raise RuntimeError('abort')
+    assert count(db, 'login_attempts') == 0
+
+
+def test_execute_many_is_all_or_nothing(db):
+    add_user('taken')
+    before = count(db, 'users')
+    rows = [(f"USR-{name}", name, 'x', name, f"{name}@example.com", '09171234567', 'Cashier', '2024-01-01')
+            for name in ('fresh', 'taken')]
+    with pytest.raises(db.driver().IntegrityError):
+        db.execute_many("""
+            INSERT INTO users (user_id, username, password_hash, full_name, email, phone, role, employment_date)
+            VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
+        """, rows, chunk_size=1)
+    assert count(db, 'users') == before
+
+
+def test_execute_many_runs_updates_row_by_row(db):
+    for name in ('alice', 'bob', 'carol'):
+        add_user(name)
+    affected = db.execute_many(
+        "UPDATE users SET status = %s WHERE username = %s",
+        [('Inactive', 'alice'), ('Inactive', 'carol'), ('Inactive', 'nobody')]
+    )
+    assert affected == 2
+    inactive = db.execute_query("SELECT username FROM users WHERE status = 'Inactive' ORDER BY username",
+                                fetch=True)
+    assert [row['username'] for row in inactive] == ['alice', 'carol']
+
+
+def test_execute_many_consumes_a_generator_lazily(db):
+    produced = []
+    
+    def rows():
+        for i in range(7):
+            produced.append(i)
+            yield (f"lazy{i}", False, datetime.now())
+    
+    assert db.execute_many(INSERT_ATTEMPT, rows(), chunk_size=3) == 7
+    assert produced == list(range(7)) and count(db, 'login_attempts') == 7
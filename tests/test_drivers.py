@@ -0,0 +1,65 @@
+# tests/test_drivers.py
+from datetime import date, datetime
+import pytest
+from backend.drivers import SQLiteDriver, to_qmark
+from tests.conftest import add_user
+
+
+def test_to_qmark():
+    assert to_qmark("SELECT * FROM t WHERE a = %s AND b LIKE 'x%%'") == \
+        "SELECT * FROM t WHERE a = ? AND b LIKE 'x%'"
+
+
+def test_dates_round_trip(db):
+    add_user('dated')
+    login = datetime(2024, 3, 4, 5, 6, 7)
+    db.execute_query("UPDATE users SET last_login = %s WHERE username = 'dated'", (login,))
+    
+    row = db.execute_query("SELECT last_login, employment_date FROM users WHERE username = 'dated'",
+                           fetch=True)[0]
+    assert row['last_login'] == login
+    assert row['employment_date'] == date(2024, 1, 1)
+
+
+def test_duplicate_key_is_recognized(db):
+    add_user('twin')
+    with pytest.raises(db.driver().IntegrityError) as error:
+        add_user('twin', user_id='USR-other')
+    assert db.driver().is_duplicate_key(error.value)
+
+
+def test_transaction_rolls_back_on_error(db):
+    with pytest.raises(RuntimeError):
+        with db.transaction() as cursor:
+            cursor.execute("DELETE FROM users")
+            raise RuntimeError('abort')
+    assert db.execute_query("SELECT COUNT(*) AS n FROM users", fetch=True)[0]['n'] >= 1
+
+
+def test_execute_many_inserts_in_chunks(db):
+    rows = [(f"chunk{i}", False, datetime.now()) for i in range(25)]
+    affected = db.execute_many(
+        "INSERT INTO login_attempts (username, success, attempt_time) VALUES (%s, %s, %s)",
+        iter(rows), chunk_size=10
+    )
+    assert affected == 25
+    assert db.execute_query("SELECT COUNT(*) AS n FROM login_attempts", fetch=True)[0]['n'] == 25
+
+
+def test_limited_delete_removes_the_oldest_rows(db):
+    db.execute_many(
+        "INSERT INTO login_attempts (username, success, attempt_time) VALUES (%s, %s, %s)",
+        [(f"old{day}", False, datetime(2024, 1, day)) for day in range(1, 6)]
+    )
+    query = db.driver().limited_delete('login_attempts', 'attempt_time < %s', 'attempt_time')
+    db.execute_query(query, (datetime(2024, 1, 5), 2))
+    
+    remaining = db.execute_query("SELECT username FROM login_attempts ORDER BY attempt_time", fetch=True)
+    assert [row['username'] for row in remaining] == ['old3', 'old4', 'old5']
+
+
+def test_sqlite_full_scans():
+    driver = SQLiteDriver(':memory:')
+    plan = [{'detail': 'SCAN users'}, {'detail': 'SCAN products USING INDEX idx_name'},
+            {'detail': 'SEARCH users USING INDEX idx_username (username=?)'}]
+    assert driver.full_scans(plan) == ['users']
@@ -0,0 +1,79 @@
+# tests/test_email_domains.py
+import time
+import pytest
+from email_validator import EmailUndeliverableError
+from app_config import Config
+from backend import validation
+from backend.email_domains import DomainChecker
+from backend.validation import Validator
+
+
+class FakeDNS:
+    """lookup() stand-in: answers from a table and counts the queries"""
+    
+    def __init__(self, answers):
+        self.answers = answers
+        self.queries = []
+    
+    def __call__(self, domain, domain_i18n, timeout):
+        self.queries.append(domain)
+        answer = self.answers[domain]
+        if isinstance(answer, Exception):
+            raise answer
+        return answer
+
+
+def test_each_domain_is_looked_up_once_per_ttl():
+    dns = FakeDNS({'example.com': {'mx': [(10, 'mail.example.com')]}})
+    checker = DomainChecker(cache_size=10, ttl=0.05, timeout=1, lookup=dns)
+    
+    for domain in ('example.com', 'EXAMPLE.com', 'example.com'):
+        checker.check(domain)
+    assert dns.queries == ['example.com']
+    
+    time.sleep(0.06)
+    checker.check('example.com')
+    assert dns.queries == ['example.com'] * 2
+    assert checker.stats()['lookups'] == 2
+
+
+def test_undeliverable_domains_are_cached_too():
+    dns = FakeDNS({'nomail.ph': EmailUndeliverableError('The domain name nomail.ph does not exist.')})
+    checker = DomainChecker(cache_size=10, ttl=60, timeout=1, lookup=dns)
+    
+    for _ in range(2):
+        with pytest.raises(EmailUndeliverableError, match='does not exist'):
+            checker.check('nomail.ph')
+    assert dns.queries == ['nomail.ph']
+
+
+def test_unknown_results_are_let_through_and_retried_after_unknown_ttl():
+    dns = FakeDNS({'slow.test': {'unknown-deliverability': 'timeout'}})
+    checker = DomainChecker(cache_size=10, ttl=60, timeout=1, lookup=dns, unknown_ttl=0.05)
+    
+    for _ in range(3):
+        checker.check('slow.test')
+    assert dns.queries == ['slow.test']
+    
+    time.sleep(0.06)
+    checker.check('slow.test')
+    assert dns.queries == ['slow.test'] * 2
+    assert checker.stats()['unknown_results'] == 2
+
+
+def test_validator_uses_the_shared_checker(monkeypatch):
+    dns = FakeDNS({
+        'example.com': {'mx': [(10, 'mail.example.com')]},
+        'nomail.ph': EmailUndeliverableError('The domain name nomail.ph does not exist.')
+    })
+    monkeypatch.setattr(Config, 'EMAIL_CHECK_DELIVERABILITY', True)
+    monkeypatch.setattr(validation, 'domain_checker', DomainChecker(10, 60, 1, lookup=dns))
+    
+    assert Validator.validate_email_address('juan@example.com') == (True, 'juan@example.com')
+    assert Validator.validate_email_address('maria@example.com')[0] is True
+    assert Validator.validate_email_address('juan@nomail.ph') == (
+        False, 'The domain name nomail.ph does not exist.'
+    )
+    # Syntax errors never reach DNS
+    assert Validator.validate_email_address('not-an-email')[0] is False
+    assert dns.queries == ['example.com', 'nomail.ph']
@@ -0,0 +1,78 @@
+# tests/test_hashing.py
+import time
+import asyncio
+import threading
+import pytest
+from backend.hashing import HashingPool, HashingPoolFull
+
+
+def test_run_returns_the_result_and_counts_it():
+    pool = HashingPool(2, 2)
+    try:
+        assert pool.run(pow, 2, 10) == 1024
+        stats = pool.stats()
+        assert stats['completed'] == 1
+        assert stats['in_flight'] == 0 and stats['queue_depth'] == 0
+    finally:
+        pool.shutdown()
+
+
+def test_run_rejects_beyond_workers_plus_queue():
+    pool = HashingPool(1, 1, retry_after=3)
+    release = threading.Event()
+    threads = [threading.Thread(target=pool.run, args=(release.wait,)) for _ in range(2)]
+    try:
+        for thread in threads:
+            thread.start()
+        while pool.stats()['queue_depth'] + pool.stats()['in_flight'] < 2:
+            time.sleep(0.001)
+        
+        with pytest.raises(HashingPoolFull) as error:
+            pool.run(pow, 2, 2)
+        assert error.value.retry_after == 3
+        assert pool.stats()['rejected'] == 1
+        
+        # Slots come back once the jobs finish
+        release.set()
+        for thread in threads:
+            thread.join()
+        assert pool.stats()['completed'] == 2
+        assert pool.run(pow, 2, 2) == 4
+    finally:
+        release.set()
+        pool.shutdown()
+
+
+def test_failed_jobs_release_their_slot():
+    pool = HashingPool(1, 0)
+    try:
+        for _ in range(3):
+            with pytest.raises(ZeroDivisionError):
+                pool.run(divmod, 1, 0)
+        assert pool.run(pow, 3, 2) == 9
+    finally:
+        pool.shutdown()
+
+
+def test_run_async_awaits_the_worker():
+    pool = HashingPool(1, 1)
+    try:
+        assert asyncio.run(pool.run_async(pow, 2, 5)) == 32
+    finally:
+        pool.shutdown()
+
+
+def test_run_many_keeps_order_and_never_takes_the_whole_queue():
+    pool = HashingPool(2, 4)
+    peak = []
+    
+    def square(n):
+        peak.append(pool.stats()['queue_depth'] + pool.stats()['in_flight'])
+        return n * n
+    
+    try:
+        assert pool.run_many(square, [(n,) for n in range(20)]) == [n * n for n in range(20)]
+        assert max(peak) <= pool.workers
+        assert pool.stats()['rejected'] == 0
+    finally:
+        pool.shutdown()
@@ -0,0 +1,101 @@
+# tests/test_inventory.py
+import pytest
+from backend.inventory import InventoryManager, search_terms, query_terms, prefix_pattern, build_search
+
+
+def product(sku, name, stock=50, min_stock=10, category='Tools', price=9.5):
+    return {'sku': sku, 'name': name, 'category': category, 'stock': stock,
+            'min_stock': min_stock, 'price': price, 'description': None}
+
+
+@pytest.fixture
+def catalogue(db):
+    ids = {}
+    for sku, name, stock in (
+        ('HDW-001', 'Claw Hammer 16oz', 40),
+        ('HDW-002', 'Power Drill Set', 3),
+        ('PLB-010', 'PVC Pipe Fitting', 0),
+        ('ELC-7', 'Drill Bit Kit', 25),
+    ):
+        ids[sku] = InventoryManager.create(product(sku, name, stock))
+    return ids
+
+
+def names(products):
+    return [row['name'] for row in products]
+
+
+def test_search_terms_keep_dashed_words_and_their_parts():
+    assert search_terms('Power Drill Set', 'HDW-001') == {'power', 'drill', 'set', 'hdw-001', 'hdw', '001'}
+    assert query_terms('  Drill   #Set!! a b c d e f') == ['drill', 'set', 'a', 'b', 'c']
+
+
+def test_prefix_pattern_escapes_like_wildcards():
+    assert prefix_pattern('50%_off!') == '50!%!_off!!%'
+
+
+def test_build_search_adds_one_index_condition_per_filter():
+    query, params = build_search('power dr', sku='hdw', category='Tools', stock='low',
+                                 after=['Power', 7], limit=10)
+    assert query.count('product_search_terms') == 2
+    assert params == ('power%', 'dr%', 'HDW%', 'Tools', 'low', 'Power', 'Power', 7, 10)
+
+
+def test_word_prefix_search(catalogue):
+    assert names(InventoryManager.search('dril')) == ['Drill Bit Kit', 'Power Drill Set']
+    assert names(InventoryManager.search('drill power')) == ['Power Drill Set']
+    assert names(InventoryManager.search('hdw')) == ['Claw Hammer 16oz', 'Power Drill Set']
+    assert InventoryManager.search('saw') == []
+
+
+def test_sku_and_stock_filters(catalogue):
+    assert names(InventoryManager.search(sku='plb')) == ['PVC Pipe Fitting']
+    assert names(InventoryManager.search(stock='low')) == ['Power Drill Set']
+    assert names(InventoryManager.search(stock='critical')) == ['PVC Pipe Fitting']
+
+
+def test_keyset_pages_cover_everything_once(catalogue):
+    seen, after = [], None
+    while True:
+        page = InventoryManager.search(after=after, limit=3)
+        seen += names(page)
+        if len(page) < 3:
+            break
+        after = [page[-1]['name'], page[-1]['product_id']]
+    assert seen == sorted(seen, key=str.lower) and len(seen) == 4
+
+
+def test_update_replaces_search_terms(catalogue):
+    product_id = catalogue['HDW-001']
+    assert InventoryManager.update(product_id, product('HDW-001', 'Sledge Hammer', 1)) is True
+    
+    assert InventoryManager.search('claw') == []
+    assert names(InventoryManager.search('sledge')) == ['Sledge Hammer']
+    assert InventoryManager.get(product_id)['stock_status'] == 'low'
+    assert InventoryManager.update(99999, product('X-1', 'Ghost')) is False
+
+
+def test_delete_removes_product_and_terms(catalogue, db):
+    assert InventoryManager.delete(catalogue['ELC-7']) is True
+    assert InventoryManager.search('bit') == []
+    assert db.execute_query("SELECT COUNT(*) AS n FROM product_search_terms WHERE product_id = %s",
+                            (catalogue['ELC-7'],), fetch=True)[0]['n'] == 0
+    assert InventoryManager.delete(catalogue['ELC-7']) is False
+
+
+def test_add_route_validates_and_rejects_duplicate_skus(client):
+    body = {'name': 'Tape Measure', 'sku': 'tls-5', 'category': 'Tools', 'stock': 5,
+            'minStock': 2, 'price': 4.25, 'description': ''}
+    response = client.post('/api/inventory/add', json=body)
+    assert response.status_code == 201
+    assert response.get_json()['product']['sku'] == 'TLS-5'
+    
+    assert client.post('/api/inventory/add', json=body).status_code == 400
+    assert client.post('/api/inventory/add', json={**body, 'sku': 'TLS-6', 'stock': -1}).status_code == 400
+
+
+@pytest.mark.parametrize('body', [[1, 2], 'text', 7, None])
+def test_product_body_must_be_a_json_object(client, body):
+    for method, path in (('post', '/api/inventory/add'), ('put', '/api/inventory/update/1')):
+        response = getattr(client, method)(path, json=body)
+        assert response.status_code == 400
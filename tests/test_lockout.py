@@ -0,0 +1,92 @@
+# tests/test_lockout.py
+import time
+from datetime import datetime, timedelta
+from backend.lockout import LockoutTracker
+
+
+def tracker(max_attempts=3, window=900, max_tracked=100):
+    lockout = LockoutTracker(max_attempts, window, max_tracked)
+    lockout._loaded = True  # Nothing to rebuild from
+    return lockout
+
+
+def test_locks_after_max_failures_inside_the_window():
+    lockout = tracker()
+    now = time.time()
+    for seconds_ago in (30, 20):
+        lockout.record_failure('Alice', now - seconds_ago)
+    assert lockout.check('alice', now) == (False, 0)
+    
+    lockout.record_failure('ALICE', now - 10)
+    locked, remaining = lockout.check('alice', now)
+    assert locked and remaining == 890
+
+
+def test_lock_ends_when_a_counted_failure_leaves_the_window():
+    lockout = tracker()
+    now = time.time()
+    for seconds_ago in (300, 200, 100):
+        lockout.record_failure('bob', now - seconds_ago)
+    
+    # Like the original COUNT(*) over the last window: fewer than
+    # max_attempts failures inside it means unlocked
+    assert lockout.check('bob', now + 599)[0] is True
+    assert lockout.check('bob', now + 601) == (False, 0)
+
+
+def test_only_the_last_max_attempts_failures_count():
+    lockout = tracker()
+    now = time.time()
+    # Two old failures fall out of the ring as newer ones arrive
+    for seconds_ago in (2000, 1900, 60, 50):
+        lockout.record_failure('carol', now - seconds_ago)
+    assert lockout.check('carol', now) == (False, 0)
+    
+    lockout.record_failure('carol', now - 40)
+    assert lockout.check('carol', now)[0] is True
+
+
+def test_least_recently_failed_usernames_are_evicted():
+    lockout = tracker(max_tracked=2)
+    now = time.time()
+    for username in ('u1', 'u2', 'u3'):
+        lockout.record_failure(username, now)
+    
+    stats = lockout.stats()
+    assert stats['tracked_usernames'] == 2 and stats['evictions'] == 1
+    assert 'u1' not in lockout._failures
+
+
+def test_rebuild_reads_recent_failures(db):
+    recent = datetime.now() - timedelta(minutes=1)
+    db.execute_many(
+        "INSERT INTO login_attempts (username, success, attempt_time) VALUES (%s, %s, %s)",
+        [('dave', False, recent)] * 3 + [('dave', True, recent), ('erin', False, recent - timedelta(hours=2))]
+    )
+    
+    lockout = LockoutTracker(3, 900, 100)
+    assert lockout.check('dave')[0] is True
+    assert lockout.check('erin') == (False, 0)
+    assert lockout.stats()['tracked_usernames'] == 1
+
+
+def test_failed_rebuild_backs_off(db, monkeypatch):
+    from backend import lockout as lockout_module
+    calls = []
+    
+    def unavailable(*args, **kwargs):
+        calls.append(1)
+        raise ConnectionError('database is down')
+    
+    monkeypatch.setattr(lockout_module.Database, 'execute_query', unavailable)
+    lockout = LockoutTracker(3, 900, 100, retry_interval=0.05)
+    
+    for _ in range(5):
+        assert lockout.check('dave') == (False, 0)
+    assert len(calls) == 1
+    assert lockout.stats()['loaded'] is False and lockout.stats()['rebuild_failures'] == 1
+    
+    time.sleep(0.06)
+    monkeypatch.undo()
+    lockout.check('dave')
+    assert lockout.stats()['loaded'] is True
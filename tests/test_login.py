@@ -0,0 +1,100 @@
+# tests/test_login.py
+import pytest
+from argon2 import PasswordHasher
+from backend import auth
+from backend.auth import AuthManager, ph
+from tests.conftest import add_user
+
+
+def user_row(db, user_id):
+    return db.execute_query(
+        "SELECT password_hash, last_login FROM users WHERE user_id = %s", (user_id,), fetch=True
+    )[0]
+
+
+def sessions(db, user_id):
+    return db.execute_query(
+        "SELECT session_id, ip_address, user_agent FROM user_sessions WHERE user_id = %s",
+        (user_id,), fetch=True
+    )
+
+
+def test_complete_login_creates_session_and_records_last_login(db):
+    user_id = add_user('alice')
+    session_id = AuthManager.complete_login(user_id, '10.0.0.1', 'pytest')
+    
+    assert sessions(db, user_id) == [
+        {'session_id': session_id, 'ip_address': '10.0.0.1', 'user_agent': 'pytest'}
+    ]
+    row = user_row(db, user_id)
+    assert row['last_login'] is not None and row['password_hash'] == 'unused'
+
+
+def test_complete_login_replaces_the_hash_only_when_given(db):
+    user_id = add_user('alice')
+    AuthManager.complete_login(user_id, new_password_hash='rehashed')
+    assert user_row(db, user_id)['password_hash'] == 'rehashed'
+
+
+def test_complete_login_is_all_or_nothing(db, monkeypatch):
+    user_id = add_user('alice')
+    monkeypatch.setattr(auth, 'REHASH_QUERY', "UPDATE users SET no_such_column = %s WHERE user_id = %s")
+    
+    with pytest.raises(Exception):
+        AuthManager.complete_login(user_id, new_password_hash='rehashed')
+    assert sessions(db, user_id) == []
+    assert user_row(db, user_id)['last_login'] is None
+
+
+def test_login_writes_with_one_statement(db):
+    from benchmarks.counting import CountingDatabase
+    user_id = add_user('alice')
+    db.execute_query("UPDATE users SET failed_login_attempts = 3 WHERE user_id = %s", (user_id,))
+    
+    with CountingDatabase() as counters:
+        AuthManager.complete_login(user_id)
+    
+    assert (counters['statements'], counters['commits']) == (1, 1)
+    row = db.execute_query("""
+        SELECT u.last_login, u.failed_login_attempts, s.last_activity
+        FROM users u JOIN user_sessions s ON s.user_id = u.user_id
+        WHERE u.user_id = %s
+    """, (user_id,), fetch=True)[0]
+    assert row['last_login'] == row['last_activity'] and row['failed_login_attempts'] == 0
+
+
+def test_login_route(client, db):
+    user_id = add_user('alice', password_hash=ph.hash('correct horse'))
+    
+    response = client.post('/api/login', json={'username': 'alice', 'password': 'wrong'})
+    assert response.status_code == 401
+    assert sessions(db, user_id) == []
+    
+    response = client.post('/api/login', json={'username': 'alice', 'password': 'correct horse'},
+                           headers={'User-Agent': 'pytest'})
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body['user_id'] == user_id
+    assert [row['session_id'] for row in sessions(db, user_id)] == [body['session_id']]
+    
+    # The landing page's session check is answered from the cache the login filled
+    from benchmarks.counting import CountingDatabase
+    with CountingDatabase() as counters:
+        response = client.post('/api/validate-session', json={'session_id': body['session_id']})
+    assert response.get_json()['user'] == {
+        'user_id': user_id, 'username': 'alice', 'full_name': 'Alice', 'role': 'Cashier', 'status': 'Active'
+    }
+    assert counters['statements'] == 0
+    auth.session_cache.clear()
+    assert AuthManager.validate_session(body['session_id']) == response.get_json()['user']
+
+
+def test_login_rehashes_outdated_hashes(client, db):
+    old_hash = PasswordHasher(time_cost=1, memory_cost=8192, parallelism=1).hash('correct horse')
+    user_id = add_user('alice', password_hash=old_hash)
+    
+    response = client.post('/api/login', json={'username': 'alice', 'password': 'correct horse'})
+    assert response.status_code == 200
+    new_hash = user_row(db, user_id)['password_hash']
+    assert new_hash != old_hash and not ph.check_needs_rehash(new_hash)
+    assert ph.verify(new_hash, 'correct horse')
@@ -0,0 +1,64 @@
+# tests/test_metrics.py
+import pytest
+from app_config import Config
+from backend.metrics import MetricsRegistry, Histogram, http_request_seconds
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram('demo_seconds', 'Demo latency', ('route',), buckets=(0.1, 1.0))
+    for value in (0.05, 0.1, 0.5, 3.0):
+        histogram.observe(value, '/api/demo')
+    
+    assert histogram.render() == [
+        '# HELP demo_seconds Demo latency',
+        '# TYPE demo_seconds histogram',
+        'demo_seconds_bucket{route="/api/demo",le="0.1"} 2',
+        'demo_seconds_bucket{route="/api/demo",le="1.0"} 3',
+        'demo_seconds_bucket{route="/api/demo",le="+Inf"} 4',
+        'demo_seconds_sum{route="/api/demo"} 3.65',
+        'demo_seconds_count{route="/api/demo"} 4',
+    ]
+
+
+def test_label_values_are_escaped():
+    histogram = Histogram('demo_seconds', 'Demo', ('route',), buckets=(1.0,))
+    histogram.observe(0.5, 'a"b\\c\nd')
+    assert 'demo_seconds_count{route="a\\"b\\\\c\\nd"} 1' in histogram.render()
+
+
+def test_disabled_histograms_record_nothing():
+    histogram = MetricsRegistry(enabled=False).histogram('demo_seconds', 'Demo')
+    histogram.observe(0.5)
+    assert histogram.render() == ['# HELP demo_seconds Demo', '# TYPE demo_seconds histogram']
+
+
+def test_registry_renders_gauges_and_rejects_duplicates():
+    registry = MetricsRegistry()
+    registry.gauge('queue_depth', 'Jobs waiting', lambda: 3)
+    registry.gauge('broken', 'Source unavailable', lambda: 1 / 0)
+    with pytest.raises(ValueError):
+        registry.gauge('queue_depth', 'Again', lambda: 0)
+    
+    assert registry.render() == '# HELP queue_depth Jobs waiting\n# TYPE queue_depth gauge\nqueue_depth 3\n'
+
+
+def test_requests_are_timed_by_route_template(client, monkeypatch):
+    monkeypatch.setattr(Config, 'METRICS_ENABLED', True)
+    http_request_seconds.clear()
+    client.post('/api/validate-session', json={'session_id': 'nope'})
+    client.get('/no-such-file.js')
+    client.get('/other/missing.css')
+    
+    response = client.get('/metrics')
+    assert response.status_code == 200
+    assert response.content_type.startswith('text/plain; version=0.0.4')
+    body = response.get_data(as_text=True)
+    assert 'http_request_duration_seconds_count{method="POST",route="/api/validate-session",status="200"} 1' in body
+    # Raw paths share their route's series instead of one per URL
+    assert 'http_request_duration_seconds_count{method="GET",route="/<path:filename>",status="404"} 2' in body
+    assert '# TYPE db_pool_connections_in_use gauge' in body
+
+
+def test_metrics_endpoint_can_be_disabled(client, monkeypatch):
+    monkeypatch.setattr(Config, 'METRICS_ENABLED', False)
+    assert client.get('/metrics').status_code == 404
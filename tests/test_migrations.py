@@ -0,0 +1,77 @@
+# tests/test_migrations.py
+import pytest
+from backend.database import Database
+from backend.drivers import SQLiteDriver
+from backend.migrations import MigrationRunner, MigrationError, split_statements, check_query_plans
+
+
+def test_split_statements_drops_comments():
+    sql = """
+    -- header comment
+    CREATE TABLE a (id INT); -- trailing comment
+    INSERT INTO a VALUES (1);
+    """
+    assert split_statements(sql) == ['CREATE TABLE a (id INT)', 'INSERT INTO a VALUES (1)']
+
+
+def test_split_statements_keeps_trigger_bodies_whole():
+    sql = """
+    CREATE TABLE t (id INT, updated TEXT);
+    CREATE TRIGGER IF NOT EXISTS t_touch
+    AFTER UPDATE ON t
+    BEGIN
+        UPDATE t SET updated = 'x' WHERE id = NEW.id;
+        UPDATE t SET updated = 'y' WHERE id = NEW.id + 1;
+    END;
+    CREATE INDEX idx_t ON t (id);
+    """
+    statements = split_statements(sql)
+    assert len(statements) == 3
+    assert statements[1].startswith('CREATE TRIGGER') and statements[1].endswith('END')
+    assert statements[1].count(';') == 2
+
+
+def test_migrate_applies_every_file_once(db):
+    runner = MigrationRunner()
+    assert runner.pending() == []
+    assert runner.migrate() == []
+    assert sorted(runner.applied()) == [version for version, _, _ in runner.discover()]
+
+
+@pytest.fixture
+def empty_db(tmp_path):
+    Database.use_driver(SQLiteDriver(str(tmp_path / 'empty.db')))
+    yield Database
+    Database.use_driver(SQLiteDriver(':memory:'))
+
+
+def test_edited_or_missing_migrations_are_errors(empty_db, tmp_path):
+    folder = tmp_path / 'migrations'
+    folder.mkdir()
+    (folder / '0001_first.sql').write_text("CREATE TABLE first_table (id INT);")
+    runner = MigrationRunner(str(folder))
+    assert runner.migrate() == ['0001_first']
+    
+    (folder / '0001_first.sql').write_text("CREATE TABLE first_table (id BIGINT);")
+    with pytest.raises(MigrationError, match='edited'):
+        runner.pending()
+    
+    (folder / '0001_first.sql').unlink()
+    with pytest.raises(MigrationError, match='missing'):
+        runner.pending()
+
+
+def test_migrations_are_forward_only(empty_db, tmp_path):
+    folder = tmp_path / 'migrations'
+    folder.mkdir()
+    (folder / '0002_second.sql').write_text("CREATE TABLE second_table (id INT);")
+    runner = MigrationRunner(str(folder))
+    runner.migrate()
+    
+    (folder / '0001_first.sql').write_text("CREATE TABLE first_table (id INT);")
+    with pytest.raises(MigrationError, match='forward-only'):
+        runner.migrate()
+
+
+def test_hot_queries_use_indexes(db):
+    assert check_query_plans() == []
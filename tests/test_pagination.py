@@ -0,0 +1,95 @@
+# tests/test_pagination.py
+import base64
+import json
+from datetime import datetime
+import pytest
+from backend.pagination import encode_cursor, decode_cursor, parse_limit, InvalidCursor
+from tests.conftest import add_user
+
+
+def raw_cursor(payload):
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode().rstrip('=')
+
+
+def test_cursor_round_trip():
+    created = datetime(2024, 5, 1, 12, 30, 15)
+    assert decode_cursor(encode_cursor(created, 'USR-1'), 2) == [created, 'USR-1']
+    assert decode_cursor(encode_cursor('Hammer', 42), 2) == ['Hammer', 42]
+
+
+@pytest.mark.parametrize('cursor', [
+    'WzEsWzFdXQ',                          # [1,[1]]
+    raw_cursor([1, {'a': 1}]),
+    raw_cursor([{'dt': 5}, 'USR-1']),
+    raw_cursor([{'dt': '2024-01-01', 'x': 1}, 'USR-1']),
+    raw_cursor([{'dt': 'yesterday'}, 'USR-1']),
+    raw_cursor([None, 'USR-1']),
+    raw_cursor([True, 'USR-1']),
+    raw_cursor({'a': 1, 'b': 2}),
+    raw_cursor('ab'),
+    raw_cursor([1]),
+    '!!!',
+    base64.urlsafe_b64encode(b'\xff\xfe').decode(),
+])
+def test_tampered_cursor_is_rejected(cursor):
+    with pytest.raises(InvalidCursor):
+        decode_cursor(cursor, 2)
+
+
+def test_parse_limit_clamps():
+    assert parse_limit(None, 50, 200) == 50
+    assert parse_limit('0', 50, 200) == 1
+    assert parse_limit('1000', 50, 200) == 200
+    with pytest.raises(ValueError):
+        parse_limit('ten', 50, 200)
+
+
+def test_user_list_pages_with_cursor(client):
+    for i in range(5):
+        add_user(f"pager{i}")
+    
+    seen = []
+    cursor = None
+    while True:
+        response = client.get('/api/users/list', query_string={'limit': 2, **({'cursor': cursor} if cursor else {})})
+        body = response.get_json()
+        seen += [user['user_id'] for user in body['users']]
+        cursor = body.get('next_cursor')
+        if not cursor:
+            break
+    
+    assert len(seen) == len(set(seen)) == 6  # five users and the seeded admin
+
+
+def test_user_search_covers_every_page(client, db):
+    for i in range(30):
+        add_user(f"filler{i}")
+    add_user('mreyes')   # newest: on the first page anyway
+    db.execute_query("UPDATE users SET full_name = 'Maria Santos', created_at = %s WHERE username = 'filler0'",
+                     ('2000-01-01 00:00:00',))
+    add_user('ma_rk')
+    
+    def search(q, **args):
+        body = client.get('/api/users/list', query_string={'q': q, **args}).get_json()
+        return [user['username'] for user in body['users']], body
+    
+    # The oldest user is 30 rows back, far past one 25-row page
+    assert search('santos', limit=25)[0] == ['filler0']
+    assert search('MAR')[0] == ['filler0']           # word of full_name, any case
+    assert search('mreyes@example')[0] == ['mreyes']  # email prefix
+    assert search('ma_')[0] == ['ma_rk']              # LIKE wildcards are literal
+    assert search('reyes')[0] == []                   # not a prefix
+    
+    usernames, body = search('filler', limit=20)
+    assert len(usernames) == 20 and body['has_more'] is True
+    rest = client.get('/api/users/list', query_string={'q': 'filler', 'cursor': body['next_cursor']}).get_json()
+    assert len(rest['users']) == 10 and rest['next_cursor'] is None
+    
+    export = client.get('/api/users/list', query_string={'q': 'santos', 'format': 'ndjson'})
+    assert [json.loads(line)['username'] for line in export.get_data(as_text=True).splitlines()] == ['filler0']
+
+
+@pytest.mark.parametrize('path', ['/api/users/list', '/api/inventory/search'])
+def test_tampered_cursor_is_a_bad_request(client, path):
+    response = client.get(path, query_string={'cursor': 'WzEsWzFdXQ'})
+    assert response.status_code == 400
@@ -0,0 +1,105 @@
+# tests/test_photos.py
+import os
+import threading
+import pytest
+from backend import photos
+from backend.photos import PhotoStore, InvalidPhoto, photo_processor, variant_path
+from tests.conftest import add_user, image_bytes
+
+
+@pytest.fixture
+def store(db, tmp_path):
+    return PhotoStore(str(tmp_path / 'photos'), photo_processor)
+
+
+def test_identical_uploads_share_files(store):
+    first = store.save(image_bytes())
+    second = store.save(image_bytes())
+    
+    assert first == second
+    assert sorted(os.listdir(store.folder)) == sorted(
+        os.path.basename(variant_path(first, name)) for name in ('avatar', 'thumb')
+    )
+    assert store.stats()['stored'] == 1 and store.stats()['deduplicated'] == 1
+
+
+def test_photo_path_uses_the_configured_folder(db):
+    store = PhotoStore('uploads/profile_photos', photo_processor)
+    assert store.url_prefix == 'uploads/profile_photos/'
+
+
+def test_release_keeps_referenced_photos(store, db):
+    photo_path = store.save(image_bytes('green'))
+    add_user('holder')
+    db.execute_query("UPDATE users SET photo_path = %s WHERE username = 'holder'", (photo_path,))
+    store.unhold(photo_path)
+    
+    assert store.release(photo_path) is False
+    assert len(os.listdir(store.folder)) == 2
+    
+    db.execute_query("DELETE FROM users WHERE username = 'holder'")
+    assert store.release(photo_path) is True
+    assert os.listdir(store.folder) == []
+
+
+def test_saved_photo_is_kept_until_its_row_is_written(store, db):
+    photo_path = store.save(image_bytes('blue'))
+    add_user('first')
+    db.execute_query("UPDATE users SET photo_path = %s WHERE username = 'first'", (photo_path,))
+    store.unhold(photo_path)
+    
+    # A second registration deduplicates onto the files, then the first
+    # user is deleted before the second row is inserted
+    assert store.save(image_bytes('blue')) == photo_path
+    db.execute_query("DELETE FROM users WHERE username = 'first'")
+    assert store.release(photo_path) is False
+    assert len(os.listdir(store.folder)) == 2
+    
+    store.unhold(photo_path)
+    assert store.release(photo_path) is True
+
+
+def test_save_during_release_recreates_the_files(store, db, monkeypatch):
+    photo_path = store.save(image_bytes('red'))
+    store.unhold(photo_path)
+    saved = []
+    saver = threading.Thread(target=lambda: saved.append(store.save(image_bytes('red'))))
+    original = photos.Database.execute_query
+    
+    def count_then_save(*args, **kwargs):
+        # A save that starts between the reference count and the delete
+        result = original(*args, **kwargs)
+        saver.start()
+        saver.join(0.2)
+        return result
+    
+    monkeypatch.setattr(photos.Database, 'execute_query', count_then_save)
+    assert store.release(photo_path) is True
+    saver.join()
+    
+    assert saved == [photo_path]
+    assert all(os.path.exists(variant_path(os.path.join(store.folder, os.path.basename(photo_path)), name))
+               for name in ('avatar', 'thumb'))
+    assert store.stats()['stored'] == 2
+
+
+def test_invalid_image_is_rejected(store):
+    with pytest.raises(InvalidPhoto):
+        store.save(b'not an image')
+    with pytest.raises(InvalidPhoto):
+        store.save(image_bytes(image_format='GIF'))
+
+
+def test_file_path_serves_only_stored_and_legacy_names(store):
+    name = os.path.basename(store.save(image_bytes('yellow')))
+    assert store.file_path(name) == (os.path.join(store.folder, name), True)
+    
+    for other in ('jdoe_20240101120000.jpg', f"{'a' * 64}.1234.tmp.jpg", 'notes.txt'):
+        with open(os.path.join(store.folder, other), 'wb') as f:
+            f.write(b'x')
+    
+    assert store.file_path('jdoe_20240101120000.jpg')[1] is False
+    assert store.file_path('jdoe_20240101120000.jpg')[0] is not None
+    assert store.file_path(f"{'a' * 64}.1234.tmp.jpg") == (None, False)
+    assert store.file_path('notes.txt') == (None, False)
+    assert store.file_path('../app.py') == (None, False)
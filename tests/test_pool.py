@@ -0,0 +1,127 @@
+# tests/test_pool.py
+import time
+import threading
+import pytest
+from backend.pool import ConnectionPool, PoolError
+from backend.database import Database
+
+
+class FakeConnection:
+    """Just enough of a driver connection for the pool"""
+    
+    def __init__(self):
+        self.closed = False
+        self.alive = True
+        self.in_transaction = False
+        self.rollbacks = 0
+    
+    def ping(self, reconnect=False):
+        if not self.alive:
+            raise OSError('gone away')
+    
+    def rollback(self):
+        self.rollbacks += 1
+        self.in_transaction = False
+    
+    def close(self):
+        self.closed = True
+
+
+def fake_pool(**kwargs):
+    connections = []
+    
+    def connect():
+        connections.append(FakeConnection())
+        return connections[-1]
+    
+    pool = ConnectionPool(connect, **{'size': 1, 'timeout': 0.05, **kwargs})
+    return pool, connections
+
+
+def test_returned_connections_are_reused():
+    pool, connections = fake_pool(size=2, ping_idle=60)
+    pool.acquire().close()
+    pool.acquire().close()
+    
+    assert len(connections) == 1
+    stats = pool.stats()
+    assert stats['open'] == 1 and stats['idle'] == 1 and stats['checkouts'] == 2
+
+
+def test_overflow_connections_close_when_returned():
+    pool, connections = fake_pool(size=1, max_overflow=1)
+    first, second = pool.acquire(), pool.acquire()
+    with pytest.raises(PoolError):
+        pool.acquire()
+    assert pool.stats()['timeouts'] == 1
+    
+    first.close()
+    second.close()
+    # Whichever comes back while the pool is over size is closed
+    assert sorted(connection.closed for connection in connections) == [False, True]
+    assert pool.stats()['open'] == 1
+
+
+def test_waiting_checkout_gets_a_returned_connection():
+    pool, connections = fake_pool(timeout=5)
+    held = pool.acquire()
+    threading.Timer(0.05, held.close).start()
+    
+    pool.acquire().close()
+    assert len(connections) == 1
+    assert pool.stats()['max_wait_ms'] > 0
+
+
+def test_old_connections_are_recycled():
+    pool, connections = fake_pool(recycle=0.01)
+    pool.acquire().close()
+    time.sleep(0.02)
+    pool.acquire().close()
+    
+    assert len(connections) == 2 and connections[0].closed
+    assert pool.stats()['recycled'] == 1
+
+
+def test_idle_connections_failing_a_ping_are_replaced():
+    pool, connections = fake_pool(ping_idle=0)
+    pool.acquire().close()
+    connections[0].alive = False
+    pool.acquire().close()
+    
+    assert len(connections) == 2 and connections[0].closed
+    assert pool.stats()['ping_failures'] == 1
+
+
+def test_release_ends_open_transactions():
+    pool, connections = fake_pool()
+    connection = pool.acquire()
+    connection.raw.in_transaction = True
+    connection.close()
+    assert connections[0].rollbacks == 1
+
+
+def test_pinned_connections_ignore_close_until_released():
+    pool, _ = fake_pool()
+    connection = pool.acquire()
+    connection.pinned = True
+    connection.close()
+    assert pool.stats()['in_use'] == 1
+    connection.release()
+    connection.release()
+    assert pool.stats()['in_use'] == 0
+
+
+def test_one_connection_per_request(db):
+    from app import app
+    
+    with app.test_request_context():
+        first = Database.get_connection()
+        db.execute_query("SELECT 1", fetch=True)
+        assert Database.get_connection() is first
+        assert Database.pool_stats()['in_use'] == 1
+        Database.release_request_connection()
+    assert Database.pool_stats()['in_use'] == 0
+    
+    # Outside a request every call checks out its own connection
+    connection = Database.get_connection()
+    assert Database.get_connection() is not connection
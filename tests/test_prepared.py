@@ -0,0 +1,94 @@
+# tests/test_prepared.py
+import sqlite3
+import pytest
+from backend.database import Database, ER_UNSUPPORTED_PS
+from backend.pool import ConnectionPool
+
+
+class FakeCursor:
+    def __init__(self, fail_with=None):
+        self.closed = False
+        self.fail_with = fail_with
+    
+    def execute(self, statement, params):
+        if self.fail_with is not None:
+            raise self.fail_with
+    
+    def close(self):
+        self.closed = True
+
+
+class FakeConnection:
+    in_transaction = False
+    
+    def __init__(self, fail_with=None):
+        self.fail_with = fail_with
+        self.cursors = []
+    
+    def cursor(self, prepared=False, dictionary=False):
+        self.cursors.append(FakeCursor(self.fail_with))
+        return self.cursors[-1]
+
+
+def server_error(errno):
+    error = sqlite3.OperationalError(f"server error {errno}")
+    error.errno = errno
+    return error
+
+
+def checkout(fail_with=None, statement_cache_size=2):
+    pool = ConnectionPool(lambda: FakeConnection(fail_with), size=1,
+                          statement_cache_size=statement_cache_size)
+    return pool.acquire()
+
+
+def test_statements_are_prepared_once_per_connection():
+    connection = checkout()
+    first = connection.prepared_cursor('SELECT 1')
+    assert connection.prepared_cursor('SELECT 1') is first
+    assert len(connection.raw.cursors) == 1
+
+
+def test_least_recently_used_statement_is_closed():
+    connection = checkout(statement_cache_size=2)
+    one, _ = connection.prepared_cursor('SELECT 1')
+    two, _ = connection.prepared_cursor('SELECT 2')
+    connection.prepared_cursor('SELECT 1')
+    connection.prepared_cursor('SELECT 3')
+    
+    assert list(connection.statements) == ['SELECT 1', 'SELECT 3']
+    assert two.closed and not one.closed
+
+
+def test_statements_survive_returning_the_connection():
+    connection = checkout()
+    entry = connection.prepared_cursor('SELECT 1')
+    connection.close()
+    assert connection._pool.acquire().prepared_cursor('SELECT 1') is entry
+
+
+def test_lost_statements_fall_back_to_text(db):
+    connection = checkout(fail_with=server_error(1243))
+    assert Database._execute_prepared(connection, 'SELECT 1', ()) == (None, False)
+    assert connection.statements == {} and connection.raw.cursors[0].closed
+    assert 'SELECT 1' not in Database._unpreparable
+
+
+def test_unpreparable_statements_are_remembered(db, monkeypatch):
+    monkeypatch.setattr(Database, '_unpreparable', set())
+    connection = checkout(fail_with=server_error(ER_UNSUPPORTED_PS))
+    assert Database._execute_prepared(connection, 'SHOW STATUS', ()) == (None, False)
+    assert 'SHOW STATUS' in Database._unpreparable
+
+
+def test_other_errors_are_raised(db):
+    connection = checkout(fail_with=server_error(1062))
+    with pytest.raises(sqlite3.OperationalError):
+        Database._execute_prepared(connection, 'INSERT INTO t VALUES (%s)', (1,))
+
+
+def test_prepared_queries_run_on_sqlite(db):
+    for _ in range(2):
+        rows = db.execute_query("SELECT username FROM users WHERE username = %s", ('admin',),
+                                fetch=True, prepared=True)
+        assert rows == [{'username': 'admin'}]
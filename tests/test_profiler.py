@@ -0,0 +1,87 @@
+# tests/test_profiler.py
+import logging
+from backend import profiler
+from backend.profiler import QueryProfiler, normalize, OVERFLOW
+
+
+def test_normalize_collapses_whitespace_and_lists():
+    assert normalize("""
+        SELECT *   FROM users
+        WHERE user_id IN (%s, %s,%s)
+    """) == "SELECT * FROM users WHERE user_id IN (...)"
+    assert normalize("INSERT INTO t (a, b) VALUES (%s, %s), (%s, %s), (%s, %s)") == \
+        "INSERT INTO t (a, b) VALUES (%s, %s), ..."
+    assert normalize("SELECT 1 WHERE x IN (%s)") == normalize("SELECT 1 WHERE x IN (%s, %s)")
+
+
+def test_statements_are_aggregated_by_normalized_text():
+    query_profiler = QueryProfiler(enabled=True)
+    query_profiler.record("SELECT * FROM t WHERE id IN (%s)", (1,), 0.002, 1)
+    query_profiler.record("SELECT *\n FROM t WHERE id IN (%s, %s)", (1, 2), 0.004, 2)
+    query_profiler.record("DELETE FROM t", None, 0.001, 5)
+    
+    first, second = query_profiler.report(order='total')
+    assert first == {
+        'query': 'SELECT * FROM t WHERE id IN (...)',
+        'calls': 2, 'total_ms': 6.0, 'mean_ms': 3.0, 'max_ms': 4.0,
+        'rows': 3, 'rows_per_call': 1.5, 'slow_calls': 0
+    }
+    assert second['query'] == 'DELETE FROM t'
+    assert [entry['query'] for entry in query_profiler.report(order='max')] == [
+        'SELECT * FROM t WHERE id IN (...)', 'DELETE FROM t'
+    ]
+    assert [entry['query'] for entry in query_profiler.report(order='calls', top=1)] == [
+        'SELECT * FROM t WHERE id IN (...)'
+    ]
+
+
+def test_slow_queries_are_logged_without_parameters(caplog):
+    query_profiler = QueryProfiler(enabled=False, slow_threshold=0.01)
+    with caplog.at_level(logging.WARNING, logger=profiler.__name__):
+        query_profiler.record("SELECT * FROM users WHERE username = %s", ('alice-secret',), 0.02, 1)
+        query_profiler.record("SELECT 1", (), 0.001, 1)
+    
+    assert len(caplog.records) == 1
+    message = caplog.records[0].getMessage()
+    assert 'SELECT * FROM users WHERE username = %s' in message and '1 parameter(s) redacted' in message
+    assert 'alice-secret' not in message
+    # Logging alone does not collect aggregates
+    assert query_profiler.report() == [] and query_profiler.stats()['slow_logged'] == 1
+
+
+def test_statements_beyond_the_limit_share_one_entry():
+    query_profiler = QueryProfiler(enabled=True, max_statements=2)
+    for i in range(5):
+        query_profiler.record(f"SELECT {i}", (), 0.001)
+    
+    entries = {entry['query']: entry['calls'] for entry in query_profiler.report()}
+    assert entries == {'SELECT 0': 1, 'SELECT 1': 1, OVERFLOW: 3}
+
+
+def test_report_explains_the_slowest_run(db):
+    query_profiler = QueryProfiler(enabled=True, explain=True)
+    query = "SELECT username FROM users WHERE username = %s"
+    query_profiler.record(query, ('fast',), 0.001, 0)
+    query_profiler.record(query, ('admin',), 0.005, 1)
+    explained = []
+    
+    def explain(query, params):
+        explained.append(params)
+        return db.explain(query, params)
+    
+    entry, = query_profiler.report(explain=explain)
+    assert explained == [('admin',)]
+    assert entry['plan'] and 'plan_error' not in entry
+
+
+def test_database_calls_are_recorded(db, monkeypatch):
+    query_profiler = QueryProfiler(enabled=True)
+    monkeypatch.setattr('backend.database.query_profiler', query_profiler)
+    
+    db.execute_query("SELECT username FROM users", fetch=True)
+    with db.transaction() as cursor:
+        cursor.execute("UPDATE users SET status = %s WHERE username = %s", ('Active', 'admin'))
+    
+    entries = {entry['query']: entry for entry in query_profiler.report()}
+    assert entries['SELECT username FROM users']['rows'] == 1
+    assert entries['UPDATE users SET status = %s WHERE username = %s']['rows'] == 1
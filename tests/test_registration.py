@@ -0,0 +1,62 @@
+# tests/test_registration.py
+import io
+import os
+from backend.auth import AuthManager
+from backend.database import Database
+from backend.hashing import HashingPoolFull
+from tests.conftest import image_bytes
+
+
+def form(username, photo=None):
+    data = {
+        'fullName': 'Reg Test', 'email': f"{username}@example.com", 'phone': '09171234567',
+        'employmentDate': '2024-01-15', 'username': username, 'role': 'Cashier',
+        'password': 'Secret#123', 'status': 'Active'
+    }
+    if photo is not None:
+        data['photo'] = (io.BytesIO(photo), 'me.png')
+    return data
+
+
+def register(client, data):
+    return client.post('/api/users/register', data=data, content_type='multipart/form-data')
+
+
+def test_register_with_photo(client, db, photos):
+    response = register(client, form('photouser', image_bytes()))
+    assert response.status_code == 201
+    
+    photo_path = db.execute_query("SELECT photo_path FROM users WHERE username = 'photouser'",
+                                  fetch=True)[0]['photo_path']
+    assert os.path.isfile(os.path.join(photos.folder, os.path.basename(photo_path)))
+
+
+def test_duplicate_registration_is_rejected(client, photos):
+    assert register(client, form('twice')).status_code == 201
+    response = register(client, form('twice', image_bytes('blue')))
+    assert response.status_code == 400
+    assert os.listdir(photos.folder) == []
+
+
+def test_busy_hashing_pool_stores_no_photo(client, photos, monkeypatch):
+    def busy(password):
+        raise HashingPoolFull(3)
+    monkeypatch.setattr(AuthManager, 'hash_password', staticmethod(busy))
+    
+    response = register(client, form('busyuser', image_bytes()))
+    assert response.status_code == 503 and response.headers['Retry-After'] == '3'
+    assert os.listdir(photos.folder) == []
+
+
+def test_failed_insert_releases_photo(client, photos, monkeypatch):
+    execute_query = Database.execute_query
+    
+    def failing(query, *args, **kwargs):
+        if 'INSERT INTO users' in query:
+            raise Database.driver().Error('disk I/O error')
+        return execute_query(query, *args, **kwargs)
+    monkeypatch.setattr(Database, 'execute_query', staticmethod(failing))
+    
+    response = register(client, form('ioerror', image_bytes()))
+    assert response.status_code == 500
+    assert os.listdir(photos.folder) == []
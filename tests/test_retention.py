@@ -0,0 +1,39 @@
+# tests/test_retention.py
+from datetime import datetime, timedelta
+from backend.retention import RetentionSweeper
+from tests.conftest import add_user, add_session
+
+
+def test_sweep_deletes_old_rows_in_batches(db):
+    user_id = add_user('sweepme')
+    old = datetime.now() - timedelta(days=3)
+    for i in range(5):
+        session_id = add_session(user_id, f"old-{i}")
+        db.execute_query("UPDATE user_sessions SET last_activity = %s WHERE session_id = %s", (old, session_id))
+    add_session(user_id, 'fresh')
+    db.execute_many(
+        "INSERT INTO login_attempts (username, success, attempt_time) VALUES (%s, %s, %s)",
+        [('sweepme', False, old)] * 3 + [('sweepme', True, datetime.now())]
+    )
+    
+    sweeper = RetentionSweeper(interval=60, batch_size=2, session_retention=86400,
+                               attempt_retention=86400, pause=0)
+    report = sweeper.sweep()
+    
+    assert report['sessions_removed'] == 5 and report['attempts_removed'] == 3
+    assert [row['session_id'] for row in db.execute_query("SELECT session_id FROM user_sessions",
+                                                            fetch=True)] == ['fresh']
+    assert len(db.execute_query("SELECT * FROM login_attempts", fetch=True)) == 1
+
+
+def test_importing_the_app_starts_no_sweeper(monkeypatch):
+    import app
+    from backend.auth import retention_sweeper
+    
+    assert retention_sweeper._thread is None
+    
+    started = []
+    monkeypatch.setattr(app.Config, 'RETENTION_SWEEP_INTERVAL', 300)
+    monkeypatch.setattr(retention_sweeper, 'start', lambda: started.append(True))
+    app.start_background_tasks()
+    assert started == [True]
@@ -0,0 +1,114 @@
+# tests/test_sessions.py
+import time
+from backend import auth
+from backend.cache import TTLCache
+from backend.auth import AuthManager, SESSION_QUERY, session_cache
+from tests.conftest import add_user, add_session
+
+
+def test_ttl_cache_expires_entries():
+    cache = TTLCache(max_size=10, ttl=0.05)
+    cache.set('a', 1)
+    assert cache.get('a') == 1
+    time.sleep(0.06)
+    assert cache.get('a') is None
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(max_size=2, ttl=60)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+    cache.set('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1 and cache.get('c') == 3
+    assert cache.stats()['evictions'] == 1
+
+
+def test_ttl_cache_invalidate_where():
+    cache = TTLCache(max_size=10, ttl=60)
+    cache.set('s1', {'user_id': 'u1'})
+    cache.set('s2', {'user_id': 'u2'})
+    cache.set('s3', {'user_id': 'u1'})
+    assert cache.invalidate_where(lambda key, user: user['user_id'] == 'u1') == 2
+    assert cache.get('s1') is None and cache.get('s2') == {'user_id': 'u2'}
+
+
+def test_ttl_cache_refuses_values_read_before_an_invalidation():
+    cache = TTLCache(max_size=2, ttl=60)
+    
+    before = cache.generation()
+    cache.invalidate('a')
+    assert cache.set('a', 1, since=before) is False and cache.get('a') is None
+    assert cache.set('b', 2, since=before) is True  # other keys are unaffected
+    assert cache.set('a', 1, since=cache.generation()) is True
+    
+    # Forgotten markers and predicate invalidations refuse every older value
+    before = cache.generation()
+    for key in ('x', 'y', 'z'):
+        cache.invalidate(key)
+    assert cache.set('a', 1, since=before) is False
+    before = cache.generation()
+    cache.invalidate_where(lambda key, value: False)
+    assert cache.set('b', 2, since=before) is False
+    assert cache.set('b', 2) is True
+    assert cache.stats()['stale_sets'] == 3
+
+
+def test_logout_during_validation_is_not_undone(client, monkeypatch):
+    session_id = add_session(add_user('alice'))
+    original = auth.Database.execute_query
+    
+    def logout_after_the_read(query, *args, **kwargs):
+        # Interleaving: the session is read as active, then logged out,
+        # then the validation stores what it read
+        result = original(query, *args, **kwargs)
+        if query is SESSION_QUERY:
+            monkeypatch.setattr(auth.Database, 'execute_query', original)
+            AuthManager.logout(session_id)
+        return result
+    
+    monkeypatch.setattr(auth.Database, 'execute_query', logout_after_the_read)
+    assert AuthManager.validate_session(session_id)['username'] == 'alice'
+    
+    assert session_cache.get(session_id) is None
+    assert AuthManager.validate_session(session_id) is None
+
+
+def test_validate_session_is_cached_until_logout(client):
+    session_id = add_session(add_user('alice'))
+    
+    assert AuthManager.validate_session(session_id)['username'] == 'alice'
+    assert session_cache.get(session_id) is not None
+    
+    AuthManager.logout(session_id)
+    assert session_cache.get(session_id) is None
+    assert AuthManager.validate_session(session_id) is None
+
+
+def test_invalidate_user_sessions_drops_cached_sessions(client):
+    user_id = add_user('bob')
+    session_id = add_session(user_id)
+    AuthManager.validate_session(session_id)
+    
+    AuthManager.invalidate_user_sessions(user_id)
+    assert session_cache.get(session_id) is None
+
+
+def test_validate_session_route(client):
+    session_id = add_session(add_user('carol'))
+    
+    response = client.post('/api/validate-session', json={'session_id': session_id})
+    assert response.status_code == 200
+    assert response.get_json()['valid'] is True
+    assert client.post('/api/validate-session', json={'session_id': 'nope'}).get_json()['valid'] is False
+
+
+def test_non_string_session_id_is_invalid_not_an_error(client):
+    for session_id in (['x'], {'a': 1}, 42):
+        response = client.post('/api/validate-session', json={'session_id': session_id})
+        assert response.status_code == 200
+        assert response.get_json() == {'success': True, 'valid': False}
+        
+        response = client.post('/api/logout', json={'session_id': session_id})
+        assert response.status_code == 200
@@ -0,0 +1,88 @@
+# tests/test_uniqueness.py
+import time
+import pytest
+import mysql.connector
+from backend.drivers import MySQLDriver, ER_DUP_ENTRY
+from backend.uniqueness import UniquenessIndex, duplicate_message
+from tests.conftest import add_user
+
+
+def test_free_names_skip_the_database(db):
+    add_user('alice')
+    index = UniquenessIndex(refresh_interval=0)
+    
+    assert index.check('bob', 'bob@example.com') == []
+    stats = index.stats()
+    assert stats['loads'] == 1 and stats['skipped_queries'] == 1 and stats['db_checks'] == 0
+
+
+def test_taken_names_are_confirmed_case_insensitively(db):
+    add_user('alice')
+    index = UniquenessIndex(refresh_interval=0)
+    
+    assert index.check('ALICE', 'someone@example.com') == ['Username already exists']
+    assert index.check('carol', 'Alice@Example.com') == ['Email already registered']
+    assert index.stats()['db_checks'] == 2
+
+
+def test_rows_deleted_elsewhere_are_dropped_from_the_index(db):
+    add_user('alice')
+    index = UniquenessIndex(refresh_interval=0)
+    index.rebuild()
+    db.execute_query("DELETE FROM users WHERE username = 'alice'")
+    
+    assert index.check('alice', 'alice@example.com') == []
+    assert index.check('alice', 'alice@example.com') == []
+    assert index.stats()['db_checks'] == 1
+
+
+def test_add_and_discard_track_local_writes(db):
+    index = UniquenessIndex(refresh_interval=0)
+    index.rebuild()
+    index.add('Dave', 'Dave@example.com')
+    assert index.stats()['usernames'] == index.stats()['emails'] == 2  # admin + dave
+    
+    index.discard('dave', 'dave@example.com')
+    assert index.check('dave', 'dave@example.com') == []
+    assert index.stats()['db_checks'] == 0
+
+
+def test_index_reloads_after_the_refresh_interval(db):
+    index = UniquenessIndex(refresh_interval=0.05)
+    index.check('alice', 'alice@example.com')
+    add_user('alice')
+    assert index.check('alice', 'alice@example.com') == []  # Not seen yet
+    
+    time.sleep(0.06)
+    assert index.check('alice', 'alice@example.com') == ['Username already exists', 'Email already registered']
+    assert index.stats()['loads'] == 2
+
+
+def test_duplicate_message_reports_the_constraint_that_failed(db):
+    add_user('myemail1')
+    insert = """
+        INSERT INTO users (user_id, username, password_hash, full_name, email, phone, role, employment_date)
+        VALUES (%s, %s, 'x', 'Other', %s, '09171234567', 'Cashier', '2024-01-01')
+    """
+    for user_id, username, email, message in (
+        ('USR-other', 'myemail1', 'other@example.com', 'Username already exists'),
+        ('USR-other', 'other', 'myemail1@example.com', 'Email already registered'),
+        ('USR-myemail1', 'other', 'other@example.com', None),  # user_id collision
+    ):
+        with pytest.raises(db.driver().IntegrityError) as error:
+            db.execute_query(insert, (user_id, username, email))
+        assert duplicate_message(error.value) == message
+    
+    assert duplicate_message(ValueError('UNIQUE constraint failed: users.email')) is None
+
+
+@pytest.mark.parametrize('message, key', [
+    ("Duplicate entry 'myemail1' for key 'users.username'", 'username'),
+    ("Duplicate entry 'a@example.com' for key 'email'", 'email'),  # before MySQL 8.0.19
+    ("Duplicate entry 'USR-1' for key 'users.PRIMARY'", 'PRIMARY'),
+    ("Duplicate entry 'x' for key 'users.email'' for key 'users.username'", 'username'),
+])
+def test_mysql_duplicate_key_is_read_from_the_end_of_the_message(message, key):
+    error = mysql.connector.IntegrityError(msg=message, errno=ER_DUP_ENTRY)
+    assert MySQLDriver().duplicate_key(error) == key
+    assert MySQLDriver().duplicate_key(mysql.connector.IntegrityError(msg=message, errno=1452)) is None
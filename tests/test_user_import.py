@@ -0,0 +1,104 @@
+# tests/test_user_import.py
+import io
+import pytest
+from backend.user_import import UserImporter, ImportFileError, read_rows
+from tests.conftest import add_user
+
+
+def user_row(username, email=None, **overrides):
+    return {
+        'full_name': 'Import Test', 'email': email or f"{username}@example.com",
+        'phone': '09171234567', 'username': username, 'role': 'Cashier',
+        'password': 'Secret#123', 'employment_date': '2024-01-15', **overrides
+    }
+
+
+def usernames(db):
+    return {row['username'] for row in db.execute_query("SELECT username FROM users", fetch=True)}
+
+
+def test_imports_valid_rows_in_chunks(client, db):
+    report = UserImporter(chunk_size=2).run([user_row(f"bulk{i}") for i in range(5)])
+    assert report['imported'] == 5 and report['failed'] == 0
+    assert {f"bulk{i}" for i in range(5)} <= usernames(db)
+
+
+def test_reports_invalid_and_duplicate_rows(client, db):
+    add_user('existing')
+    report = UserImporter().run([
+        user_row('fresh1'),
+        user_row('existing', 'other@example.com'),
+        user_row('fresh1', 'second@example.com'),
+        user_row('x', phone='123'),
+    ])
+    
+    errors = {error['row']: error['errors'] for error in report['errors']}
+    assert report['imported'] == 1
+    assert errors[2] == ['Username already exists']
+    assert errors[3] == ['Username is duplicated in the import file']
+    assert set(errors) == {2, 3, 4}
+
+
+def test_rejected_row_does_not_claim_its_email(client, db):
+    add_user('taken')
+    report = UserImporter().run([
+        user_row('taken', 'shared@example.com'),    # rejected: username exists
+        user_row('newcomer', 'shared@example.com'),
+    ])
+    
+    assert report['imported'] == 1
+    assert report['errors'] == [{'row': 1, 'errors': ['Username already exists']}]
+    assert 'newcomer' in usernames(db)
+
+
+def test_read_rows_formats():
+    csv_file = io.BytesIO(b"full_name,email,phone,username,role,password,employment_date\n"
+                          b"A B,a@example.com,09171234567,abcd,Cashier,pw,2024-01-01\n")
+    assert next(read_rows(csv_file, 'csv'))['username'] == 'abcd'
+    
+    rows = list(read_rows(io.BytesIO(b'{"username": "abcd"}\n\n[1]\n'), 'jsonl'))
+    assert rows[0] == {'username': 'abcd'} and '_invalid' in rows[1]
+    
+    with pytest.raises(ImportFileError):
+        next(read_rows(io.BytesIO(b"username\nabcd\n"), 'csv'))
+
+
+CSV_HEADER = b"full_name,email,phone,username,role,password,employment_date\n"
+
+
+def csv_line(username):
+    return f"Import Test,{username}@example.com,09171234567,{username},Cashier,Secret#123,2024-01-15\n".encode()
+
+
+def test_read_rows_reports_the_failing_line():
+    rows = read_rows(io.BytesIO(b'\xef\xbb\xbf' + CSV_HEADER + csv_line('abcd') + b"Jos\xe9,x\n"), 'csv')
+    assert next(rows)['full_name'] == 'Import Test'  # BOM stripped from the header
+    with pytest.raises(ImportFileError, match='Line 3 is not UTF-8'):
+        next(rows)
+    
+    rows = read_rows(io.BytesIO(CSV_HEADER + csv_line('abcd') + b"x" * 200_000 + b"\n"), 'csv')
+    next(rows)
+    with pytest.raises(ImportFileError, match='^Line 3: field larger than field limit'):
+        next(rows)
+
+
+def test_unreadable_line_after_a_chunk_returns_the_partial_report(client, db, monkeypatch):
+    from app_config import Config
+    monkeypatch.setattr(Config, 'IMPORT_CHUNK_SIZE', 2)
+    upload = CSV_HEADER + csv_line('part1') + csv_line('part2') + csv_line('part3') + \
+        b"Jos\xe9 Rizal,jose@example.com,09171234567,jose,Cashier,Secret#123,2024-01-15\n"
+    
+    response = client.post('/api/users/import', data={'file': (io.BytesIO(upload), 'users.csv')})
+    
+    assert response.status_code == 400
+    body = response.get_json()
+    assert body['success'] is False and body['message'] == 'Import stopped: Line 5 is not UTF-8 text'
+    assert body['imported'] == 3 and body['total'] == 3
+    assert body['errors'] == [{'row': 4, 'errors': ['Line 5 is not UTF-8 text']}]
+    assert {'part1', 'part2', 'part3'} <= usernames(db) and 'jose' not in usernames(db)
+
+
+def test_unreadable_header_imports_nothing(client):
+    response = client.post('/api/users/import', data={'file': (io.BytesIO(b"\xff\xfeusername\n"), 'users.csv')})
+    assert response.status_code == 400
+    assert response.get_json() == {'success': False, 'message': 'Line 1 is not UTF-8 text'}
@@ -0,0 +1,63 @@
+# tests/test_validation.py
+import pytest
+from backend.validation import Validator
+
+NAMES = ['  Juan Dela Cruz ', 'J', 'R2-D2', '', None, 'x' * 101, 'Ma. Clara']
+USERNAMES = ['juan_1', 'abc', 'bad name', '', 'a' * 21, 'x!']
+PASSWORDS = ['Secret#123', 'short', 'alllowercase1!', 'NoDigits!!', 'NoSpecial12', '']
+PHONES = ['0917 123 4567', '0917-123-4567', '12345', '', '0917123456x']
+EMAILS = ['juan@example.com', 'not-an-email', '', 'Juan@Example.COM']
+ROLES = ['Cashier', 'Janitor', '']
+DATES = ['2024-01-31', '2024-13-01', '9999-01-01', '', None]
+
+
+@pytest.mark.parametrize('field, validate, column', [
+    ('full_name', Validator.validate_full_name, NAMES),
+    ('username', Validator.validate_username, USERNAMES),
+    ('password', Validator.validate_password, PASSWORDS),
+    ('phone', Validator.validate_phone, PHONES),
+    ('email', Validator.validate_email_address, EMAILS),
+    ('role', Validator.validate_role, ROLES),
+    ('employment_date', Validator.validate_employment_date, DATES),
+])
+def test_batch_agrees_with_the_single_value_validators(field, validate, column):
+    _, errors = Validator.validate_batch({field: column})
+    for row, value in enumerate(column):
+        valid, message = validate(value)
+        if valid:
+            assert row not in errors
+        else:
+            # The single-value validator stops at the first failing rule
+            assert errors[row][field][0] == message
+
+
+def test_batch_reports_every_failing_rule():
+    _, errors = Validator.validate_batch({'password': ['abc'], 'username': ['a!']})
+    assert errors[0]['password'] == [
+        "Password must be at least 8 characters",
+        "Password must contain at least one uppercase letter",
+        "Password must contain at least one number",
+        "Password must contain at least one special character"
+    ]
+    assert len(errors[0]['username']) == 2
+
+
+def test_batch_returns_cleaned_columns():
+    values, errors = Validator.validate_batch({
+        'full_name': ['  Juan Dela Cruz '],
+        'phone': ['0917-123 4567'],
+        'email': ['juan@EXAMPLE.com']
+    })
+    assert errors == {}
+    assert values == {
+        'full_name': ['Juan Dela Cruz'],
+        'phone': ['09171234567'],
+        'email': ['juan@example.com']
+    }
+
+
+def test_batch_rejects_unknown_fields_and_ragged_columns():
+    with pytest.raises(ValueError, match='salary'):
+        Validator.validate_batch({'salary': [1]})
+    with pytest.raises(ValueError, match='same length'):
+        Validator.validate_batch({'username': ['juan_1'], 'role': []})
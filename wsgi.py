@@ -0,0 +1,13 @@
+# wsgi.py
+"""
+WSGI entry point for production servers
+
+Importing app.py only builds the app; the background tasks a serving
+process needs are started here, so flask CLI commands never run them.
+
+Serve with e.g.:
+    gunicorn wsgi:application --bind 0.0.0.0:5000
+"""
+from app import app as application, start_background_tasks
+
+start_background_tasks()